@@ -0,0 +1,78 @@
+"""
+Loading and dumping ``AliasPath`` fields; lookups are compiled to inline
+subscripts (with shared prefixes looked up once), and dumped fields are
+built as a nested ``dict`` literal, rather than walking each path with
+``safe_get`` and assigning into a ``NestedDict``.
+"""
+import logging
+from dataclasses import dataclass
+from timeit import timeit
+from typing import Optional
+
+from dataclass_wizard import AliasPath, asdict, fromdict
+from dataclass_wizard.utils._dict_helper import NestedDict
+from dataclass_wizard.utils._object_path import safe_get
+
+log = logging.getLogger(__name__)
+
+
+@dataclass
+class Event:
+    id: int = AliasPath('data.id')
+    name: str = AliasPath('data.attributes.name')
+    kind: str = AliasPath('data.attributes.kind')
+    score: float = AliasPath('data.attributes.stats.score')
+    count: int = AliasPath('data.attributes.stats.count')
+    owner: str = AliasPath('data.relationships.owner.id')
+    note: Optional[str] = AliasPath('meta.note', default=None)
+
+
+PATHS = {
+    'id': ('data', 'id'),
+    'name': ('data', 'attributes', 'name'),
+    'kind': ('data', 'attributes', 'kind'),
+    'score': ('data', 'attributes', 'stats', 'score'),
+    'count': ('data', 'attributes', 'stats', 'count'),
+    'owner': ('data', 'relationships', 'owner', 'id'),
+}
+
+
+def test_load_and_dump_alias_paths(n):
+    data = {
+        'data': {
+            'id': 123,
+            'attributes': {
+                'name': 'deploy', 'kind': 'job',
+                'stats': {'score': 0.75, 'count': 3},
+            },
+            'relationships': {'owner': {'id': 'u-1'}},
+        },
+        'meta': {'note': 'ok'},
+    }
+    event = fromdict(Event, data)
+
+    assert asdict(event) == data
+
+    def by_safe_get():
+        return Event(*[safe_get(data, p, True) for p in PATHS.values()],
+                     note=safe_get(data, ('meta', 'note'), False))
+
+    def by_nested_dict():
+        paths = NestedDict()
+        for name, p in PATHS.items():
+            node = paths
+            for k in p[:-1]:
+                node = node[k]
+            node[p[-1]] = getattr(event, name)
+        paths['meta']['note'] = event.note
+        return paths
+
+    load_time = timeit(lambda: fromdict(Event, data), number=n)
+    safe_get_time = timeit(by_safe_get, number=n)
+    dump_time = timeit(lambda: asdict(event), number=n)
+    nested_time = timeit(by_nested_dict, number=n)
+
+    log.info('fromdict: %f  safe_get: %f  (%.2fx)',
+             load_time, safe_get_time, safe_get_time / load_time)
+    log.info('asdict: %f  NestedDict: %f  (%.2fx)',
+             dump_time, nested_time, nested_time / dump_time)
@@ -0,0 +1,42 @@
+"""
+Dumping a list of dataclass instances with ``asdict_many``, which inlines
+the dump code for the dataclass in the body of a single loop, vs. calling
+``asdict`` for each instance.
+"""
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime
+from timeit import timeit
+from typing import Optional
+
+from dataclass_wizard import asdict, asdict_many
+
+log = logging.getLogger(__name__)
+
+
+@dataclass
+class Event:
+    id: int
+    name: str
+    kind: str
+    created_at: datetime
+    score: float
+    active: bool = True
+    note: Optional[str] = None
+    tags: list[str] = field(default_factory=list)
+
+
+def test_asdict_many(n):
+    events = [Event(i, f'event-{i}', 'job', datetime(2024, 1, 1, 12, i % 60),
+                    i * 0.5, tags=['a', 'b'])
+              for i in range(100)]
+
+    assert asdict_many(events) == [asdict(e, cls=Event) for e in events]
+
+    n //= 100
+
+    many_time = timeit(lambda: asdict_many(events, Event), number=n)
+    asdict_time = timeit(lambda: [asdict(e, cls=Event) for e in events], number=n)
+
+    log.info('asdict_many: %f  [asdict(o) for o in ...]: %f  (%.2fx)',
+             many_time, asdict_time, asdict_time / many_time)
@@ -0,0 +1,46 @@
+"""
+Loading events which repeat the same timestamps and dates, with and
+without ``datetime_parse_cache_size``.
+"""
+import logging
+from dataclasses import make_dataclass
+from datetime import date, datetime
+from timeit import timeit
+
+from dataclass_wizard import LoadMeta, fromlist
+from dataclass_wizard.codegen import datetime_parse_cache_info
+
+log = logging.getLogger(__name__)
+
+FIELDS = [('event_id', int), ('batch_ts', datetime), ('day', date),
+          ('created_at', datetime)]
+
+
+def test_load_repeated_datetimes(n):
+    default = make_dataclass('Default', FIELDS)
+    cached = make_dataclass('Cached', FIELDS)
+
+    LoadMeta(datetime_parse_cache_size=256).bind_to(cached)
+
+    # 1,000 events in 10 batches, each with 50 distinct creation times
+    data = [{'event_id': i,
+             'batch_ts': f'2024-05-06T07:{i // 100:02d}:00Z',
+             'day': '2024-05-06',
+             'created_at': f'2024-05-06T07:08:{i % 50:02d}.123456+00:00'}
+            for i in range(1000)]
+
+    assert fromlist(default, data) == [default(*vars(e).values())
+                                       for e in fromlist(cached, data)]
+
+    n //= 1000
+
+    default_time = timeit(lambda: fromlist(default, data), number=n)
+    cached_time = timeit(lambda: fromlist(cached, data), number=n)
+
+    info = datetime_parse_cache_info(cached)[datetime]
+    hit_rate = info['hits'] / (info['hits'] + info['misses'])
+
+    log.info('default: %f  datetime_parse_cache_size: %f  (%.2fx)  '
+             'datetime hit rate: %.1f%%',
+             default_time, cached_time, default_time / cached_time,
+             hit_rate * 100)
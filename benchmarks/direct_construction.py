@@ -0,0 +1,50 @@
+"""
+Loading frozen, slotted and defaulted dataclasses, with and without
+``direct_construction``; with it, default values are set inline, and a
+frozen dataclass is created with ``object.__new__`` and its fields are set
+directly, rather than through ``__init__``.
+"""
+import logging
+from dataclasses import astuple, field, make_dataclass
+from timeit import timeit
+
+import pytest
+
+from dataclass_wizard import LoadMeta, fromdict
+
+log = logging.getLogger(__name__)
+
+FIELDS = [
+    ('user_id', int),
+    ('first_name', str),
+    ('last_name', str),
+    ('email', str),
+    ('is_active', bool, field(default=True)),
+    ('login_count', int, field(default=0)),
+    ('tags', list[str], field(default_factory=list)),
+    ('nickname', 'str | None', field(default=None)),
+]
+
+DATA = {'user_id': 1, 'first_name': 'John', 'last_name': 'Doe',
+        'email': 'john@example.com', 'login_count': 7}
+
+
+@pytest.mark.parametrize('dc_kwargs', [
+    {},
+    {'frozen': True},
+    {'slots': True},
+    {'frozen': True, 'slots': True},
+], ids=['plain', 'frozen', 'slots', 'frozen-slots'])
+def test_load_direct_construction(dc_kwargs, n):
+    default = make_dataclass('Default', FIELDS, **dc_kwargs)
+    direct = make_dataclass('Direct', FIELDS, **dc_kwargs)
+
+    LoadMeta(direct_construction=True).bind_to(direct)
+
+    assert astuple(fromdict(default, DATA)) == astuple(fromdict(direct, DATA))
+
+    default_time = timeit(lambda: fromdict(default, DATA), number=n)
+    direct_time = timeit(lambda: fromdict(direct, DATA), number=n)
+
+    log.info('%s  __init__: %f  direct_construction: %f  (%.2fx)', dc_kwargs,
+             default_time, direct_time, default_time / direct_time)
@@ -0,0 +1,72 @@
+"""
+Loading and dumping ``Enum`` members; values are looked up in the enum's
+``_value2member_map_`` (rather than calling the enum class), and members
+are dumped from ``_value_`` (rather than the ``value`` property).
+"""
+import enum
+import logging
+from dataclasses import dataclass
+from timeit import timeit
+
+from dataclass_wizard import asdict, fromdict
+
+log = logging.getLogger(__name__)
+
+
+class Status(enum.Enum):
+    PENDING = 'pending'
+    RUNNING = 'running'
+    DONE = 'done'
+    FAILED = 'failed'
+
+
+class Level(enum.IntEnum):
+    LOW = 1
+    MEDIUM = 2
+    HIGH = 3
+
+
+class Perm(enum.IntFlag):
+    R = 4
+    W = 2
+    X = 1
+
+
+@dataclass
+class Job:
+    statuses: list[Status]
+    levels: list[Level]
+    perms: list[Perm]
+
+
+def test_load_and_dump_enums(n):
+    data = {
+        'statuses': [s.value for s in Status] * 25,
+        'levels': [lvl.value for lvl in Level] * 25,
+        'perms': [4, 6, 7, 5] * 25,
+    }
+    job = fromdict(Job, data)
+
+    assert asdict(job) == data
+
+    def by_constructor():
+        return Job([Status(v) for v in data['statuses']],
+                   [Level(v) for v in data['levels']],
+                   [Perm(v) for v in data['perms']])
+
+    def by_value_property():
+        return {'statuses': [s.value for s in job.statuses],
+                'levels': [lvl.value for lvl in job.levels],
+                'perms': [p.value for p in job.perms]}
+
+    n //= 10
+
+    load_time = timeit(lambda: fromdict(Job, data), number=n)
+    ctor_time = timeit(by_constructor, number=n)
+    dump_time = timeit(lambda: asdict(job), number=n)
+    prop_time = timeit(by_value_property, number=n)
+
+    log.info('fromdict: %f  EnumCls(v): %f  (%.2fx)',
+             load_time, ctor_time, ctor_time / load_time)
+    log.info('asdict: %f  member.value: %f  (%.2fx)',
+             dump_time, prop_time, prop_time / dump_time)
@@ -0,0 +1,83 @@
+"""
+Loading a list of dicts with the fused `__dataclass_wizard_from_list__`
+function, compared with calling the load function once per item.
+"""
+import logging
+from dataclasses import dataclass, field
+from timeit import timeit
+from typing import Optional
+
+import pytest
+
+from dataclass_wizard import JSONWizard, fromdict, fromlist
+
+log = logging.getLogger(__name__)
+
+LIST_SIZES = (10, 100, 1_000)
+
+
+@dataclass
+class Simple(JSONWizard):
+    my_str: str
+    my_int: int
+    my_bool: Optional[bool]
+
+
+@dataclass
+class Address:
+    street: str
+    city: str
+    zip_code: int
+
+
+@dataclass
+class User(JSONWizard):
+    id: int
+    name: str
+    email: Optional[str]
+    addresses: list[Address] = field(default_factory=list)
+    tags: list[str] = field(default_factory=list)
+
+
+@pytest.fixture(scope='session')
+def simple_data():
+    return {'my_str': 'hello world!', 'my_int': 21, 'my_bool': True}
+
+
+@pytest.fixture(scope='session')
+def user_data():
+    return {
+        'id': '123',
+        'name': 'John Doe',
+        'email': None,
+        'addresses': [
+            {'street': '123 Main St', 'city': 'Springfield', 'zip_code': '12345'},
+        ],
+        'tags': ['a', 'b', 'c'],
+    }
+
+
+def _compare(cls, item, n):
+    fromdict(cls, item)
+    # the previous approach: a call to the load function per item
+    load = cls.__dataclass_wizard_from_dict__
+
+    for size in LIST_SIZES:
+        data = [item] * size
+        number = max(n // size, 1)
+
+        assert fromlist(cls, data) == [load(d) for d in data]
+
+        per_item = timeit(lambda: [load(d) for d in data], number=number)
+        fused = timeit(lambda: fromlist(cls, data), number=number)
+
+        log.info('%s[%d] per-item: %f  fused: %f  (%.2fx)',
+                 cls.__name__, size, per_item, fused, per_item / fused)
+
+
+def test_load_simple_list(simple_data, n):
+    _compare(Simple, simple_data, n)
+
+
+def test_load_nested_list(user_data, n):
+    _compare(User, user_data, n)
@@ -0,0 +1,53 @@
+"""
+Loading input in a single key casing with ``load_case='AUTO'``, with and
+without ``load_case_learn_after``; once the casing is learned, each field is
+looked up by a single key, rather than by each of the possible keys in turn.
+"""
+import logging
+from dataclasses import astuple, make_dataclass
+from timeit import timeit
+
+import pytest
+
+from dataclass_wizard import LoadMeta, fromdict
+from dataclass_wizard.codegen import key_case_info
+from dataclass_wizard.utils._string_case import to_camel_case, to_lisp_case
+
+log = logging.getLogger(__name__)
+
+FIELDS = [
+    ('user_id', int),
+    ('first_name', str),
+    ('last_name', str),
+    ('email_address', str),
+    ('phone_number', str),
+    ('is_active', bool),
+    ('created_at_ts', int),
+    ('login_count', int),
+]
+
+VALUES = [1, 'John', 'Doe', 'john@example.com', '555-0100', True,
+          1700000000, 7]
+
+
+@pytest.mark.parametrize('to_key', [to_camel_case, to_lisp_case])
+def test_load_auto_key_case(to_key, n):
+    auto = make_dataclass('Auto', FIELDS)
+    learned = make_dataclass('Learned', FIELDS)
+
+    LoadMeta(load_case='AUTO').bind_to(auto)
+    LoadMeta(load_case='AUTO', load_case_learn_after=100).bind_to(learned)
+
+    data = {to_key(name): value for (name, _), value in zip(FIELDS, VALUES)}
+
+    assert astuple(fromdict(auto, data)) == astuple(fromdict(learned, data))
+
+    # warm up, so the casing is learned
+    for _ in range(100):
+        fromdict(learned, data)
+
+    auto_time = timeit(lambda: fromdict(auto, data), number=n)
+    learned_time = timeit(lambda: fromdict(learned, data), number=n)
+
+    log.info('%s  AUTO: %f  learned: %f  (%.2fx)', key_case_info(learned),
+             auto_time, learned_time, auto_time / learned_time)
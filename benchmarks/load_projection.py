@@ -0,0 +1,78 @@
+"""
+Loading only some of the fields of a dataclass, with a load function
+specialized (and cached) for ``fromdict(cls, d, only=...)``, vs. loading
+all of the fields with ``fromdict(cls, d)``.
+"""
+import logging
+from dataclasses import dataclass
+from timeit import timeit
+from typing import Optional
+
+from dataclass_wizard import fromdict
+
+log = logging.getLogger(__name__)
+
+
+@dataclass
+class Address:
+    street: str
+    city: str
+    zip_code: Optional[str] = None
+
+
+@dataclass
+class User:
+    id: int
+    name: str
+    email: str
+    address: Address
+    followers: int
+    following: int
+    bio: Optional[str] = None
+    website: Optional[str] = None
+
+
+@dataclass
+class Repo:
+    id: int
+    name: str
+    full_name: str
+    description: str
+    owner: User
+    contributors: list[User]
+    stars: int
+    forks: int
+    open_issues: int
+    topics: list[str]
+    homepage: Optional[str] = None
+
+
+def user(i):
+    return {
+        'id': i, 'name': f'user-{i}', 'email': f'user-{i}@example.org',
+        'address': {'street': f'{i} Main St.', 'city': 'Springfield', 'zip_code': '12345'},
+        'followers': i * 10, 'following': i, 'bio': 'Hello', 'website': None,
+    }
+
+
+def test_load_projection(n):
+    data = {
+        'id': 1, 'name': 'repo', 'full_name': 'user-0/repo',
+        'description': 'A repository', 'owner': user(0),
+        'contributors': [user(i) for i in range(10)],
+        'stars': 100, 'forks': 20, 'open_issues': 3,
+        'topics': ['python', 'json'], 'homepage': None,
+    }
+    only = {'id', 'name', 'owner.name', 'contributors.id'}
+
+    repo = fromdict(Repo, data, only=only)
+    assert repo.owner.name == 'user-0'
+    assert [c.id for c in repo.contributors] == list(range(10))
+
+    n //= 10
+
+    only_time = timeit(lambda: fromdict(Repo, data, only=only), number=n)
+    full_time = timeit(lambda: fromdict(Repo, data), number=n)
+
+    log.info('fromdict(only=...): %f  fromdict: %f  (%.2fx)',
+             only_time, full_time, full_time / only_time)
@@ -0,0 +1,137 @@
+"""
+Loading and dumping a large list of `complex.py`-style objects in parallel,
+with `fromlist_parallel`, `fromjsonl_parallel` and `asdict_many_parallel`.
+
+The speedup depends on the number of (physical) CPU cores. With processes,
+the results -- and for dumping, the instances -- are pickled between
+processes, which caps the gain; the cost of the round trip is logged too.
+
+Set ``PARALLEL_BENCH_SIZE`` to change the number of elements (for example,
+to ``1000000``); the default is `n`.
+"""
+import io
+import json
+import logging
+import os
+import pickle
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import datetime
+from time import perf_counter
+from typing import Any, Optional, Union
+
+import pytest
+
+from dataclass_wizard import fromlist
+from dataclass_wizard.parallel import (
+    _new_executor, asdict_many_parallel, fromjsonl_parallel, fromlist_parallel,
+)
+
+log = logging.getLogger(__name__)
+
+WORKER_COUNTS = (1, 2, 4, 8)
+
+
+@dataclass
+class Name:
+    first: str
+    last: str
+    salutation: Optional[str] = 'Mr.'
+
+
+@dataclass
+class Person:
+    name: Name
+    age: int
+    birthdate: datetime
+    gender: str
+    occupation: Union[str, list[str]]
+    hobbies: dict[str, list[str]] = field(
+        default_factory=lambda: defaultdict(list))
+
+
+@dataclass
+class MyClass:
+    my_ledger: dict[str, Any]
+    the_answer_to_life: Optional[int]
+    people: list[Person]
+    is_enabled: bool = True
+
+
+@pytest.fixture(scope='session')
+def data(n):
+    size = int(os.getenv('PARALLEL_BENCH_SIZE', n))
+
+    item = {
+        'my_ledger': {'Day 1': 'some details', 'Day 17': ['a', 'sample', 'list']},
+        'the_answer_to_life': '42',
+        'people': [
+            {'name': {'first': 'Roberto', 'last': 'Fuirron'},
+             'age': 21, 'birthdate': '1950-02-28T17:35:20Z',
+             'gender': 'M', 'occupation': ['sailor', 'fisher'],
+             'hobbies': {'M-F': ('chess', '123', 'reading'), 'Sat-Sun': ['parasailing']}},
+            {'name': {'first': 'Janice', 'last': 'Darr', 'salutation': 'Dr.'},
+             'age': 45, 'birthdate': '1971-11-05 05:10:59',
+             'gender': 'F', 'occupation': 'Dentist'},
+        ],
+    }
+
+    return [item] * size
+
+
+def _time(fn):
+    start = perf_counter()
+    result = fn()
+    return perf_counter() - start, result
+
+
+def test_load_parallel(data):
+    log.info('%d elements, %d CPUs', len(data), os.cpu_count())
+
+    baseline, expected = _time(lambda: fromlist(MyClass, data))
+    log.info('fromlist            %8.3fs', baseline)
+
+    elapsed, _ = _time(lambda: pickle.loads(pickle.dumps(expected)))
+    log.info('pickle round trip   %8.3fs', elapsed)
+
+    for workers in WORKER_COUNTS:
+        # exclude the time to start the workers
+        with _new_executor(workers, MyClass, True, False) as pool:
+            elapsed, result = _time(lambda: fromlist_parallel(
+                MyClass, data, workers=workers, executor=pool))
+
+        assert result == expected
+        log.info('%d worker(s)         %8.3fs  (%.2fx)',
+                 workers, elapsed, baseline / elapsed)
+
+
+def test_dump_parallel(data):
+    instances = fromlist(MyClass, data)
+
+    baseline, _ = _time(lambda: asdict_many_parallel(instances, workers=1))
+    log.info('in process          %8.3fs', baseline)
+
+    for workers in WORKER_COUNTS:
+        with _new_executor(workers, MyClass, False, True) as pool:
+            elapsed, _ = _time(lambda: asdict_many_parallel(
+                instances, workers=workers, executor=pool))
+
+        log.info('%d worker(s)         %8.3fs  (%.2fx)',
+                 workers, elapsed, baseline / elapsed)
+
+
+def test_load_jsonl_parallel(data):
+    text = '\n'.join(map(json.dumps, data))
+
+    baseline, expected = _time(
+        lambda: fromlist(MyClass, list(map(json.loads, io.StringIO(text)))))
+    log.info('sequential          %8.3fs', baseline)
+
+    for workers in WORKER_COUNTS:
+        with _new_executor(workers, MyClass, True, False) as pool:
+            elapsed, result = _time(lambda: fromjsonl_parallel(
+                MyClass, io.StringIO(text), workers=workers, executor=pool))
+
+        assert result == expected
+        log.info('%d worker(s)         %8.3fs  (%.2fx)',
+                 workers, elapsed, baseline / elapsed)
@@ -0,0 +1,46 @@
+"""
+Loading dates and datetimes with custom patterns (`DatePattern` and
+`DateTimePattern`); numeric formats are parsed with a precompiled regex,
+rather than with `datetime.strptime`.
+"""
+import logging
+from dataclasses import dataclass
+from datetime import datetime
+from timeit import timeit
+
+from dataclass_wizard import fromdict
+from dataclass_wizard.patterns import DatePattern, DateTimePattern
+
+log = logging.getLogger(__name__)
+
+
+@dataclass
+class Event:
+    day: DatePattern['%m/%d/%Y']
+    # the first pattern never matches, so the second one is always used
+    created: DateTimePattern['%d.%m.%Y %H:%M', '%Y%m%d %H%M%S.%f']
+
+
+def test_load_patterns(n):
+    data = {'day': '12/31/2021', 'created': '20211231 235959.123456'}
+
+    event = fromdict(Event, data)
+    assert event.created == datetime(2021, 12, 31, 23, 59, 59, 123456)
+
+    def by_strptime():
+        day = datetime.strptime(data['day'], '%m/%d/%Y').date()
+        try:
+            created = datetime.strptime(data['created'], '%d.%m.%Y %H:%M')
+        except ValueError:
+            created = datetime.strptime(data['created'], '%Y%m%d %H%M%S.%f')
+        return Event(day, created)
+
+    assert by_strptime() == event
+
+    n //= 10
+
+    load_time = timeit(lambda: fromdict(Event, data), number=n)
+    strptime_time = timeit(by_strptime, number=n)
+
+    log.info('fromdict: %f  strptime: %f  (%.2fx)',
+             load_time, strptime_time, strptime_time / load_time)
@@ -0,0 +1,57 @@
+"""
+Dumping with ``exclude``, which uses a dump function compiled (and cached)
+for the projection, so excluded fields are never serialized, vs. dumping
+all fields and then removing the excluded keys.
+"""
+import logging
+from dataclasses import dataclass
+from timeit import timeit
+
+from dataclass_wizard import asdict
+
+log = logging.getLogger(__name__)
+
+
+@dataclass
+class Reading:
+    sensor: str
+    value: float
+    ok: bool
+
+
+@dataclass
+class Owner:
+    name: str
+    readings: list[Reading]
+
+
+@dataclass
+class Device:
+    id: int
+    name: str
+    owner: Owner
+    readings: list[Reading]
+
+
+def test_dump_with_exclude(n):
+    readings = [Reading(f's{i}', i * 0.5, i % 2 == 0) for i in range(50)]
+    device = Device(1, 'dev', Owner('Jane', readings), readings)
+
+    exclude = ('readings', 'owner.readings')
+
+    assert asdict(device, exclude=exclude) == {'id': 1, 'name': 'dev',
+                                               'owner': {'name': 'Jane'}}
+
+    def dump_then_pop():
+        d = asdict(device)
+        d.pop('readings')
+        d['owner'].pop('readings')
+        return d
+
+    n //= 10
+
+    exclude_time = timeit(lambda: asdict(device, exclude=exclude), number=n)
+    pop_time = timeit(dump_then_pop, number=n)
+
+    log.info('asdict(exclude=...): %f  asdict + pop: %f  (%.2fx)',
+             exclude_time, pop_time, pop_time / exclude_time)
@@ -0,0 +1,66 @@
+"""
+Writing a large sequence of dataclass instances as a JSON array with
+``dump_iter_json``, which consumes a generator and writes the output
+incrementally, vs. ``json.dump`` of the full list of dictionaries.
+"""
+import json
+import logging
+import os
+import tracemalloc
+from dataclasses import dataclass
+from datetime import datetime
+from timeit import timeit
+from typing import Optional
+
+from dataclass_wizard import asdict
+from dataclass_wizard.stream import dump_iter_json
+
+log = logging.getLogger(__name__)
+
+
+@dataclass
+class Row:
+    id: int
+    name: str
+    created_at: datetime
+    score: float
+    active: bool
+    note: Optional[str] = None
+
+
+def rows(count):
+    # e.g. the rows of a database cursor
+    for i in range(count):
+        yield Row(i, f'row-{i}', datetime(2024, 1, 1, i % 24), i * 0.5, i % 2 == 0)
+
+
+def peak_memory(fn):
+    tracemalloc.start()
+    try:
+        fn()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def test_dump_iter_json(n):
+    count = n // 10
+
+    with open(os.devnull, 'w') as out_file:
+
+        def stream():
+            dump_iter_json(rows(count), out_file, Row)
+
+        def full():
+            json.dump([asdict(o) for o in rows(count)], out_file)
+
+        stream_time = timeit(stream, number=1)
+        full_time = timeit(full, number=1)
+
+        stream_peak = peak_memory(stream)
+        full_peak = peak_memory(full)
+
+    log.info('dump_iter_json: %f  json.dump(list): %f  (%.2fx)',
+             stream_time, full_time, full_time / stream_time)
+    log.info('peak memory -- dump_iter_json: %d KiB  json.dump(list): %d KiB  (%.2fx)',
+             stream_peak // 1024, full_peak // 1024, full_peak / stream_peak)
@@ -0,0 +1,127 @@
+"""
+Load and dump throughput across threads, including the "burst" of first
+use for a class (where only one thread should generate code).
+
+On a free-threaded (no-GIL) build of CPython, throughput is expected to
+scale with the number of threads; with the GIL, it should stay flat.
+"""
+import logging
+import sys
+import sysconfig
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, make_dataclass
+from datetime import datetime
+from threading import Barrier
+from time import perf_counter
+from typing import Optional
+
+import pytest
+
+from dataclass_wizard import JSONWizard, _loaders, asdict, fromdict
+
+log = logging.getLogger(__name__)
+
+THREAD_COUNTS = (1, 2, 4, 8)
+
+
+@dataclass
+class Address:
+    street: str
+    city: str
+    zip_code: int
+
+
+@dataclass
+class User(JSONWizard):
+    id: int
+    name: str
+    email: Optional[str]
+    created_at: datetime
+    addresses: list[Address] = field(default_factory=list)
+    tags: list[str] = field(default_factory=list)
+
+
+@pytest.fixture(scope='session')
+def data():
+    return {
+        'id': '123',
+        'name': 'John Doe',
+        'email': None,
+        'created_at': '2024-01-01T12:30:00Z',
+        'addresses': [
+            {'street': '123 Main St', 'city': 'Springfield', 'zip_code': '12345'},
+            {'street': '456 Side St', 'city': 'Shelbyville', 'zip_code': 67890},
+        ],
+        'tags': ['a', 'b', 'c'],
+    }
+
+
+def _run_threads(fn, n, num_threads):
+    per_thread = n // num_threads
+    barrier = Barrier(num_threads)
+
+    def worker():
+        barrier.wait()
+        for _ in range(per_thread):
+            fn()
+
+    with ThreadPoolExecutor(num_threads) as pool:
+        start = perf_counter()
+        for f in [pool.submit(worker) for _ in range(num_threads)]:
+            f.result()
+        return per_thread * num_threads / (perf_counter() - start)
+
+
+def _log_build():
+    gil = getattr(sys, '_is_gil_enabled', lambda: True)()
+    log.info('Python %s, free-threaded build: %s, GIL enabled: %s',
+             sys.version.split(' ', 1)[0],
+             bool(sysconfig.get_config_var('Py_GIL_DISABLED')), gil)
+
+
+def test_load_threads(data, n):
+    _log_build()
+    User.from_dict(data)
+
+    for num_threads in THREAD_COUNTS:
+        log.info('load  %d thread(s)   %12.0f ops/s', num_threads,
+                 _run_threads(lambda: User.from_dict(data), n, num_threads))
+
+
+def test_dump_threads(data, n):
+    _log_build()
+    user = User.from_dict(data)
+
+    for num_threads in THREAD_COUNTS:
+        log.info('dump  %d thread(s)   %12.0f ops/s', num_threads,
+                 _run_threads(lambda: user.to_dict(), n, num_threads))
+
+
+def test_first_use_burst(data, mocker):
+    """Only one thread should generate code for a class on first use."""
+    spy = mocker.spy(_loaders, 'load_func_for_dataclass')
+    num_threads = max(THREAD_COUNTS)
+    num_classes = 50
+
+    classes = [make_dataclass(f'User{i}', [(f.name, f.type, f) for f in
+                                           User.__dataclass_fields__.values()])
+               for i in range(num_classes)]
+
+    start = perf_counter()
+    for cls in classes:
+        barrier = Barrier(num_threads)
+
+        def worker(cls=cls, barrier=barrier):
+            barrier.wait()
+            return asdict(fromdict(cls, data))
+
+        with ThreadPoolExecutor(num_threads) as pool:
+            results = [f.result() for f in
+                       [pool.submit(worker) for _ in range(num_threads)]]
+        assert all(r == results[0] for r in results)
+
+    log.info('first use of %d classes from %d threads: %f',
+             num_classes, num_threads, perf_counter() - start)
+
+    # calls for the main class only (nested classes also pass `extras`)
+    assert sum(len(c.args) == 1 for c in spy.call_args_list) == num_classes
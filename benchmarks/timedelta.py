@@ -0,0 +1,54 @@
+"""
+Loading ``timedelta`` fields from duration strings, which are parsed with
+a built-in (cached) parser, and dumping them with ``dump_timedelta_as``.
+"""
+import logging
+from dataclasses import dataclass, make_dataclass
+from datetime import timedelta
+from timeit import timeit
+
+import pytest
+
+from dataclass_wizard import DumpMeta, asdict, fromdict
+from dataclass_wizard._type_conv import parse_duration
+
+log = logging.getLogger(__name__)
+
+
+@dataclass
+class Job:
+    timeout: timedelta
+    retry_after: timedelta
+    ttl: timedelta
+
+
+DATA = {'timeout': '1h 30m', 'retry_after': 'PT45S', 'ttl': '2 days, 0:00:00'}
+
+
+def test_load_durations(n):
+    job = fromdict(Job, DATA)
+    assert job.timeout == timedelta(hours=1, minutes=30)
+
+    parse_duration.cache_clear()
+
+    load_time = timeit(lambda: fromdict(Job, DATA), number=n)
+    info = parse_duration.cache_info()
+
+    log.info('fromdict: %f  (cache hits: %d, misses: %d)',
+             load_time, info.hits, info.misses)
+
+
+@pytest.mark.parametrize('dump_as', ['STR', 'ISO', 'COMPACT'])
+def test_dump_durations(dump_as, n):
+    cls = make_dataclass('Job', [('timeout', timedelta),
+                                 ('retry_after', timedelta),
+                                 ('ttl', timedelta)])
+    DumpMeta(dump_timedelta_as=dump_as).bind_to(cls)
+
+    job = fromdict(cls, DATA)
+    d = asdict(job)
+    assert fromdict(cls, d) == job
+
+    dump_time = timeit(lambda: asdict(job), number=n)
+
+    log.info('%s: %r  asdict: %f', dump_as, d, dump_time)
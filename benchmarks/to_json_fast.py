@@ -0,0 +1,71 @@
+"""
+Encoding dataclass instances with ``to_json(fast=True)``, which generates
+the JSON text directly, vs. ``json.dumps(asdict(o))``, which first builds
+the (nested) ``dict`` objects.
+"""
+import json
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime
+from timeit import timeit
+from typing import Optional
+
+from dataclass_wizard import JSONWizard, asdict
+
+log = logging.getLogger(__name__)
+
+
+@dataclass
+class Address:
+    street: str
+    city: str
+    zip_code: Optional[str] = None
+
+
+@dataclass
+class Item:
+    sku: str
+    quantity: int
+    price: float
+    gift: bool = False
+
+
+@dataclass
+class Order(JSONWizard):
+    id: int
+    customer: str
+    created_at: datetime
+    shipping: Address
+    items: list[Item]
+    notes: Optional[str] = None
+    tags: list[str] = field(default_factory=list)
+
+
+def test_to_json_fast(n):
+    order = Order(
+        id=123,
+        customer='Jane "JD" Doe',
+        created_at=datetime(2024, 5, 17, 12, 30),
+        shipping=Address('1 Main St.', 'Springfield', '12345'),
+        items=[Item(f'SKU-{i}', i, i * 1.25, i % 2 == 0) for i in range(10)],
+        tags=['priority', 'gift'],
+    )
+
+    assert order.to_json(fast=True) == json.dumps(asdict(order))
+
+    n //= 10
+
+    fast_time = timeit(lambda: order.to_json(fast=True), number=n)
+    dumps_time = timeit(lambda: json.dumps(asdict(order)), number=n)
+
+    log.info('to_json(fast=True): %f  json.dumps(asdict): %f  (%.2fx)',
+             fast_time, dumps_time, dumps_time / fast_time)
+
+    orders = [order] * 100
+    n //= 100
+
+    fast_time = timeit(lambda: Order.list_to_json(orders, fast=True), number=n)
+    dumps_time = timeit(lambda: Order.list_to_json(orders), number=n)
+
+    log.info('list_to_json(fast=True): %f  list_to_json: %f  (%.2fx)',
+             fast_time, dumps_time, dumps_time / fast_time)
@@ -0,0 +1,59 @@
+"""
+Loading input which already has the annotated types, with and without
+``trusted_input``; with it, leaf values and lists / dicts of them are
+loaded as-is, rather than converted or rebuilt.
+"""
+import logging
+from dataclasses import astuple, make_dataclass
+from timeit import timeit
+
+import pytest
+
+from dataclass_wizard import LoadMeta, fromdict
+
+log = logging.getLogger(__name__)
+
+LEAF_FIELDS = [
+    ('user_id', int),
+    ('first_name', str),
+    ('last_name', str),
+    ('email', str),
+    ('score', float),
+    ('is_active', bool),
+    ('login_count', int),
+    ('nickname', 'str | None'),
+]
+
+LEAF_VALUES = [1, 'John', 'Doe', 'john@example.com', 9.5, True, 7, None]
+
+CONTAINER_FIELDS = [
+    ('ids', list[int]),
+    ('tags', list[str]),
+    ('scores', dict[str, float]),
+    ('roles', set[str]),
+]
+
+CONTAINER_VALUES = [list(range(50)), [f'tag{i}' for i in range(20)],
+                    {f'k{i}': i / 2 for i in range(20)}, ['admin', 'user']]
+
+
+@pytest.mark.parametrize('fields,values', [
+    (LEAF_FIELDS, LEAF_VALUES),
+    (CONTAINER_FIELDS, CONTAINER_VALUES),
+], ids=['leaf', 'containers'])
+def test_load_trusted_input(fields, values, n):
+    default = make_dataclass('Default', fields)
+    trusted = make_dataclass('Trusted', fields)
+
+    LoadMeta(trusted_input=True).bind_to(trusted)
+
+    data = {name: value for (name, _), value in zip(fields, values)}
+
+    assert astuple(fromdict(default, data)) == astuple(fromdict(trusted, data))
+
+    default_time = timeit(lambda: fromdict(default, data), number=n)
+    trusted_time = timeit(lambda: fromdict(trusted, data), number=n)
+    bare_time = timeit(lambda: trusted(**data), number=n)
+
+    log.info('default: %f  trusted_input: %f  (%.2fx)  cls(**o): %f',
+             default_time, trusted_time, default_time / trusted_time, bare_time)
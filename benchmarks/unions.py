@@ -0,0 +1,96 @@
+"""
+Loading and dumping a `Union` of many tagged dataclasses; the load and dump
+functions for each member are looked up by tag (or type), so the cost per
+record should stay flat regardless of the position of the member in the
+`Union`, or the number of members.
+"""
+import logging
+from dataclasses import dataclass, make_dataclass
+from timeit import timeit
+from typing import Union
+
+import pytest
+
+from dataclass_wizard import DumpMeta, LoadMeta, asdict, fromdict
+from dataclass_wizard.constants import TAG
+
+log = logging.getLogger(__name__)
+
+UNION_SIZES = (10, 50, 200)
+
+
+def _container_for(size):
+    members = [make_dataclass(f'Item{i}', [('value', int), ('name', str)])
+               for i in range(size)]
+
+    for i, tp in enumerate(members):
+        LoadMeta(tag=f'item-{i}').bind_to(tp)
+        DumpMeta(tag=f'item-{i}').bind_to(tp)
+
+    @dataclass
+    class Container:
+        item: Union[tuple(members)]
+
+    return Container, members
+
+
+@pytest.mark.parametrize('size', UNION_SIZES)
+def test_load_wide_union(size, n):
+    Container, members = _container_for(size)
+
+    for i in (0, size // 2, size - 1):
+        d = {'item': {TAG: f'item-{i}', 'value': 1, 'name': 'test'}}
+        assert fromdict(Container, d).item == members[i](1, 'test')
+
+        elapsed = timeit(lambda: fromdict(Container, d), number=n)
+        log.info('load:  %3d members, member %3d: %f', size, i, elapsed)
+
+
+@pytest.mark.parametrize('size', UNION_SIZES)
+def test_dump_wide_union(size, n):
+    Container, members = _container_for(size)
+
+    for i in (0, size // 2, size - 1):
+        c = Container(members[i](1, 'test'))
+        assert asdict(c)['item'][TAG] == f'item-{i}'
+
+        elapsed = timeit(lambda: asdict(c), number=n)
+        log.info('dump:  %3d members, member %3d: %f', size, i, elapsed)
+
+
+@dataclass
+class Circle:
+    radius: float
+    color: str
+
+
+@dataclass
+class Square:
+    side: float
+    color: str
+
+
+@dataclass
+class Triangle:
+    base: float
+    height: float
+    color: str
+
+
+@dataclass
+class Drawing:
+    shape: Union[Circle, Square, Triangle]
+
+
+def test_load_untagged_union(n):
+    # no tags: the dataclass is picked by the keys in the object
+    LoadMeta(unsafe_parse_dataclass_in_union=True).bind_to(Drawing)
+
+    for d in ({'radius': 1, 'color': 'red'},
+              {'side': 1, 'color': 'red'},
+              {'base': 1, 'height': 2, 'color': 'red'}):
+        d = {'shape': d}
+        shape = fromdict(Drawing, d).shape
+
+        elapsed = timeit(lambda: fromdict(Drawing, d), number=n)
+        log.info('load:  untagged, %-8s: %f', type(shape).__name__, elapsed)
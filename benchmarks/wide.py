@@ -0,0 +1,53 @@
+"""
+Loading wide dataclasses (many fields) with a ``CatchAll`` field; with
+enough fields, the keys in the input are matched and the unknown keys are
+captured in a single pass over the input object, rather than with a lookup
+per field and another pass over the input when an unknown key is present.
+"""
+import logging
+from dataclasses import astuple, field, make_dataclass
+from timeit import timeit
+
+import pytest
+
+from dataclass_wizard import LoadMeta, _loaders, fromdict
+from dataclass_wizard.models import CatchAll
+
+log = logging.getLogger(__name__)
+
+
+def make_class(name, num_fields, load_case):
+    fields = [(f'field_{i}', int) for i in range(num_fields)]
+    cls = make_dataclass(name, fields + [('extra', CatchAll, field(default=None))])
+    LoadMeta(load_case=load_case).bind_to(cls)
+
+    return cls
+
+
+@pytest.mark.parametrize('num_fields', [8, 32, 128, 512])
+@pytest.mark.parametrize('num_unknown', [0, 10, 200])
+@pytest.mark.parametrize('load_case', [None, 'AUTO'])
+def test_load_wide(num_fields, num_unknown, load_case, monkeypatch, n):
+    per_field = make_class('PerField', num_fields, load_case)
+    single_pass = make_class('SinglePass', num_fields, load_case)
+
+    data = {f'field_{i}': i for i in range(num_fields)}
+    data.update({f'unknown_{i}': i for i in range(num_unknown)})
+
+    # the load function is generated on first use
+    monkeypatch.setattr(_loaders, 'SINGLE_PASS_MIN_FIELDS', num_fields + 1)
+    per_field_obj = fromdict(per_field, data)
+    monkeypatch.setattr(_loaders, 'SINGLE_PASS_MIN_FIELDS', num_fields)
+    single_pass_obj = fromdict(single_pass, data)
+
+    assert astuple(per_field_obj) == astuple(single_pass_obj)
+
+    number = max(n * 8 // num_fields // 10, 100)
+
+    per_field_time = timeit(lambda: fromdict(per_field, data), number=number)
+    single_pass_time = timeit(lambda: fromdict(single_pass, data), number=number)
+
+    log.info('fields=%d unknown=%d load_case=%s  per field: %f  '
+             'single pass: %f  (%.2fx)',
+             num_fields, num_unknown, load_case,
+             per_field_time, single_pass_time, per_field_time / single_pass_time)
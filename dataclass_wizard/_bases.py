@@ -20,6 +20,7 @@ if TYPE_CHECKING:  # pragma: no cover
         EnvPrecedence,
         KeyAction,
         KeyCase,
+        TimedeltaTo,
     )
 
 
@@ -252,6 +253,9 @@ class BaseMeta(metaclass=ABCOrAndMeta):
     # Unsafe: Enables parsing of dataclasses in unions without requiring
     # the presence of a `tag_key`, i.e., a dictionary key identifying the
     # tag field in the input. Defaults to False.
+    #
+    # Such a dataclass is only tried if the input has a key for each of its
+    # required fields; the first dataclass (in order) which loads is used.
     unsafe_parse_dataclass_in_union: ClassVar[bool] = False
 
     # Specifies how :class:`datetime` (and :class:`time`, where applicable)
@@ -267,6 +271,14 @@ class BaseMeta(metaclass=ABCOrAndMeta):
     # Supported values are defined by :class:`DateTimeTo`.
     dump_date_time_as: ClassVar[DateTimeTo | str | None] = None
 
+    # Specifies how :class:`timedelta` objects are serialized during output.
+    #
+    # By default, values are serialized using `str(td)`, e.g. "1:30:00".
+    # Any of the supported formats can be loaded back as a `timedelta`.
+    #
+    # Supported values are defined by :class:`TimedeltaTo`.
+    dump_timedelta_as: ClassVar[TimedeltaTo | str | None] = None
+
     # Specifies the timezone to assume for naive :class:`datetime` values
     # during serialization.
     #
@@ -308,6 +320,47 @@ class BaseMeta(metaclass=ABCOrAndMeta):
     # For ``Optional[str]`` fields, ``None`` is preserved by default.
     coerce_none_to_empty_str: ClassVar[bool | None] = None
 
+    # If True (default: False), the input is trusted to already have the
+    # annotated types, e.g. for traffic between internal services.
+    #
+    # Values for ``str``, ``int``, ``float``, ``bool``, ``None``, ``Any``
+    # and ``Literal`` fields (or a ``Union`` of these) are then loaded as-is,
+    # without any coercion or checks. A ``list`` or ``dict[str, ...]`` of
+    # these types is reused as-is, and a ``set``, ``frozenset`` or
+    # ``tuple[..., ...]`` is created directly from the input list.
+    #
+    # Note:
+    #     Values are not converted: for example, an ``int`` value for a
+    #     ``float`` field is not converted to a ``float``.
+    trusted_input: ClassVar[bool | None] = None
+
+    # If True (default: False), dataclass instances are constructed directly
+    # when loading:
+    #
+    # - The default value of a field that is missing in the input is set
+    #   inline, rather than omitted from a dict of keyword arguments for
+    #   ``__init__``.
+    # - A ``frozen`` dataclass is created with ``object.__new__``, and each
+    #   field is set directly in the instance ``__dict__`` (or through its
+    #   slot), rather than with ``object.__setattr__`` in ``__init__``.
+    #   ``__post_init__`` is then called, if it is defined.
+    #
+    # Note:
+    #     This has no effect if ``__init__`` is not the one generated by
+    #     ``dataclass``, or if the dataclass has an ``InitVar`` field.
+    direct_construction: ClassVar[bool | None] = None
+
+    # If set, cache (up to this many) `date`, `datetime`, and `time` values
+    # parsed from strings when loading, per dataclass and type; an input
+    # string which repeats -- such as a batch timestamp -- returns the same
+    # (immutable) object, rather than being parsed again.
+    #
+    # The cache hits and misses for a dataclass can be checked with
+    # :func:`dataclass_wizard.codegen.datetime_parse_cache_info`.
+    #
+    # Defaults to None (disabled).
+    datetime_parse_cache_size: ClassVar[int | None] = None
+
     # Controls how leaf (non-recursive) types are detected during
     # serialization.
     #
@@ -394,6 +447,18 @@ class AbstractMeta(BaseMeta):
     # If unset, this value defaults to `case` when provided.
     load_case: ClassVar[KeyCase | str | None] = None
 
+    # With `load_case='AUTO'`, learn the key casing of the input: once this
+    # many keys in a row are found in the same casing (for example,
+    # `camelCase`), each field is first looked up by its key in that casing,
+    # rather than by all the possible keys. If a key is found in a different
+    # casing, the casing is learned again.
+    #
+    # The casings seen for a dataclass can be checked with
+    # :func:`dataclass_wizard.codegen.key_case_info`.
+    #
+    # Defaults to None (disabled).
+    load_case_learn_after: ClassVar[int | None] = None
+
     # A custom mapping of dataclass fields to their JSON aliases (keys).
     #
     # Values may be a single alias string or a sequence of alias strings.
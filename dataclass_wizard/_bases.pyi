@@ -13,6 +13,7 @@ from .enums import EnvKeyStrategy as EnvKeyStrategy
 from .enums import EnvPrecedence as EnvPrecedence
 from .enums import KeyAction as KeyAction
 from .enums import KeyCase as KeyCase
+from .enums import TimedeltaTo as TimedeltaTo
 
 TypeToHook = typing.Mapping[
     type, tuple[ALLOWED_MODES, HookFn] | HookFn | None]
@@ -42,9 +43,13 @@ class BaseMeta:
         typing.Mapping[str, str | typing.Sequence[str]] | None] = ...
     unsafe_parse_dataclass_in_union: _ClassVar[bool] = ...
     dump_date_time_as: _ClassVar[DateTimeTo | str | None] = ...
+    dump_timedelta_as: _ClassVar[TimedeltaTo | str | None] = ...
     assume_naive_datetime_tz: _ClassVar[tzinfo | None] = ...
     namedtuple_as_dict: _ClassVar[bool | None] = ...
     coerce_none_to_empty_str: _ClassVar[bool | None] = ...
+    trusted_input: _ClassVar[bool | None] = ...
+    direct_construction: _ClassVar[bool | None] = ...
+    datetime_parse_cache_size: _ClassVar[int | None] = ...
     leaf_handling: _ClassVar[
         typing.Literal['exact', 'issubclass'] | None] = ...
     all_fields: _ClassVar[frozenset] = ...
@@ -55,6 +60,7 @@ class AbstractMeta(BaseMeta):
     __is_inner_meta__: _ClassVar[bool] = ...
     case: _ClassVar[KeyCase | str | None] = ...
     load_case: _ClassVar[KeyCase | str | None] = ...
+    load_case_learn_after: _ClassVar[int | None] = ...
     field_to_alias: _ClassVar[
         typing.Mapping[str, str | typing.Sequence[str]] | None] = ...
     field_to_alias_load: _ClassVar[
@@ -11,6 +11,7 @@ from collections.abc import Mapping
 
 from ._bases import AbstractEnvMeta, AbstractMeta
 from ._class_helper import (
+    CODEGEN_LOCK,
     DATACLASS_FIELD_TO_ALIAS_FOR_DUMP,
     DATACLASS_FIELD_TO_ALIAS_FOR_LOAD,
     DATACLASS_FIELD_TO_ENV_FOR_LOAD,
@@ -28,7 +29,8 @@ from ._type_utils import (
     get_outer_class_name,
     per_cls,
 )
-from .enums import DateTimeTo, EnvKeyStrategy, EnvPrecedence, KeyAction, KeyCase
+from .enums import (DateTimeTo, EnvKeyStrategy, EnvPrecedence, KeyAction, KeyCase,
+                    TimedeltaTo)
 from .errors import ParseError
 
 ALLOWED_MODES = ('runtime', 'codegen')
@@ -38,23 +40,24 @@ _debug_was_enabled = False
 
 
 def register_type(cls, tp, *, load=None, dump=None, mode=None) -> None:
-    meta = get_meta(cls)
-    if meta is AbstractMeta:
-        from ._meta_cache import create_meta
-        meta = create_meta(cls)
-
     if load is None:
         load = tp
     if dump is None:
         dump = str
 
-    if (load_hook := meta.type_to_load_hook) is None:
-        meta.type_to_load_hook = load_hook = {}
-    if (dump_hook := meta.type_to_dump_hook) is None:
-        meta.type_to_dump_hook = dump_hook = {}
+    with CODEGEN_LOCK:
+        meta = get_meta(cls)
+        if meta is AbstractMeta:
+            from ._meta_cache import create_meta
+            meta = create_meta(cls)
+
+        if (load_hook := meta.type_to_load_hook) is None:
+            meta.type_to_load_hook = load_hook = {}
+        if (dump_hook := meta.type_to_dump_hook) is None:
+            meta.type_to_dump_hook = dump_hook = {}
 
-    load_hook[tp] = (mode if mode else _infer_mode(load), load)
-    dump_hook[tp] = (mode if mode else _infer_mode(dump), dump)
+        load_hook[tp] = (mode if mode else _infer_mode(load), load)
+        dump_hook[tp] = (mode if mode else _infer_mode(dump), dump)
 
 
 # use `debug` for log level if it's a str or int.
@@ -202,6 +205,10 @@ class BaseJSONWizardMeta(AbstractMeta):
             cls.dump_date_time_as = _as_enum_safe(
                 cls, 'dump_date_time_as', DateTimeTo)
 
+        if cls.dump_timedelta_as is not None:
+            cls.dump_timedelta_as = _as_enum_safe(
+                cls, 'dump_timedelta_as', TimedeltaTo)
+
         if (key_case := cls.case) is not None:
             cls.load_case = cls.dump_case = key_case
             cls.case = None
@@ -245,10 +252,11 @@ class BaseJSONWizardMeta(AbstractMeta):
             # Check if the dataclass already has a Meta config; if so, we
             # need to copy over special attributes so they don't get
             # overwritten.
-            if dataclass in META_BY_DATACLASS:
-                META_BY_DATACLASS[dataclass] &= cls
-            else:
-                META_BY_DATACLASS[dataclass] = cls
+            with CODEGEN_LOCK:
+                if dataclass in META_BY_DATACLASS:
+                    META_BY_DATACLASS[dataclass] &= cls
+                else:
+                    META_BY_DATACLASS[dataclass] = cls
 
 
 # IMPORTANT: do this after the class definition
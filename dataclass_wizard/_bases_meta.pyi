@@ -15,7 +15,8 @@ from ._path_util import EnvFilePaths, SecretsDirs
 from ._type_def import ENV_META, META, E
 from .conditions import Condition
 from .constants import TAG
-from .enums import DateTimeTo, EnvKeyStrategy, EnvPrecedence, KeyAction, KeyCase
+from .enums import (DateTimeTo, EnvKeyStrategy, EnvPrecedence, KeyAction, KeyCase,
+                    TimedeltaTo)
 
 ALLOWED_MODES = Literal['runtime', 'codegen']
 
@@ -81,11 +82,15 @@ def LoadMeta(*,
              type_to_hook: TypeToHook = ...,
              pre_decoder: PreDecoder = ...,
              case: KeyCase | str | None = ...,
+             load_case_learn_after: int | None = ...,
              field_to_alias: Mapping[str, str | Sequence[str]] = ...,
              on_unknown_key: KeyAction | str | None = KeyAction.IGNORE,
              unsafe_parse_dataclass_in_union: bool = ...,
              namedtuple_as_dict: bool = ...,
              coerce_none_to_empty_str: bool = ...,
+             trusted_input: bool = ...,
+             direct_construction: bool = ...,
+             datetime_parse_cache_size: int | None = ...,
              leaf_handling: Literal['exact', 'issubclass'] = ...) -> META:
     ...
 
@@ -102,6 +107,7 @@ def DumpMeta(*,
              case: KeyCase | str | None = ...,
              field_to_alias: Mapping[str, str | Sequence[str]] = ...,
              dump_date_time_as: DateTimeTo | str = ...,
+             dump_timedelta_as: TimedeltaTo | str = ...,
              assume_naive_datetime_tz: tzinfo | None = ...,
              namedtuple_as_dict: bool = ...,
              leaf_handling: Literal['exact', 'issubclass'] = ...) -> META:
@@ -132,6 +138,7 @@ def EnvMeta(*,
             # on_unknown_key: KeyAction | str | None = KeyAction.IGNORE,
             unsafe_parse_dataclass_in_union: bool = ...,
             dump_date_time_as: DateTimeTo | str = ...,
+            dump_timedelta_as: TimedeltaTo | str = ...,
             assume_naive_datetime_tz: tzinfo | None = ...,
             namedtuple_as_dict: bool = ...,
             coerce_none_to_empty_str: bool = ...,
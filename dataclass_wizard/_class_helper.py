@@ -1,8 +1,10 @@
 from __future__ import annotations
 
 from dataclasses import MISSING
+from threading import RLock
 from weakref import WeakKeyDictionary, WeakSet
 
+from ._meta_cache import get_meta, meta_fingerprint
 from ._type_def import ExplicitNull
 from ._type_utils import get_class, get_class_name, per_cls
 from .constants import CATCH_ALL, PACKAGE_NAME
@@ -15,6 +17,10 @@ from .utils._typing_compat import (
     is_annotated,
 )
 
+# Re-entrant lock which guards code generation for dataclasses, along with
+# any check-then-set updates to the global (per-class) caches that it reads.
+CODEGEN_LOCK = RLock()
+
 # A mapping of dataclass to its loader.
 CLASS_TO_LOADER = WeakKeyDictionary()
 
@@ -47,15 +53,38 @@ DATACLASS_FIELD_TO_SKIP_IF = WeakKeyDictionary()
 # Cache: owner class -> its `Meta` inner class (only present when subclassed)
 META_INITIALIZER = {}
 
+# Load: the `AutoKeyCase` per dataclass, which learns the key casing of
+# the input, if `load_case_learn_after` is set with `load_case='AUTO'`
+CLASS_TO_AUTO_KEY_CASE = WeakKeyDictionary()
+
+# Load: per dataclass, the (LRU) cache of `date` / `datetime` / `time`
+# values parsed from strings, per type, if `datetime_parse_cache_size` is set
+CLASS_TO_DATETIME_PARSE_CACHE = WeakKeyDictionary()
+
+# Load: compiled functions for nested dataclasses, which are shared across
+# root classes; per dataclass, a mapping of `nested_function_key` to function
+NESTED_LOAD_FUNCTIONS = WeakKeyDictionary()
+
+# Dump: compiled functions for nested dataclasses, which are shared across
+# root classes; per dataclass, a mapping of `nested_function_key` to function
+NESTED_DUMP_FUNCTIONS = WeakKeyDictionary()
+
+# Dump: per dataclass, the functions specialized for an `exclude` / `include`
+# projection, keyed on `(frozenset(exclude), frozenset(include))`
+CLASS_TO_PROJECTED_DUMP_FUNCS = WeakKeyDictionary()
+
+# Load: per dataclass, the functions specialized for an `only` projection,
+# keyed on `frozenset(only)`
+CLASS_TO_PROJECTED_LOAD_FUNCS = WeakKeyDictionary()
+
 
 def set_class_loader(cls_to_loader, class_or_instance, loader):
 
     cls = get_class(class_or_instance)
     loader_cls = get_class(loader)
 
-    cls_to_loader[cls] = loader_cls
-
-    return loader_cls
+    # `setdefault` so that concurrent callers all get the same loader
+    return cls_to_loader.setdefault(cls, loader_cls)
 
 
 def set_class_dumper(cls_to_dumper, class_or_instance, dumper):
@@ -63,9 +92,32 @@ def set_class_dumper(cls_to_dumper, class_or_instance, dumper):
     cls = get_class(class_or_instance)
     dumper_cls = get_class(dumper)
 
-    cls_to_dumper[cls] = dumper_cls
+    # `setdefault` so that concurrent callers all get the same dumper
+    return cls_to_dumper.setdefault(cls, dumper_cls)
+
+
+def nested_function_key(cls, config, prefix):
+    """
+    Return the key for a compiled function of a nested dataclass `cls`,
+    which identifies everything the generated code depends on: the Meta
+    config applied from the root class, the Meta config for `cls`, and
+    the key transform on the loader (or dumper) for `cls`.
+
+    Return None if the function can't be shared, as a Meta setting can't
+    be made hashable.
+    """
+    config_fp = meta_fingerprint(config)
+    cls_config_fp = meta_fingerprint(get_meta(cls))
+
+    if config_fp is None or cls_config_fp is None:
+        return None
+
+    if prefix == 'load':
+        key_case = getattr(CLASS_TO_LOADER.get(cls), 'transform_json_field', None)
+    else:
+        key_case = getattr(CLASS_TO_DUMPER.get(cls), 'transform_dataclass_field', None)
 
-    return dumper_cls
+    return config_fp, cls_config_fp, key_case
 
 
 def dataclass_field_to_skip_if(cls):
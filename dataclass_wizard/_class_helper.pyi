@@ -1,5 +1,6 @@
-from collections.abc import Mapping, Sequence
-from typing import Callable
+from collections.abc import Hashable, Mapping, Sequence
+from threading import RLock
+from typing import Any, Callable
 from weakref import WeakKeyDictionary, WeakSet
 
 from ._abstractions import (
@@ -8,11 +9,16 @@ from ._abstractions import (
     E,
     W,
 )
-from ._type_def import T
+from ._type_def import META, T
 from .conditions import Condition
 from .constants import PACKAGE_NAME
+from .utils._auto_key_case import AutoKeyCase
 from .utils._object_path import PathType
 
+# Re-entrant lock which guards code generation for dataclasses, along with
+# any check-then-set updates to the global (per-class) caches that it reads.
+CODEGEN_LOCK: RLock
+
 # A mapping of dataclass to its loader.
 CLASS_TO_LOADER: WeakKeyDictionary[type, type[AbstractLoaderGenerator]]
 
@@ -50,6 +56,28 @@ DATACLASS_FIELD_TO_SKIP_IF: WeakKeyDictionary[
 # Cache: owner class -> its `Meta` inner class (only present when subclassed)
 META_INITIALIZER: dict[str, Callable[[type[W]], None]] = {}
 
+# Load: the `AutoKeyCase` per dataclass, which learns the key casing of
+# the input, if `load_case_learn_after` is set with `load_case='AUTO'`
+CLASS_TO_AUTO_KEY_CASE: WeakKeyDictionary[type, AutoKeyCase]
+
+# Load: per dataclass, the cached string parser for each date / time type
+CLASS_TO_DATETIME_PARSE_CACHE: WeakKeyDictionary[type, dict[type, Callable[[str], Any]]]
+
+# Load: compiled functions for nested dataclasses, shared across root classes
+NESTED_LOAD_FUNCTIONS: WeakKeyDictionary[type, dict[Hashable, Callable]]
+
+# Dump: compiled functions for nested dataclasses, shared across root classes
+NESTED_DUMP_FUNCTIONS: WeakKeyDictionary[type, dict[Hashable, Callable]]
+CLASS_TO_PROJECTED_DUMP_FUNCS: WeakKeyDictionary[type, dict[tuple[frozenset[str] | None, frozenset[str] | None], Callable]]
+CLASS_TO_PROJECTED_LOAD_FUNCS: WeakKeyDictionary[type, dict[frozenset[str], Callable]]
+
+def nested_function_key(cls: type, config: type[META], prefix: str) -> Hashable | None:
+    """
+    Return the key for a compiled function of a nested dataclass `cls`,
+    which identifies everything the generated code depends on; return None
+    if the function can't be shared.
+    """
+
 def set_class_loader(
         cls_to_loader: Mapping[type, type[AbstractLoaderGenerator]],
         class_or_instance: type[T] | T,
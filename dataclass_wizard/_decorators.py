@@ -4,8 +4,11 @@ import hashlib
 from dataclasses import MISSING
 from functools import wraps
 from typing import TYPE_CHECKING, Callable, cast
+from weakref import WeakKeyDictionary
 
 from ._type_def import DT
+from ._type_utils import per_cls
+from .utils._code_cache import is_aot_active
 from .utils._function_builder import FunctionBuilder
 from .utils._typing_compat import is_union
 
@@ -115,6 +118,7 @@ def setup_recursive_safe_function(
     add_cls: bool = True,
     prefix: str = 'load',
     per_class_cache: bool = False,
+    shared: WeakKeyDictionary | None = None,
 ) -> Callable:
     """
     A decorator to ensure recursion safety and facilitate dynamic function generation
@@ -134,6 +138,11 @@ def setup_recursive_safe_function(
     :param add_cls: Whether the class should be added to the function locals
       for `FunctionBuilder`.
     :type add_cls: bool, optional
+    :param shared: A registry of compiled functions (per type) to share
+      across root classes; if a function was already compiled for the
+      type with the same effective config, it's linked to instead of
+      being generated again.
+    :type shared: WeakKeyDictionary, optional
     :return: The decorated function with recursion safety and dynamic function generation.
     :rtype: Callable
     """
@@ -146,6 +155,7 @@ def setup_recursive_safe_function(
             add_cls=add_cls,
             prefix=prefix,
             per_class_cache=per_class_cache,
+            shared=shared,
         )
 
     def _wrapper_logic(tp: TypeInfo, extras: Extras, _cls=None) -> str:
@@ -199,6 +209,27 @@ def setup_recursive_safe_function(
             # Retrieve the main FunctionBuilder
             main_fn_gen = extras['fn_gen']
 
+            # Link to a function compiled for another root class, if
+            # possible; otherwise, export the new function when created.
+            #
+            # Note: the main (root) class is keyed on just the type.
+            if (shared is not None
+                    and ann_tp_or_args not in recursion_guard
+                    and not is_aot_active()):
+                from ._class_helper import nested_function_key
+
+                shared_key = nested_function_key(
+                    ann_tp_or_args, extras['config'], prefix)
+
+                if shared_key is not None:
+                    shared_fns = per_cls(shared, ann_tp_or_args)
+
+                    if (shared_fn := shared_fns.get(shared_key)) is not None:
+                        main_fn_gen.globals[_fn_name] = shared_fn
+                        return f'{_fn_name}({tp.v()})'
+
+                    main_fn_gen.exports.append((shared_fns, shared_key, _fn_name))
+
             # Prepare a new FunctionBuilder for this function
             updated_extras = extras.copy()
             updated_extras['locals'] = _locals = {'cls': ann_tp_or_args} if add_cls else {}
@@ -1,4 +1,5 @@
 from typing import Callable
+from weakref import WeakKeyDictionary
 
 from _typeshed import Incomplete
 
@@ -12,7 +13,7 @@ def _generic_sig_str(name, args) -> str: ...
 def _union_args(x): ...
 def _flatten_union_args(args): ...
 def _canonical_union_args(args): ...
-def setup_recursive_safe_function(func: Callable = ..., *, fn_name: str | None = ..., is_generic: bool = ..., add_cls: bool = ..., prefix: str = ..., per_class_cache: bool = ...) -> Callable: ...
+def setup_recursive_safe_function(func: Callable = ..., *, fn_name: str | None = ..., is_generic: bool = ..., add_cls: bool = ..., prefix: str = ..., per_class_cache: bool = ..., shared: WeakKeyDictionary | None = ...) -> Callable: ...
 def setup_recursive_safe_function_for_generic(func: Callable = ..., prefix: str = ..., per_class_cache: bool = ...) -> Callable: ...
 
 class cached_class_property:
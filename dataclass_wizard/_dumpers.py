@@ -1,13 +1,15 @@
 from __future__ import annotations
 
 import collections.abc as abc
+import hashlib
 from base64 import b64encode
 from collections import defaultdict, deque
-from collections.abc import Collection
+from collections.abc import Collection, Iterable
 from dataclasses import MISSING, Field, is_dataclass
 from datetime import date, datetime, time, timedelta
 from decimal import Decimal
 from enum import Enum
+from json.encoder import JSONEncoder, c_make_encoder, encode_basestring_ascii
 from pathlib import Path
 
 # noinspection PyUnresolvedReferences,PyProtectedMember
@@ -23,7 +25,10 @@ from uuid import UUID
 from ._bases import AbstractMeta, BaseDumpHook
 from ._class_helper import (
     CLASS_TO_DUMPER,
+    CLASS_TO_PROJECTED_DUMP_FUNCS,
+    CODEGEN_LOCK,
     DATACLASS_FIELD_TO_ALIAS_PATH_FOR_DUMP,
+    NESTED_DUMP_FUNCTIONS,
     dataclass_field_to_skip_if,
     resolve_dataclass_field_to_alias_for_dump,
     set_class_dumper,
@@ -43,20 +48,21 @@ from ._models import (
     get_skip_if_condition,
 )
 from ._models_date import UTC, ZERO
-from ._type_conv import datetime_to_timestamp
+from ._type_conv import datetime_to_timestamp, timedelta_to_compact, timedelta_to_iso
 from ._type_def import (
     META,
+    UNSET,
     ExplicitNull,
     JSONObject,
     NoneType,
     PyLiteralString,
     T,
 )
-from ._type_utils import create_new_class, is_subclass_safe
+from ._type_utils import create_new_class, is_subclass_safe, per_cls
 
 # noinspection PyUnresolvedReferences
-from .constants import _HOOKS, CATCH_ALL, PACKAGE_NAME, TAG
-from .enums import DateTimeTo, KeyCase
+from .constants import _HOOKS, CATCH_ALL, PACKAGE_NAME, PROJECTION_CACHE_SIZE, TAG
+from .enums import DateTimeTo, KeyCase, TimedeltaTo
 from .errors import JSONWizardError, MissingData, MissingFields, ParseError
 from .utils._dataclass_compat import (
     SEEN_DEFAULT,
@@ -65,7 +71,7 @@ from .utils._dataclass_compat import (
     set_new_attribute,
 )
 from .utils._dict_helper import NestedDict
-from .utils._function_builder import FunctionBuilder
+from .utils._function_builder import FunctionBuilder, called_function_name
 from .utils._typing_compat import (
     eval_forward_ref_if_needed,
     get_args,
@@ -86,6 +92,39 @@ _KNOWN_FACTORY_LITERALS: dict[Callable[[], Any], str] = {
 }
 
 
+def _json_value_encoder() -> Callable[[Any], str]:
+    """
+    Return a function to encode a (dumped) value as JSON text, with the
+    same output as `json.dumps` with default arguments; the C encoder, if
+    available, is created once and reused across calls.
+    """
+    default = JSONEncoder().default
+
+    if c_make_encoder is None:  # pragma: no cover
+        return JSONEncoder().encode
+
+    iterencode = c_make_encoder(
+        None, default, encode_basestring_ascii, None,
+        ': ', ', ', False, False, True)
+
+    return lambda o: ''.join(iterencode(o, 0))
+
+
+_encode_json = _json_value_encoder()
+
+# Expressions to encode a value of a type as JSON text, when its dump hook
+# returns the value unchanged. `{w}` is where the value is first evaluated,
+# and `{v}` is a name bound to it; other values (e.g. a `bool` for an `int`
+# field) are passed to the regular encoder.
+_JSON_SCALAR_EXPRS: dict[type, str] = {
+    str: '_json_str({v}) if {w}.__class__ is str else _encode_json({v})',
+    int: 'int.__repr__({v}) if {w}.__class__ is int else _encode_json({v})',
+    float: 'float.__repr__({v}) if {w}.__class__ is float and {v} - {v} == 0.0 '
+           'else _encode_json({v})',
+    bool: "'true' if {w} is True else 'false' if {v} is False else _encode_json({v})",
+}
+
+
 def default_compare_expr(
     f: Field[Any],
     locals_ns: dict[str, Any],
@@ -118,6 +157,106 @@ def default_compare_expr(
     return None
 
 
+def _alias_path_tree(paths: list[tuple]) -> dict | None:
+    """
+    Return an empty tree to build a nested `dict` literal for `paths`, or
+    None if any path repeats or is a prefix of another path.
+    """
+    seen = set(paths)
+    if len(seen) != len(paths):
+        return None
+
+    for path in paths:
+        for n in range(1, len(path)):
+            if path[:n] in seen:
+                return None
+
+    return {}
+
+
+def _dict_literal(tree: dict) -> str:
+    """Render a (nested) tree of key to expression as a `dict` literal."""
+    items = ', '.join(
+        f'{k!r}: {_dict_literal(v) if type(v) is dict else v}'
+        for k, v in tree.items())
+    return f'{{{items}}}'
+
+
+def _alias_path_lvalue(path: tuple, tree: dict | None) -> str:
+    """
+    Return the assignment target in `paths` for an `AliasPath`. Levels not
+    already present in the `dict` literal (`tree`) are created with
+    `setdefault`; with no tree, `paths` is a :class:`NestedDict`.
+    """
+    lvalue = 'paths'
+    node = tree
+
+    for p in path[:-1]:
+        if tree is None or (node is not None and p in node):
+            lvalue += f'[{p!r}]'
+            node = node[p] if node is not None else None
+        else:
+            lvalue += f'.setdefault({p!r}, {{}})'
+            node = None
+
+    return f'{lvalue}[{path[-1]!r}]'
+
+
+def _split_projection(paths):
+    """
+    Split the `exclude` / `include` (or `only`) paths for a dataclass into
+    the names of its fields, and a mapping of field name to the (rest of
+    the) paths for a nested dataclass, e.g. `owner.address` ->
+    `{'owner': {'address'}}`.
+    """
+    if paths is None:
+        return None, {}
+
+    names, nested = set(), {}
+    for path in paths:
+        name, dot, rest = path.partition('.')
+        if dot:
+            nested.setdefault(name, set()).add(rest)
+        else:
+            names.add(name)
+
+    return names, {name: frozenset(rest) for name, rest in nested.items()}
+
+
+def _projected_field_code(f, i, var_name, cls, get_func, locals_ns):
+    """
+    Return the code to load or dump a field which is a (nested) dataclass,
+    or a `list` of them, with the function `get_func` returns for that
+    dataclass (i.e. for its projection); None if the field is of another
+    type.
+    """
+    tp = f.type = eval_forward_ref_if_needed(f.type, cls)
+    v = var_name or 'v1'
+
+    optional = False
+    if is_union(get_origin_v2(tp)):
+        args = get_args(tp)
+        if len(args) == 2 and NoneType in args:
+            optional = True
+            tp = args[0] if args[1] is NoneType else args[1]
+
+    fn_name = f'_projected_{i}'
+
+    if is_dataclass(tp) and isinstance(tp, type):
+        string = f'{fn_name}({v})'
+    elif (get_origin_v2(tp) is list
+          and len(args := get_args(tp)) == 1
+          and is_dataclass(args[0]) and isinstance(args[0], type)):
+        tp = args[0]
+        string = f'[{fn_name}(x) for x in {v}]'
+    else:
+        return None
+
+    locals_ns[fn_name] = get_func(tp)
+
+    return f'None if {v} is None else {string}' if optional else string
+
+
 def _type_returns_value_unchanged(arg, leaf_handling_as_subclass, origin=None):
     # scalar type:
     # (str, int, float, bool, complex, type, Literal, Any)
@@ -183,8 +322,12 @@ class DumpMixin(BaseDumpHook):
 
     @staticmethod
     def dump_from_enum(tp: TypeInfo, extras: Extras):
-        # alias: o.value
-        return f'{tp.v()}.value'
+        # alias: o._value_
+        #
+        # `_value_` is set on every member (including `Flag` composites and
+        # `StrEnum` / `IntEnum` members), and reading it directly avoids the
+        # `value` property on `Enum`, which is comparatively slow.
+        return f'{tp.v()}._value_'
 
     @staticmethod
     def dump_from_uuid(tp: TypeInfo, extras: Extras):
@@ -403,6 +546,11 @@ class DumpMixin(BaseDumpHook):
         try_parse_lines = []
         dataclass_and_line = []
         has_dataclass = False
+        # type -> dump function for the dataclass (and its tag, if any),
+        # filled in once the functions are created.
+        type_to_dump = {}
+        type_to_tag = {}
+        num_dispatched = 0
 
         for possible_tp in args:
 
@@ -437,7 +585,12 @@ class DumpMixin(BaseDumpHook):
                     else:
                         meta.tag = cls_name
 
-                if tag:
+                if (fn_name := called_function_name(string, tp_new.v())) is not None:
+                    fn_gen.exports.append((type_to_dump, possible_tp, fn_name))
+                    num_dispatched += 1
+                    if tag:
+                        type_to_tag[possible_tp] = tag
+                elif tag:
                     dataclass_and_line.append(
                         (possible_tp, cls_name, tag,
                          f'result = {string}; result[tag_key] = {tag!r}; return result'))
@@ -461,6 +614,24 @@ class DumpMixin(BaseDumpHook):
             with fn_gen.if_('t in leaf_types', comment=f'{{{leaf_type_names}}}'):
                 fn_gen.add_line(f'return {v}')
 
+        if num_dispatched:
+            _locals['type_to_dump'] = type_to_dump
+
+            with fn_gen.if_('(dump_fn := type_to_dump.get(t)) is not None'):
+                if not type_to_tag:
+                    fn_gen.add_line(f'return dump_fn({v})')
+                else:
+                    _locals['type_to_tag'] = type_to_tag
+                    fn_gen.add_line(f'result = dump_fn({v})')
+
+                    if len(type_to_tag) == num_dispatched:
+                        fn_gen.add_line('result[tag_key] = type_to_tag[t]')
+                    else:
+                        with fn_gen.if_('(tag := type_to_tag.get(t)) is not None'):
+                            fn_gen.add_line('result[tag_key] = tag')
+
+                    fn_gen.add_line('return result')
+
         if has_dataclass:
 
             for field_i, (dataclass, _name, tag, line) in enumerate(dataclass_and_line, start=1):
@@ -531,12 +702,24 @@ class DumpMixin(BaseDumpHook):
 
     @staticmethod
     def dump_from_timedelta(tp: TypeInfo, extras: Extras):
-        return f'str({tp.v()})'
+        o = tp.v()
+        dump_as = extras['config'].dump_timedelta_as
+
+        if dump_as is TimedeltaTo.ISO:
+            tp.ensure_in_locals(extras, timedelta_to_iso)
+            return f'timedelta_to_iso({o})'
+
+        if dump_as is TimedeltaTo.COMPACT:
+            tp.ensure_in_locals(extras, timedelta_to_compact)
+            return f'timedelta_to_compact({o})'
+
+        return f'str({o})'
 
     @staticmethod
     @setup_recursive_safe_function(
         prefix='dump',
-        fn_name=f'__{PACKAGE_NAME}_to_dict_{{cls_name}}__')
+        fn_name=f'__{PACKAGE_NAME}_to_dict_{{cls_name}}__',
+        shared=NESTED_DUMP_FUNCTIONS)
     def dump_from_dataclass(tp: TypeInfo, extras: Extras):
         dump_func_for_dataclass(tp.origin, extras)
 
@@ -824,6 +1007,8 @@ def dump_func_for_dataclass(
     extras: Extras | None = None,
     dumper_cls=DumpMixin,
     base_meta_cls: type = AbstractMeta,
+    projection: tuple | None = None,
+    with_list: bool = False,
 ) -> Callable[[T], JSONObject] | str:
     # TODO dynamically generate for multiple nested classes at once
 
@@ -839,10 +1024,24 @@ def dump_func_for_dataclass(
     cls_name = cls.__name__
 
     fn_name = f'__{PACKAGE_NAME}_to_dict_{cls_name}__'
+    list_fn_name = f'__{PACKAGE_NAME}_to_list_{cls_name}__'
 
     # Get the meta config for the class, or the default config otherwise.
     meta = get_meta(cls, base_meta_cls)
 
+    if projection is not None:
+        # A dump function specialized for `exclude` / `include`, which only
+        # visits the selected fields.
+        exclude_names, nested_exclude = _split_projection(projection[0])
+        include_names, nested_include = _split_projection(projection[1])
+        # names which don't match a field (i.e. keys of a catch-all field)
+        # are removed from the result at the end.
+        exclude_rest = dict.fromkeys(sorted(exclude_names or ()))
+        sig_hash = hashlib.blake2s(
+            repr([p if p is None else sorted(p) for p in projection]).encode('utf-8'),
+            digest_size=6).hexdigest()
+        fn_name = f'__{PACKAGE_NAME}_to_dict_{cls_name}_{sig_hash}__'
+
     if extras is None:  # we are being run for the main dataclass
         is_main_class = True
 
@@ -931,7 +1130,7 @@ def dump_func_for_dataclass(
     skip_defaults = True if meta.skip_defaults else False
     skip_if = True if field_to_skip_if or skip_if_condition else False
 
-    catch_all_name: str | None = field_to_alias.pop(CATCH_ALL, None)
+    catch_all_name: str | None = field_to_alias.get(CATCH_ALL)
     has_catch_all = catch_all_name is not None
 
     if has_catch_all:
@@ -945,14 +1144,57 @@ def dump_func_for_dataclass(
 
     cls_name = cls.__name__
 
+    def is_selected(name, key) -> bool:
+        if projection is None:
+            return True
+        if exclude_names is not None and (
+                name in exclude_names or key in exclude_names):
+            exclude_rest.pop(name, None)
+            exclude_rest.pop(key, None)
+            return False
+        return include_names is None or any(
+            k in include_names or k in nested_include for k in (name, key))
+
+    def field_code(f, i, var_name=None):
+        # a nested dataclass with its own `exclude` / `include` paths
+        if projection is not None:
+            name, key = f.name, field_keys[f.name]
+            sub_exclude = nested_exclude.get(name) or nested_exclude.get(key)
+            sub_include = None
+            if include_names is not None and name not in include_names and key not in include_names:
+                sub_include = nested_include.get(name) or nested_include.get(key)
+            if (sub_exclude or sub_include is not None) and (
+                    string := _projected_field_code(
+                        f, i, var_name, cls,
+                        lambda tp: get_projected_dump_func(tp, sub_exclude, sub_include),
+                        new_locals)):
+                return string
+
+        return generate_field_code(cls_dumper, extras, f, i, var_name)
+
+    field_keys = {}
+
+    projected_check = 'exclude or include is not None'
+    projected_line = ('return __projected__(cls, exclude, include)'
+                      '(o, dict_factory, None, skip_defaults)')
+    defaults_line = 'add_defaults = not skip_defaults'
+    ret_line = 'return result if dict_factory is dict else dict_factory(result)'
+
     with fn_gen.function(
         fn_name, [
             'o',
             'dict_factory=dict',
             "exclude:'list[str]|None'=None",
             f'skip_defaults:bool={skip_defaults}',
+            "include:'list[str]|None'=None",
         ], MISSING, new_locals):
 
+        if is_main_class and projection is None:
+            # dump with a function specialized for `exclude` / `include`
+            new_locals['__projected__'] = get_projected_dump_func
+            with fn_gen.if_(projected_check):
+                fn_gen.add_line(projected_line)
+
         if (_pre_to_dict := getattr(cls, '_pre_to_dict', None)) is not None:
             new_locals['__pre_to_dict__'] = _pre_to_dict
             fn_gen.add_line('o = __pre_to_dict__(o)')
@@ -960,11 +1202,7 @@ def dump_func_for_dataclass(
         # Need to create a separate dictionary to copy over the constructor
         # args, as we don't want to mutate the original dictionary object.
         if has_defaults:
-            fn_gen.add_line('add_defaults = not skip_defaults')
-
-        if has_paths:
-            new_locals['NestedDict'] = NestedDict
-            fn_gen.add_line('paths = NestedDict()')
+            fn_gen.add_line(defaults_line)
 
         required_field_assigns = []
         default_assigns = []
@@ -997,6 +1235,11 @@ def dump_func_for_dataclass(
                     else:
                         key = key_case(name)
 
+                    if not is_selected(name, key):
+                        continue
+
+                    field_keys[name] = key
+
                     # If field has an explicit `SkipIf` condition
                     if skip_if:
                         has_skip_if = True
@@ -1020,40 +1263,70 @@ def dump_func_for_dataclass(
                     if has_paths and (
                         path := field_to_path.get(name)
                     ) is not None:  # AliasPath(...)
-                        lvalue = f"paths{''.join(f'[{p!r}]' for p in path)}"
+                        # NOTE: the target is resolved to an lvalue once
+                        #   all paths are known (see below).
+                        path = tuple(path)
                         if has_default:
-                            string = generate_field_code(cls_dumper, extras, f, i)
-                            default_assigns.append((name, key, default_value, lvalue, string))
+                            string = field_code(f, i)
+                            default_assigns.append((name, key, default_value, path, string))
                         else:
-                            var_name = 'v1' if has_skip_if else f'o.{name}'
-                            string = generate_field_code(cls_dumper, extras, f, i, var_name)
-                            path_assigns.append((name, f"{lvalue} = {string}"))
+                            var_name = 'v1' if name in name_to_skip_condition else f'o.{name}'
+                            string = field_code(f, i, var_name)
+                            path_assigns.append((name, path, string))
 
                         continue
 
                     if has_default:
-                        string = generate_field_code(cls_dumper, extras, f, i)
+                        string = field_code(f, i)
                         lvalue = f'result[{key!r}]'
                         default_assigns.append((name, key, default_value, lvalue, string))
                     else:
                         # TODO confirm this is ok
                         # vars_for_fields.append(f'{name}={var}')
                         if has_skip_if:
-                            string = generate_field_code(cls_dumper, extras, f, i, 'v1')
+                            string = field_code(f, i, 'v1')
                             lvalue = f'result[{key!r}]'
                             default_assigns.append((name, ExplicitNull, None, lvalue, string))
                         else:
-                            string = generate_field_code(cls_dumper, extras, f, i, f'o.{name}')
+                            string = field_code(f, i, f'o.{name}')
                             required_field_assigns.append((name, key, string))
 
                 # Add assignments for `AliasPath(...)`
-                for (name, line) in path_assigns:
-                    if (condition := name_to_skip_condition.get(name)) is not None:
-                        fn_gen.add_line(f'v1 = o.{name}')
-                        with fn_gen.if_(condition.format('v1')):
-                            fn_gen.add_line(line)
+                if has_paths:
+                    # Unconditional path fields are emitted as a single
+                    # nested `dict` literal; any conditional ones then
+                    # assign into it, creating missing levels as needed.
+                    all_paths = [path for _, path, _ in path_assigns]
+                    all_paths += [a[3] for a in default_assigns
+                                  if type(a[3]) is tuple]
+                    path_tree = _alias_path_tree(all_paths)
+
+                    if path_tree is None:
+                        # Some paths overlap (e.g. `a.b` and `a.b.c`), so
+                        # fall back to building the nested dict on the fly.
+                        new_locals['NestedDict'] = NestedDict
+                        fn_gen.add_line('paths = NestedDict()')
+                        conditional_assigns = path_assigns
                     else:
-                        fn_gen.add_line(line)
+                        conditional_assigns = []
+                        for (name, path, string) in path_assigns:
+                            if name in name_to_skip_condition:
+                                conditional_assigns.append((name, path, string))
+                            else:
+                                node = path_tree
+                                for p in path[:-1]:
+                                    node = node.setdefault(p, {})
+                                node[path[-1]] = string
+                        fn_gen.add_line(f'paths = {_dict_literal(path_tree)}')
+
+                    for (name, path, string) in conditional_assigns:
+                        line = f'{_alias_path_lvalue(path, path_tree)} = {string}'
+                        if (condition := name_to_skip_condition.get(name)) is not None:
+                            fn_gen.add_line(f'v1 = o.{name}')
+                            with fn_gen.if_(condition.format('v1')):
+                                fn_gen.add_line(line)
+                        else:
+                            fn_gen.add_line(line)
 
                 # Add required dataclass field assignments
                 fn_gen.add_line('result = {')
@@ -1063,6 +1336,8 @@ def dump_func_for_dataclass(
 
                 # Add default (optional) dataclass field assignments
                 for (name, key, default_name, lvalue, rvalue) in default_assigns:
+                    if type(lvalue) is tuple:  # AliasPath(...)
+                        lvalue = _alias_path_lvalue(lvalue, path_tree)
                     var_name = 'v1'
                     if rvalue == var_name:  # and default_name is not ExplicitNull:
                         var_name = rvalue = f'o.{name}'
@@ -1104,7 +1379,7 @@ def dump_func_for_dataclass(
         else:
             fn_gen.add_line('result = {}')
 
-        if has_catch_all:
+        if has_catch_all and is_selected(catch_all_name_stripped, catch_all_name):
             # noinspection PyUnresolvedReferences,PyProtectedMember
             # TODO
             from dataclasses import (
@@ -1125,16 +1400,44 @@ def dump_func_for_dataclass(
                     fn_gen.globals['__asdict_inner__'] = __dataclasses_asdict_inner__
                     fn_gen.add_line('result[k] = __asdict_inner__(v,dict_factory)')
 
-        with fn_gen.if_('exclude'):
-            with fn_gen.for_('k in exclude'):
-                fn_gen.add_line('result.pop(k, None)')
+        if projection is not None and has_catch_all:
+            for k in exclude_rest:
+                fn_gen.add_line(f'result.pop({k!r}, None)')
 
         if has_paths:
             fn_gen.add_line('result.update(paths)')
 
         # Now pass the arguments to the dict_factory method, and return
         # the new dict_factory instance.
-        fn_gen.add_line('return result if dict_factory is dict else dict_factory(result)')
+        fn_gen.add_line(ret_line)
+
+    if is_main_class and with_list:
+        # The dump function for a list of instances: this is the same code
+        # as above, inlined in the body of a `for` loop, which saves a
+        # function call (and the keyword arguments of `asdict`) per item.
+
+        with fn_gen.function(list_fn_name, [
+            'lst',
+            'dict_factory=dict',
+            f'skip_defaults:bool={skip_defaults}',
+        ], MISSING, new_locals):
+            fn_gen.add_line('out = []')
+            fn_gen.add_line('append = out.append')
+            if has_defaults:
+                fn_gen.add_line(defaults_line)
+
+            with fn_gen.for_('o in lst'):
+                for line in fn_gen.functions[fn_name]['code'].split('\n'):
+                    # `exclude` / `include` are not supported, and
+                    # `add_defaults` is set once, before the loop.
+                    if line.strip() in (f'if {projected_check}:', projected_line, defaults_line):
+                        continue
+                    if line.endswith(ret_line):
+                        line = line.replace(ret_line, f"append({ret_line.removeprefix('return ')})")
+                    # strip the function-level indent
+                    fn_gen.add_line(line[2:])
+
+            fn_gen.add_line('return out')
 
     # Save the dump function for the main dataclass, so we don't need to run
     # this logic each time.
@@ -1144,6 +1447,9 @@ def dump_func_for_dataclass(
 
         cls_todict = functions[fn_name]
 
+        if projection is not None:
+            return cls_todict
+
         # Check if the class has a `to_dict`, and it's
         # a class method bound to `todict`.
         if getattr(cls, 'to_dict', None) is asdict:
@@ -1159,9 +1465,238 @@ def dump_func_for_dataclass(
             "setattr(%s, '__%s_to_dict__', %s)",
             cls_name, PACKAGE_NAME, fn_name)
 
+        if with_list:
+            set_new_attribute(
+                cls, '__dataclass_wizard_to_list__',
+                functions[list_fn_name], force=True)
+            LOG.debug(
+                "setattr(%s, '__%s_to_list__', %s)",
+                cls_name, PACKAGE_NAME, list_fn_name)
+
         return cls_todict
 
 
+@setup_recursive_safe_function(
+    prefix='json',
+    fn_name=f'__{PACKAGE_NAME}_to_json_{{cls_name}}__')
+def _json_from_dataclass(tp: TypeInfo, extras: Extras):
+    dump_json_func_for_dataclass(tp.origin, extras)
+
+
+def dump_json_func_for_dataclass(
+    cls: type,
+    extras: Extras | None = None,
+    dumper_cls=DumpMixin,
+    base_meta_cls: type = AbstractMeta,
+) -> Callable[[T], str] | None:
+    """
+    Generate a function to encode a dataclass instance directly as JSON
+    text, with the same output as ``json.dumps(asdict(o))``, but without
+    building the (nested) dictionaries in between.
+
+    Classes which use `AliasPath`, a catch-all field, or skip conditions
+    (`skip_defaults`, `skip_if`, `SkipIf`) are encoded from the result of
+    their `to_dict` function instead.
+    """
+    cls_fields = dataclass_fields(cls)
+
+    # Get the dumper for the class, or create a new one as needed.
+    cls_dumper = get_dumper(cls, base_cls=dumper_cls)
+
+    cls_name = cls.__name__
+
+    fn_name = f'__{PACKAGE_NAME}_to_json_{cls_name}__'
+
+    # Get the meta config for the class, or the default config otherwise.
+    meta = get_meta(cls, base_meta_cls)
+
+    if extras is None:  # we are being run for the main dataclass
+        is_main_class = True
+
+        config: META = meta if meta.recursive else base_meta_cls
+
+        fn_gen = FunctionBuilder()
+
+        new_locals = {
+            'cls': cls,
+            'fields': cls_fields,
+        }
+
+        # noinspection PyTypeChecker
+        extras: Extras = {
+            'config': config,
+            'cls': cls,
+            'cls_name': cls_name,
+            'locals': new_locals,
+            'recursion_guard': {('json', cls): fn_name},
+            'fn_gen': fn_gen,
+        }
+
+        _globals = {
+            'MISSING': MISSING,
+            'ParseError': ParseError,
+            'raise_missing_fields': check_and_raise_missing_fields,
+            're_raise': re_raise,
+        }
+
+    # we are being run for a nested dataclass
+    else:
+        is_main_class = False
+
+        config = extras['config']
+        fn_gen = extras['fn_gen']
+
+        if config is not base_meta_cls:
+            # we want to apply the meta config from the main dataclass
+            # recursively.
+            meta = meta | config
+            meta.bind_to(cls, is_default=False)
+
+        new_locals = extras['locals']
+        new_locals['fields'] = cls_fields
+
+        extras['cls'] = cls
+        extras['cls_name'] = cls_name
+
+    key_case: KeyCase | None = cls_dumper.transform_dataclass_field
+
+    if key_case is KeyCase.AUTO:
+        key_case = None
+
+    field_to_alias = resolve_dataclass_field_to_alias_for_dump(cls)
+
+    hooks = cls_dumper.__HOOKS__
+    type_hooks = config.type_to_dump_hook
+
+    def is_plain_dataclass(tp) -> bool:
+        # a dataclass with no custom dump hook
+        return (is_dataclass(tp) and isinstance(tp, type)
+                and tp not in hooks
+                and (type_hooks is None or tp not in type_hooks))
+
+    def json_call(tp, val_name) -> str:
+        return _json_from_dataclass(
+            TypeInfo(tp, name=tp.__name__, val_name=val_name), extras)
+
+    def field_json_expr(f: Field, i: int) -> str:
+        var = f'o.{f.name}'
+        tp = f.type = eval_forward_ref_if_needed(f.type, cls)
+
+        optional = False
+        if is_union(get_origin_v2(tp)):
+            args = get_args(tp)
+            if len(args) == 2 and NoneType in args:
+                optional = True
+                tp = args[0] if args[1] is NoneType else args[1]
+
+        if is_plain_dataclass(tp):
+            if not optional:
+                return json_call(tp, var)
+            return f"'null' if (v1 := {var}) is None else {json_call(tp, 'v1')}"
+
+        if (get_origin_v2(tp) is list
+                and len(args := get_args(tp)) == 1
+                and is_plain_dataclass(elem_tp := args[0])):
+            if not optional:
+                return f"'[' + ', '.join([{json_call(elem_tp, 'x1')} for x1 in {var}]) + ']'"
+            return (f"'null' if (v1 := {var}) is None else "
+                    f"'[' + ', '.join([{json_call(elem_tp, 'x1')} for x1 in v1]) + ']'")
+
+        string = generate_field_code(cls_dumper, extras, f, i, var)
+        if string != var:
+            return f'_encode_json({string})'
+
+        # the dumped value is the field value (e.g. `str` or `int`)
+        if (template := _JSON_SCALAR_EXPRS.get(tp)) is None:
+            return f'_encode_json({var})'
+        if not optional:
+            return template.format(w=f'(v1 := {var})', v='v1')
+        return f"'null' if (v1 := {var}) is None else {template.format(w='v1', v='v1')}"
+
+    new_locals['_encode_json'] = _encode_json
+    new_locals['_json_str'] = encode_basestring_ascii
+
+    with fn_gen.function(fn_name, ['o'], MISSING, new_locals):
+
+        if (CATCH_ALL in field_to_alias
+                or DATACLASS_FIELD_TO_ALIAS_PATH_FOR_DUMP[cls]
+                or dataclass_field_to_skip_if(cls)
+                or meta.skip_defaults
+                or meta.skip_if
+                or meta.skip_defaults_if):
+            string = cls_dumper.dump_dispatcher_for_annotation(
+                TypeInfo(cls, val_name='o'), extras)
+            fn_gen.add_line(f'return _encode_json({string})')
+
+        else:
+            if (_pre_to_dict := getattr(cls, '_pre_to_dict', None)) is not None:
+                new_locals['__pre_to_dict__'] = _pre_to_dict
+                fn_gen.add_line('o = __pre_to_dict__(o)')
+
+            # Same order as `to_dict`: fields without a default come first.
+            required_fields, default_fields = [], []
+            for i, f in enumerate(cls_fields):
+                if f.default is MISSING and f.default_factory is MISSING:
+                    required_fields.append((i, f))
+                else:
+                    default_fields.append((i, f))
+
+            # Interleave key (and separator) literals with the values, e.g.
+            # `'{"a": '`, `j0`, `', "b": '`, ..., `'}'`; each value is set
+            # in its own statement (with the field name), so that an error
+            # is reported for the right field.
+            parts = []
+            assigns = []
+            literal = '{'
+            for i, f in required_fields + default_fields:
+                name = f.name
+                if (key := field_to_alias.get(name)) is not None:
+                    # skip serialization for field, e.g. `Alias(..., skip=True)`
+                    if key is ExplicitNull:
+                        continue
+                elif key_case is None:
+                    key = name
+                else:
+                    key = key_case(name)
+
+                if parts:
+                    literal += ', '
+                literal += f'{encode_basestring_ascii(key)}: '
+                parts.append(repr(literal))
+                var = f'j{len(assigns)}'
+                assigns.append(f'field={name!r}; {var} = {field_json_expr(f, i)}')
+                parts.append(var)
+                literal = ''
+
+            literal += '}'
+
+            if not parts:
+                fn_gen.add_line(f'return {literal!r}')
+            else:
+                parts.append(repr(literal))
+                with fn_gen.try_():
+                    fn_gen.add_lines(*assigns)
+
+                with fn_gen.except_(Exception, 'e', ParseError):
+                    fn_gen.add_line('re_raise(e, cls, o, fields, field, getattr(o, field, None))')
+
+                fn_gen.add_line(f"return ''.join(({', '.join(parts)}))")
+
+    if is_main_class:
+        # noinspection PyUnboundLocalVariable
+        functions = fn_gen.create_functions(_globals)
+
+        cls_tojson = functions[fn_name]
+
+        set_new_attribute(
+            cls, '__dataclass_wizard_to_json__', cls_tojson)
+        LOG.debug(
+            "setattr(%s, '__%s_to_json__', %s)",
+            cls_name, PACKAGE_NAME, fn_name)
+
+        return cls_tojson
+
+
 def generate_field_code(cls_dumper: DumpMixin,
                         extras: Extras,
                         field: Field,
@@ -1250,10 +1785,98 @@ def get_dumper(class_or_instance=None, create=True,
             CLASS_TO_DUMPER, class_or_instance, base_cls)
 
 
+def get_dump_func(cls: type[T]) -> Callable[..., JSONObject]:
+    """
+    Return the dump function for a dataclass, generating it if needed.
+
+    This is single-flight: if several threads need the dump function for a
+    class at once, only the first one generates it, and the others wait for
+    (and then use) the result.
+    """
+    with CODEGEN_LOCK:
+        fn = getattr(cls, '__dataclass_wizard_to_dict__', UNSET)
+
+        if fn is UNSET:
+            fn = dump_func_for_dataclass(cls)
+            cls.__dataclass_wizard_to_dict__ = fn  # explicit cache
+
+        return fn
+
+
+def get_dump_list_func(cls: type[T]) -> Callable[..., list[JSONObject]]:
+    """
+    Return the dump function for a list of instances (of a dataclass), which
+    generates the one for a single instance as well, if needed.
+
+    Like :func:`get_dump_func`, this is single-flight.
+    """
+    with CODEGEN_LOCK:
+        fn = getattr(cls, '__dataclass_wizard_to_list__', UNSET)
+
+        if fn is UNSET:
+            cls.__dataclass_wizard_to_dict__ = dump_func_for_dataclass(
+                cls, with_list=True)
+            fn = cls.__dataclass_wizard_to_list__
+
+        return fn
+
+
+def get_json_dump_func(cls: type[T]) -> Callable[[T], str]:
+    """
+    Return the function to encode a dataclass instance as JSON text,
+    generating it if needed.
+    """
+    with CODEGEN_LOCK:
+        fn = getattr(cls, '__dataclass_wizard_to_json__', UNSET)
+
+        if fn is UNSET:
+            fn = dump_json_func_for_dataclass(cls)
+            cls.__dataclass_wizard_to_json__ = fn  # explicit cache
+
+        return fn
+
+
+def get_projected_dump_func(cls: type[T],
+                            exclude: Collection[str] | None = None,
+                            include: Collection[str] | None = None,
+                            ) -> Callable[..., JSONObject]:
+    """
+    Return the dump function for a dataclass which skips the fields in
+    `exclude`, or only dumps the fields in `include`, generating it if
+    needed. Fields are matched by name or by their key in the output, and
+    either can be a dotted path for a nested dataclass, e.g. `owner.address`.
+
+    Up to `PROJECTION_CACHE_SIZE` functions are cached per dataclass.
+    """
+    key = (frozenset(exclude) if exclude else None,
+           None if include is None else frozenset(include))
+
+    funcs = per_cls(CLASS_TO_PROJECTED_DUMP_FUNCS, cls)
+
+    if (fn := funcs.get(key)) is not None:
+        return fn
+
+    with CODEGEN_LOCK:
+        if (fn := funcs.get(key)) is None:
+            # first, apply the Meta config to any nested dataclasses
+            get_dump_func(cls)
+
+            fn = dump_func_for_dataclass(cls, projection=key)
+
+            if len(funcs) >= PROJECTION_CACHE_SIZE:
+                # evict the oldest function
+                del funcs[next(iter(funcs))]
+
+            funcs[key] = fn
+
+        return fn
+
+
 def asdict(o: T,
            *, cls=None,
            dict_factory=dict,
            exclude: Collection[str] | None = None,
+           include: Collection[str] | None = None,
            **kwargs) -> JSONObject:
     # noinspection PyUnresolvedReferences
     """Return the fields of a dataclass instance as a new dictionary mapping
@@ -1281,15 +1904,47 @@ def asdict(o: T,
     The function applies recursively to field values that are
     dataclass instances. This will also look into built-in containers:
     tuples, lists, and dicts.
+
+    If given, the fields in 'exclude' are skipped, or only the fields in
+    'include' are dumped. Fields can be a dotted path for a nested
+    dataclass, e.g. ``exclude={'owner.address'}``.
     """
     cls = cls or type(o)
 
     try:
         return cls.__dataclass_wizard_to_dict__(
-            o, dict_factory, exclude, **kwargs)
+            o, dict_factory, exclude, include=include, **kwargs)
 
     except (AttributeError, TypeError):
-        fn = dump_func_for_dataclass(cls)
-        cls.__dataclass_wizard_to_dict__ = fn  # explicit cache
-        return fn(
-            o, dict_factory, exclude, **kwargs)
+        return get_dump_func(cls)(
+            o, dict_factory, exclude, include=include, **kwargs)
+
+
+def asdict_many(instances: Iterable[T],
+                cls: type[T] | None = None,
+                dict_factory=dict) -> list[JSONObject]:
+    """
+    Converts a list of dataclass instances to a list of Python dictionary
+    objects.
+
+    This is the same as ``[asdict(o, cls=cls) for o in instances]``, but the
+    dump code for the dataclass is inlined in the body of a single loop.
+
+    :param instances: An iterable of instances of the same dataclass.
+    :param cls: The dataclass type; defaults to the type of the first
+      instance, in which case `instances` needs to be a sequence.
+    :param dict_factory: Used instead of the built-in `dict`, as with
+      :func:`asdict`.
+    :return: The list of dictionaries, in the same order as `instances`.
+    """
+    if cls is None:
+        if not instances:
+            return []
+        cls = type(instances[0])
+
+    dump = getattr(cls, '__dataclass_wizard_to_list__', UNSET)
+
+    if dump is UNSET:
+        dump = get_dump_list_func(cls)
+
+    return dump(instances, dict_factory)
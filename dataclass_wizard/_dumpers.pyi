@@ -1,5 +1,5 @@
 import datetime
-from collections.abc import Collection
+from collections.abc import Collection, Iterable
 from dataclasses import Field
 from types import EllipsisType
 from typing import Any, Callable, ClassVar, TypeVar
@@ -31,6 +31,7 @@ from ._type_def import T as T
 from ._type_utils import create_new_class as create_new_class
 from ._type_utils import is_subclass_safe as is_subclass_safe
 from .enums import DateTimeTo as DateTimeTo
+from .enums import TimedeltaTo as TimedeltaTo
 from .enums import KeyCase as KeyCase
 from .errors import JSONWizardError as JSONWizardError
 from .errors import MissingData as MissingData
@@ -139,8 +140,14 @@ class DumpMixin(BaseDumpHook):
     def dump_dispatcher_for_annotation(cls, tp, extras): ...
 def setup_default_dumper(cls: type[DumpMixin] = ...): ...
 def check_and_raise_missing_fields(_locals, o, cls, fields: tuple[Field, ...]): ...
-def dump_func_for_dataclass(cls: type, extras: Extras | None = ..., dumper_cls: type[DumpMixin] = ..., base_meta_cls: type = ...) -> Callable[[T], JSONObject] | str: ...
+def dump_func_for_dataclass(cls: type, extras: Extras | None = ..., dumper_cls: type[DumpMixin] = ..., base_meta_cls: type = ..., projection: tuple[frozenset[str] | None, frozenset[str] | None] | None = ..., with_list: bool = ...) -> Callable[[T], JSONObject] | str: ...
+def dump_json_func_for_dataclass(cls: type, extras: Extras | None = ..., dumper_cls: type[DumpMixin] = ..., base_meta_cls: type = ...) -> Callable[[T], str] | None: ...
 def generate_field_code(cls_dumper: DumpMixin, extras: Extras, field: Field, field_i: int, var_name: Incomplete | None = ...) -> str | TypeInfo: ...
 def re_raise(e, cls, o, fields, field, value): ...
 def get_dumper(class_or_instance: Incomplete | None = ..., create: bool = ..., base_cls: type[D] = ...) -> type[D]: ...
-def asdict(o: T, *, cls: Incomplete | None = ..., dict_factory: type[dict] = ..., exclude: Collection[str] | None = ..., **kwargs) -> JSONObject: ...
+def get_dump_func(cls: type[T]) -> Callable[..., JSONObject]: ...
+def get_dump_list_func(cls: type[T]) -> Callable[..., list[JSONObject]]: ...
+def get_json_dump_func(cls: type[T]) -> Callable[[T], str]: ...
+def get_projected_dump_func(cls: type[T], exclude: Collection[str] | None = ..., include: Collection[str] | None = ...) -> Callable[..., JSONObject]: ...
+def asdict(o: T, *, cls: Incomplete | None = ..., dict_factory: type[dict] = ..., exclude: Collection[str] | None = ..., include: Collection[str] | None = ..., **kwargs) -> JSONObject: ...
+def asdict_many(instances: Iterable[T], cls: type[T] | None = ..., dict_factory: type[dict] = ...) -> list[JSONObject]: ...
@@ -18,6 +18,7 @@ from typing import TYPE_CHECKING, Any, Callable
 from ._bases import AbstractEnvMeta
 from ._bases_meta import BaseEnvWizardMeta, EnvMeta, register_type
 from ._class_helper import (
+    CODEGEN_LOCK,
     DATACLASS_FIELD_TO_ALIAS_PATH_FOR_LOAD,
     call_meta_initializer_if_needed,
     resolve_dataclass_field_to_env_for_load,
@@ -104,11 +105,18 @@ class EnvWizard:
             return cls._init_subclass()
 
     def __init__(self, **kwargs):
-        __init_fn__ = load_func_for_dataclass(
-            self.__class__,
-            LoadMixin,
-            AbstractEnvMeta,
-        )
+        cls = self.__class__
+
+        with CODEGEN_LOCK:
+            # Check again, in case another thread generated the `__init__`
+            # while we were waiting on the lock.
+            if (__init_fn__ := cls.__init__) is EnvWizard.__init__:
+                __init_fn__ = load_func_for_dataclass(
+                    cls,
+                    LoadMixin,
+                    AbstractEnvMeta,
+                )
+
         __init_fn__(self, **kwargs)
 
     def __init_subclass__(cls,
@@ -69,6 +69,7 @@ class EnvWizard:
                 dict_factory=dict,
                 exclude: Collection[str] | None = None,
                 skip_defaults: bool | None = None,
+                include: Collection[str] | None = None,
                 ) -> JSONObject:
         """
         Converts the dataclass instance to a Python dictionary object that is
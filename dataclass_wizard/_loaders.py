@@ -2,20 +2,29 @@ from __future__ import annotations
 
 import collections.abc as abc
 import dataclasses
+import hashlib
 from base64 import b64decode
 from collections import defaultdict, deque
+from collections.abc import Collection
 from dataclasses import MISSING, Field, is_dataclass
 from datetime import date, datetime, time, timedelta
 from decimal import Decimal
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
+from types import MemberDescriptorType
 from typing import Any, Callable, Literal, NamedTuple, cast
 from uuid import UUID
 
 from ._bases import AbstractMeta, BaseLoadHook
 from ._class_helper import (
+    CLASS_TO_AUTO_KEY_CASE,
+    CLASS_TO_DATETIME_PARSE_CACHE,
     CLASS_TO_LOADER,
+    CLASS_TO_PROJECTED_LOAD_FUNCS,
+    CODEGEN_LOCK,
     DATACLASS_FIELD_TO_ALIAS_PATH_FOR_LOAD,
+    NESTED_LOAD_FUNCTIONS,
     resolve_dataclass_field_to_alias_for_load,
     set_class_loader,
 )
@@ -24,6 +33,7 @@ from ._decorators import (
     setup_recursive_safe_function,
     setup_recursive_safe_function_for_generic,
 )
+from ._dumpers import _projected_field_code, _split_projection, default_compare_expr
 from ._log import LOG
 from ._meta_cache import get_meta
 from ._models import LEAF_TYPES, Extras, TypeInfo
@@ -45,10 +55,19 @@ from ._type_def import (
     PyLiteralString,
     T,
 )
-from ._type_utils import create_new_class, is_subclass_safe
+from ._type_utils import create_new_class, is_subclass_safe, per_cls
 
 # noinspection PyUnresolvedReferences
-from .constants import _HOOKS, CATCH_ALL, PACKAGE_NAME, PY311_OR_ABOVE, TAG
+from .constants import (
+    _HOOKS,
+    CATCH_ALL,
+    PACKAGE_NAME,
+    PROJECTION_CACHE_SIZE,
+    PY310_OR_ABOVE,
+    PY311_OR_ABOVE,
+    SINGLE_PASS_MIN_FIELDS,
+    TAG,
+)
 from .enums import KeyAction, KeyCase
 from .errors import (
     JSONWizardError,
@@ -57,6 +76,7 @@ from .errors import (
     ParseError,
     UnknownKeysError,
 )
+from .models import CatchAll
 from .utils._dataclass_compat import (
     SEEN_DEFAULT,
     dataclass_fields,
@@ -65,7 +85,8 @@ from .utils._dataclass_compat import (
     dataclass_kw_only_init_field_names,
     set_new_attribute,
 )
-from .utils._function_builder import FunctionBuilder
+from .utils._auto_key_case import AutoKeyCase
+from .utils._function_builder import FunctionBuilder, called_function_name
 from .utils._object_path import safe_get
 from .utils._string_conv import possible_json_keys
 from .utils._typing_compat import (
@@ -79,6 +100,99 @@ from .utils._typing_compat import (
     is_union,
 )
 
+# Types which are loaded as-is with `trusted_input`: a JSON value is
+# already of one of these types.
+_TRUSTED_LEAF_TYPES = frozenset({NoneType, bool, int, float, str})
+
+
+def _is_trusted_leaf(arg, origin=None):
+    if origin is None:
+        origin = get_origin_v2(arg)
+    if is_union(origin):
+        return all(_is_trusted_leaf(a) for a in get_args(arg))
+    return (origin is Any
+            or origin is Literal
+            or origin in _TRUSTED_LEAF_TYPES)
+
+
+def _load_trusted(v, origin, args):
+    """
+    Return the code to load `v` for a leaf type or a container of leaf
+    types with `trusted_input`, which reuses the value in the input (or
+    passes it to the container type as-is); return None otherwise.
+    """
+    if origin is Any or origin is Literal or origin in _TRUSTED_LEAF_TYPES:
+        return v
+
+    if not args:
+        elem_types = ()
+    elif origin is dict:
+        # keys in JSON are always strings
+        if args[0] is not str:
+            return None
+        elem_types = args[1:]
+    elif origin is tuple:
+        # only a variadic tuple, e.g. `tuple[int, ...]`
+        if len(args) != 2 or args[1] is not ...:
+            return None
+        elem_types = args[:1]
+    else:
+        elem_types = args
+
+    if not all(_is_trusted_leaf(arg) for arg in elem_types):
+        return None
+
+    if origin is list or origin is dict:
+        return v
+
+    if origin is set or origin is frozenset or origin is tuple:
+        return f'{origin.__name__}({v})'
+
+    return None
+
+
+def _alias_path_prefixes(paths):
+    """
+    Return the prefixes shared by two or more of `paths` (each field's
+    `AliasPath`), ordered by length; only the longest prefix is kept for
+    the same group of paths, e.g. `('data', 'attrs')` and not `('data',)`
+    for `('data', 'attrs', 'x')` and `('data', 'attrs', 'y')`.
+    """
+    counts = {}
+    for path in paths:
+        for n in range(1, len(path)):
+            counts[path[:n]] = counts.get(path[:n], 0) + 1
+
+    shared = {p for p, count in counts.items() if count > 1}
+    for p in list(shared):
+        if len(p) > 1 and counts[p] == counts[p[:-1]]:
+            shared.discard(p[:-1])
+
+    return sorted(shared, key=len)
+
+
+def _datetime_parse_cache(tp, extras, tn, parse):
+    """
+    With `datetime_parse_cache_size` set, add an LRU-cached version of
+    `parse` (a function which parses a string to the date / time type of
+    `tp`) to the function locals, and return its name; otherwise, return
+    None.
+
+    The cache is shared by the fields of the same type in a dataclass.
+    """
+    maxsize = extras['config'].datetime_parse_cache_size
+    if not maxsize:
+        return None
+
+    caches = CLASS_TO_DATETIME_PARSE_CACHE.setdefault(extras['cls'], {})
+    cached = caches.get(tp.origin)
+    if cached is None or cached.cache_parameters()['maxsize'] != maxsize:
+        cached = caches[tp.origin] = lru_cache(maxsize)(parse)
+
+    name = f'__{tn}_parse_cached'
+    extras['locals'].setdefault(name, cached)
+    return name
+
 
 class LoadMixin(BaseLoadHook):
     """
@@ -189,8 +303,21 @@ class LoadMixin(BaseLoadHook):
 
     @staticmethod
     def load_to_enum(tp: TypeInfo, extras: Extras):
-        # alias: enum_cls(o)
-        return tp.wrap(tp.v(), extras)
+        # alias: (value_to_member(o) if o.__class__.__hash__ else None) or enum_cls(o)
+        #
+        # Look up the member in the enum's own (live) `_value2member_map_`,
+        # which skips `EnumMeta.__call__` for known values. A miss -- or a
+        # falsy member, such as `IntFlag(0)` -- falls back to the constructor,
+        # which takes care of aliases, `_missing_`, and `Flag` composites
+        # (the latter are then cached in the same map by the `enum` module).
+        # An unhashable value, such as a `list`, also falls back to the
+        # constructor, which raises the usual "is not a valid" error.
+        o = tp.v()
+        tn = tp.type_name(extras)
+        v2m = f'{tn}_v2m'
+        extras['locals'].setdefault(v2m, tp.origin._value2member_map_.get)
+
+        return f'({v2m}({o}) if {o}.__class__.__hash__ else None) or {tn}({o})'
 
     @staticmethod
     def load_to_uuid(tp: TypeInfo, extras: Extras):
@@ -558,6 +685,10 @@ class LoadMixin(BaseLoadHook):
         _locals['tag_key'] = tag_key
 
         dataclass_tag_to_lines: dict[str, list] = {}
+        # tag -> load function for the dataclass, filled in once the
+        # functions are created; this is a single lookup per object.
+        tag_to_load = {}
+        dataclass_tags = []
         has_dataclass = any(is_dataclass(a) for a in args)
 
         i = tp.i
@@ -584,6 +715,8 @@ class LoadMixin(BaseLoadHook):
 
         type_checks = []
         try_parse_at_end = []
+        # untagged dataclasses, which are picked by the keys in the object
+        has_untagged_dataclass = False
 
         for possible_tp in args:
 
@@ -615,11 +748,15 @@ class LoadMixin(BaseLoadHook):
 
                 if tag:
                     string = cls.load_dispatcher_for_annotation(tp_new, extras)
+                    dataclass_tags.append(tag)
 
-                    dataclass_tag_to_lines[tag] = [
-                        f'if tag == {tag!r}:',
-                        f'  return {string}'
-                    ]
+                    if (fn_name := called_function_name(string, tp_new.v())) is not None:
+                        fn_gen.exports.append((tag_to_load, tag, fn_name))
+                    else:
+                        dataclass_tag_to_lines[tag] = [
+                            f'if tag == {tag!r}:',
+                            f'  return {string}'
+                        ]
                     continue
 
                 elif not config.unsafe_parse_dataclass_in_union:
@@ -637,6 +774,12 @@ class LoadMixin(BaseLoadHook):
 
             string = cls.load_dispatcher_for_annotation(tp_new, extras)
 
+            if has_dataclass and is_dataclass(possible_tp):
+                # placeholder, replaced with the lines to load the dataclass
+                has_untagged_dataclass = True
+                type_checks.append((possible_tp, string, tp_new.v()))
+                continue
+
             try_parse_lines = [
                 'try:',
                 f'  return {string}',
@@ -663,7 +806,7 @@ class LoadMixin(BaseLoadHook):
 
             list_to_add.extend(try_parse_lines)
 
-        if dataclass_tag_to_lines:
+        if dataclass_tags:
 
             with fn_gen.try_():
                 fn_gen.add_line(f'tag = {v}[tag_key]')
@@ -673,6 +816,16 @@ class LoadMixin(BaseLoadHook):
 
             with fn_gen.else_():
 
+                if len(dataclass_tags) > len(dataclass_tag_to_lines):
+                    _locals['tag_to_load'] = tag_to_load
+
+                    with fn_gen.try_():
+                        fn_gen.add_line('tag_fn = tag_to_load[tag]')
+                    with fn_gen.except_multi(KeyError, TypeError):
+                        fn_gen.add_line('pass')
+                    with fn_gen.else_():
+                        fn_gen.add_line(f'return tag_fn({v})')
+
                 for lines in dataclass_tag_to_lines.values():
                     fn_gen.add_lines(*lines)
                 fn_gen.add_line(
@@ -681,11 +834,15 @@ class LoadMixin(BaseLoadHook):
                     f"{v},fields,'load',"
                     "input_tag=tag,"
                     "tag_key=tag_key,"
-                    f"valid_tags={list(dataclass_tag_to_lines)})"
+                    f"valid_tags={dataclass_tags})"
                 )
 
         fn_gen.add_line(f'tp = type({v})')
 
+        if has_untagged_dataclass:
+            type_checks = _with_untagged_dataclass_lines(
+                cls, type_checks, v, _locals, fn_gen)
+
         if type_checks:
             fn_gen.add_lines(*type_checks)
 
@@ -787,9 +944,16 @@ class LoadMixin(BaseLoadHook):
 
         if PY311_OR_ABOVE:
             _parse_iso_string = f'{__fromisoformat}({o})'
+            parse = tp_time.fromisoformat
         else:  # pragma: no cover
             _parse_iso_string = f"{__fromisoformat}({o}.replace('Z', '+00:00', 1))"
 
+            def parse(s, _fromisoformat=tp_time.fromisoformat):
+                return _fromisoformat(s.replace('Z', '+00:00', 1))
+
+        if (cached := _datetime_parse_cache(tp, extras, tn, parse)) is not None:
+            _parse_iso_string = f'{cached}({o})'
+
         return (f'{_parse_iso_string} if {o}.__class__ is str '
                 f'else __as_time({o}, {tn})')
 
@@ -828,6 +992,21 @@ class LoadMixin(BaseLoadHook):
         else:  # pragma: no cover
             _parse_iso_string = f"{_fromisoformat}({o}.replace('Z', '+00:00', 1))"
 
+        def parse(s,
+                  _fromisoformat=tp_date_or_datetime.fromisoformat,
+                  _fromtimestamp=name_to_func[_fromtimestamp],
+                  _is_date=cls is date):
+            if s.isdigit():
+                dt = _fromtimestamp(int(s), UTC)
+                return dt.date() if _is_date else dt
+            if not PY311_OR_ABOVE:  # pragma: no cover
+                s = s.replace('Z', '+00:00', 1)
+            return _fromisoformat(s)
+
+        if (cached := _datetime_parse_cache(tp, extras, tn, parse)) is not None:
+            return (f'{cached}({o}) if {o}.__class__ is str '
+                    f'else {_as_func}({o}, {_fromtimestamp}, UTC{_opt_cls})')
+
         return (f'({_fromtimestamp}(int({o}), UTC){_date_part} if {o}.isdigit() '
                 f'else {_parse_iso_string}) if {o}.__class__ is str '
                 f'else {_as_func}({o}, {_fromtimestamp}, UTC{_opt_cls})')
@@ -842,7 +1021,8 @@ class LoadMixin(BaseLoadHook):
 
     @staticmethod
     @setup_recursive_safe_function(
-        fn_name=f'__{PACKAGE_NAME}_from_dict_{{cls_name}}__')
+        fn_name=f'__{PACKAGE_NAME}_from_dict_{{cls_name}}__',
+        shared=NESTED_LOAD_FUNCTIONS)
     def load_to_dataclass(tp: TypeInfo, extras: Extras):
         load_func_for_dataclass(tp.origin, extras)
 
@@ -856,6 +1036,9 @@ class LoadMixin(BaseLoadHook):
         pre_decoder = config.pre_decoder
         type_hooks = config.type_to_load_hook
         leaf_handling_as_subclass = config.leaf_handling == 'issubclass'
+        # keys in JSON objects are always strings, so dict keys
+        # (prefixed with `k`) are still converted as usual
+        trusted_input = config.trusted_input and tp.prefix != 'k'
 
         # type_ann = tp.origin
         type_ann = eval_forward_ref_if_needed(tp.origin, extras['cls'])
@@ -932,6 +1115,10 @@ class LoadMixin(BaseLoadHook):
             load_hook = cls.load_to_union
             args = get_args(type_ann)
 
+            # all args in `Union[...]` are trusted leaf types
+            if trusted_input and _is_trusted_leaf(type_ann, origin):
+                return tp.v()
+
             # Special case for Optional[x], which is actually Union[x, None]
             if len(args) == 2 and NoneType in args:
                 new_tp = tp.replace(origin=args[0], args=None, name=None, val_name=None)
@@ -939,6 +1126,10 @@ class LoadMixin(BaseLoadHook):
 
                 string = cls.load_dispatcher_for_annotation(new_tp, extras)
 
+                # the value is loaded as-is, so `None` is as well
+                if string == new_tp.v():
+                    return string
+
                 return f'None if {cls.is_none(tp, extras)} else {string}'
 
         # -> Literal[X, Y, ...]
@@ -1020,6 +1211,11 @@ class LoadMixin(BaseLoadHook):
         tp.args = args
         tp.name = name
 
+        if (trusted_input
+                and (pre_decoder is None or origin in _TRUSTED_LEAF_TYPES)
+                and (string := _load_trusted(tp.v(), origin, args)) is not None):
+            return string
+
         if container_tp is None:
             container_tp = origin
 
@@ -1132,11 +1328,247 @@ def check_and_raise_missing_fields(
     ) from None
 
 
+def dataclass_json_keys(cls, loader_cls=LoadMixin):
+    """
+    Return the JSON keys for a dataclass (once its load function is
+    created) as a tuple of:
+
+      * A list with the possible keys for each *required* field; one of
+        the keys must be in an object, or loading it will fail.
+      * A set of all the keys which are mapped to a field.
+
+    Return None if the keys can't be known up front, for example if the
+    class has a `_pre_from_dict` hook.
+    """
+    if getattr(cls, '_pre_from_dict', None) is not None:
+        return None
+
+    key_case = get_loader(cls, base_cls=loader_cls).transform_json_field
+    field_to_aliases = resolve_dataclass_field_to_alias_for_load(cls)
+    field_to_paths = DATACLASS_FIELD_TO_ALIAS_PATH_FOR_LOAD[cls]
+
+    required = []
+    accepted = set()
+
+    for f in dataclass_init_fields(cls):
+        name = f.name
+
+        if f.type is CatchAll:
+            continue
+
+        if (keys := field_to_aliases.get(name)) is not None:
+            keys = tuple(keys)
+        elif (paths := field_to_paths.get(name)) is not None:
+            # the top-level key of each path
+            keys = tuple(dict.fromkeys(path[0] for path in paths))
+        elif key_case is None:
+            keys = (name, )
+        elif key_case is KeyCase.AUTO:
+            keys = (name, *possible_json_keys(name))
+        else:
+            keys = (key_case(name), )
+
+        accepted.update(keys)
+
+        if f.default is MISSING and f.default_factory is MISSING:
+            required.append(keys)
+
+    return required, accepted
+
+
+def _with_untagged_dataclass_lines(loader_cls, type_checks, v, _locals, fn_gen):
+    """
+    Replace the untagged dataclasses in `type_checks` -- placeholders of
+    `(dataclass, load string, arg)` -- with the lines to load them.
+
+    Rather than try to load an object as each dataclass in turn, a dataclass
+    is only tried if the object has a key for each of its required fields,
+    so a miss costs a few `in` checks rather than a raised error.
+
+    If each dataclass in a run (with no other types between them) has a
+    required key of its own, the object's keys are also matched against
+    those in a single step; if only one is found, the load function is
+    looked up by the key, and otherwise the checks above are used.
+    """
+    lines = []
+    run = []
+
+    def add_run():
+        keys_for = [dataclass_json_keys(dataclass, loader_cls)
+                    for dataclass, _, _ in run]
+
+        if len(run) > 1 and (
+                key_to_fn_name := _key_to_fn_name(run, keys_for)) is not None:
+            n = len(_locals)
+            key_to_load = {}
+            _locals[f'sig_keys{n}'] = frozenset(key_to_fn_name)
+            _locals[f'key_to_load{n}'] = key_to_load
+            for key, fn_name in key_to_fn_name.items():
+                fn_gen.exports.append((key_to_load, key, fn_name))
+
+            lines.extend([
+                'if tp is dict:',
+                f'  sig = {v}.keys() & sig_keys{n}',
+                '  if len(sig) == 1:',
+                '    try:',
+                f'      return key_to_load{n}[sig.pop()]({v})',
+                '    except Exception:',
+                '      pass',
+                '  elif sig:',
+            ])
+            for (_, string, _), (required, _) in zip(run, keys_for):
+                lines.extend(_try_load_lines(
+                    string, _keys_in(required, v), indent='    '))
+
+            lines.append('else:')
+            for _, string, _ in run:
+                lines.extend(_try_load_lines(string, indent='  '))
+
+        else:
+            for (_, string, _), keys in zip(run, keys_for):
+                if keys is not None and keys[0]:
+                    condition = f'tp is not dict or {_keys_in(keys[0], v)}'
+                else:
+                    condition = None
+                lines.extend(_try_load_lines(string, condition))
+
+        run.clear()
+
+    for line in type_checks:
+        if isinstance(line, tuple):
+            run.append(line)
+            continue
+        if run:
+            add_run()
+        lines.append(line)
+
+    if run:
+        add_run()
+
+    return lines
+
+
+def _key_to_fn_name(run, keys_for):
+    """
+    Return a mapping of a distinguishing key to the load function name for
+    each dataclass in `run`: a required key, which is not used for any of
+    the other dataclasses; return None if one of them has no such key.
+    """
+    key_to_fn_name = {}
+
+    for i, ((_, string, arg), keys) in enumerate(zip(run, keys_for)):
+        if keys is None or (fn_name := called_function_name(string, arg)) is None:
+            return None
+
+        single_keys = [k[0] for k in keys[0]
+                       if len(k) == 1 and k[0] not in key_to_fn_name]
+        if not single_keys:
+            return None
+
+        # prefer a key which isn't mapped to a field in the other dataclasses
+        others = [keys_for[j][1] for j in range(len(run)) if j != i]
+        key = next((k for k in single_keys
+                    if not any(k in accepted for accepted in others)),
+                   single_keys[0])
+
+        key_to_fn_name[key] = fn_name
+
+    return key_to_fn_name
+
+
+def _keys_in(required, v):
+    return ' and '.join(
+        f'{keys[0]!r} in {v}' if len(keys) == 1
+        else '(' + ' or '.join(f'{k!r} in {v}' for k in keys) + ')'
+        for keys in required)
+
+
+def _try_load_lines(string, condition=None, indent=''):
+    lines = [
+        'try:',
+        f'  return {string}',
+        'except Exception:',
+        '  pass',
+    ]
+    if condition:
+        lines = [f'if {condition}:', *(f'  {line}' for line in lines)]
+
+    return [f'{indent}{line}' for line in lines]
+
+
+# The name the `__init__` generated by `dataclass` is compiled with, as it's
+# defined in a `__create_fn__` helper function.
+_DATACLASS_INIT_COMPILED_QUALNAME = '__create_fn__.<locals>.__init__'
+
+
+def _has_dataclass_init(cls):
+    """
+    Return True if `cls` has the `__init__` generated by `dataclass`, and
+    no `InitVar` field; the parameters of `__init__` are then the fields.
+
+    Any `__init__` compiled from `exec`'d source has a `<string>` filename,
+    so the generated one is told apart by the name it was compiled with, and
+    its `__qualname__` (which `dataclass` sets to that of a method).
+    """
+    init = cls.__dict__.get('__init__')
+    code = getattr(init, '__code__', None)
+
+    if (not cls.__dataclass_params__.init
+            or code is None
+            or code.co_filename != '<string>'
+            or any(f._field_type is dataclasses._FIELD_INITVAR
+                   for f in cls.__dataclass_fields__.values())):
+        return False
+
+    if not PY310_OR_ABOVE:
+        # `dataclass` doesn't set the `__qualname__` in Python 3.9
+        return init.__qualname__ == _DATACLASS_INIT_COMPILED_QUALNAME
+
+    if init.__qualname__ != f'{cls.__qualname__}.__init__':
+        return False
+
+    if PY311_OR_ABOVE:
+        return code.co_qualname == _DATACLASS_INIT_COMPILED_QUALNAME
+
+    # Python 3.10 doesn't record the name the code was compiled with; the
+    # generated `__init__` is annotated with the field types instead.
+    return init.__annotations__ == {
+        **{f.name: f.type for f in dataclass_init_fields(cls)},
+        'return': None,
+    }
+
+
+def _field_setters(cls, fields):
+    """
+    Return a mapping of each field name to the `__set__` method of its slot,
+    or None if the field is set in the instance `__dict__`, to create an
+    instance of `cls` without calling `__init__`; return None if that is
+    not possible.
+    """
+    if cls.__new__ is not object.__new__:
+        return None
+
+    has_dict = hasattr(object.__new__(cls), '__dict__')
+    field_to_setter = {}
+
+    for f in fields:
+        if isinstance(slot := getattr(cls, f.name, None), MemberDescriptorType):
+            field_to_setter[f.name] = slot.__set__
+        elif has_dict:
+            field_to_setter[f.name] = None
+        else:
+            return None
+
+    return field_to_setter
+
+
 def load_func_for_dataclass(
     cls: type,
     extras: Extras | None = None,
     loader_cls=LoadMixin,
     base_meta_cls: type = AbstractMeta,
+    with_list: bool = False,
+    projection: frozenset[str] | None = None,
 ) -> Callable[[JSONObject], T] | None:
     # Tuple describing the fields of this dataclass.
     fields = dataclass_fields(cls)
@@ -1151,10 +1583,19 @@ def load_func_for_dataclass(
     cls_name = cls.__name__
 
     fn_name = f'__{PACKAGE_NAME}_from_dict_{cls_name}__'
+    list_fn_name = f'__{PACKAGE_NAME}_from_list_{cls_name}__'
 
     # Get the meta config for the class, or the default config otherwise.
     meta = get_meta(cls, base_meta_cls)
 
+    if projection is not None:
+        # A load function specialized for `only`, which only looks up and
+        # loads the selected fields.
+        only_names, nested_only = _split_projection(projection)
+        sig_hash = hashlib.blake2s(
+            repr(sorted(projection)).encode('utf-8'), digest_size=6).hexdigest()
+        fn_name = f'__{PACKAGE_NAME}_from_dict_{cls_name}_{sig_hash}__'
+
     if extras is None:  # we are being run for the main dataclass
         is_main_class = True
 
@@ -1240,7 +1681,19 @@ def load_func_for_dataclass(
 
     on_unknown_key = meta.on_unknown_key
 
-    catch_all_field: str | None = field_to_aliases.pop(CATCH_ALL, None)
+    catch_all_field: str | None = field_to_aliases.get(CATCH_ALL)
+
+    if projection is not None:
+        # unknown keys are expected, as most keys are not looked up; and
+        # the catch-all field is not loaded.
+        selected = only_names | nested_only.keys()
+        if unknown := selected.difference(cls_init_field_names):
+            raise ValueError(
+                f'Unknown field(s) in `only` for {cls_name}: {sorted(unknown)!r}')
+        if catch_all_field is not None:
+            selected.discard(catch_all_field.rstrip('?'))
+        on_unknown_key = catch_all_field = None
+
     has_catch_all = catch_all_field is not None
 
     if has_catch_all:
@@ -1272,29 +1725,137 @@ def load_func_for_dataclass(
             aliases = {meta.tag_key}
         else:
             aliases = set()
-
-        new_locals['aliases'] = aliases
     else:
         aliases = None
 
     if has_alias_paths:
         new_locals['safe_get'] = safe_get
 
+        # Fields with a single `AliasPath` are looked up with inline
+        # subscripts, e.g. `o['data']['attrs']['x']`; a prefix shared by
+        # several of those is looked up once, into a local variable.
+        prefix_to_var = {}
+        for j, prefix in enumerate(_alias_path_prefixes(
+                [tuple(paths[0]) for name, paths in field_to_paths.items()
+                 if len(paths) == 1
+                 and (projection is None or name in selected)])):
+            prefix_to_var[prefix] = f'path_{j}__'
+
+        def path_expr(path) -> str:
+            path = tuple(path)
+            for n in range(len(path) - 1, 0, -1):
+                if (var := prefix_to_var.get(path[:n])) is not None:
+                    return var + ''.join(f'[{p!r}]' for p in path[n:])
+            return 'o' + ''.join(f'[{p!r}]' for p in path)
+
+    # With `load_case='AUTO'`, learn the key casing of the input for the
+    # fields which don't have an alias.
+    if (auto_key_case
+            and (learn_after := meta.load_case_learn_after)
+            and projection is None):
+        auto_key_case_fields = tuple(
+            f.name for f in cls_init_fields
+            if f.name not in field_to_aliases and f.name not in field_to_paths)
+    else:
+        auto_key_case_fields = ()
+
+    if auto_key_case_fields:
+        learner = CLASS_TO_AUTO_KEY_CASE.get(cls)
+        if (learner is None
+                or learner.fields != auto_key_case_fields
+                or learner.threshold != learn_after):
+            learner = CLASS_TO_AUTO_KEY_CASE[cls] = AutoKeyCase(
+                auto_key_case_fields, learn_after)
+
+        new_locals['auto_key_case'] = learner
+        field_to_key_idx = {name: j for j, name in enumerate(auto_key_case_fields)}
+    else:
+        field_to_key_idx = None
+
+    # For a wide dataclass with a `CatchAll` field, match the keys in the
+    # input with a single pass over `o.items()`: each key is mapped to a slot
+    # in `vals`, and unknown keys are collected in the same pass. This
+    # replaces the count of keys found (`i`) and the second pass over `o`
+    # when it doesn't match.
+    #
+    # Each possible key of a field has its own slot, so the keys are still
+    # tried in the same order as with `o.get`.
+    #
+    # Note: with `on_unknown_key` alone, unknown keys are not expected, and
+    # the count of keys found is cheaper than a pass over `o`.
+    single_pass = (has_catch_all
+                   and not field_to_key_idx
+                   and len(cls_init_fields) >= SINGLE_PASS_MIN_FIELDS)
+
+    if single_pass:
+        pre_assign = ''
+        key_to_slot = {}
+        new_locals['get_slot'] = key_to_slot.get
+
+        def get_key(key: str) -> str:
+            if (slot := key_to_slot.get(key)) is None:
+                slot = key_to_slot[key] = len(key_to_slot)
+            return f'vals[{slot}]'
+
+    else:
+        if set_aliases:
+            new_locals['aliases'] = aliases
+
+        def get_key(key: str) -> str:
+            return f'o.get({key!r}, MISSING)'
+
+    # With `direct_construction`, the default value of a field missing in
+    # the input is set inline, rather than omitted from a dict of keyword
+    # arguments (`init_kwargs`) for `__init__`.
+    #
+    # For a frozen dataclass, each field would be set with a (slower)
+    # `object.__setattr__` in `__init__`. Instead, create the instance with
+    # `object.__new__`, and set each field in the instance `__dict__` (or
+    # through its slot).
+    direct = meta.direct_construction and _has_dataclass_init(cls)
+
+    if direct:
+        def default_of(f: Field) -> str:
+            return default_compare_expr(f, new_locals, f'dflt_{f.name}__')
+
+    if (direct
+            and cls.__dataclass_params__.frozen
+            and (field_to_setter := _field_setters(cls, fields)) is not None):
+        bypass_init = True
+        new_locals['new_instance'] = object.__new__
+    else:
+        bypass_init = False
+
     with fn_gen.function(fn_name, ['o'], MISSING, new_locals):
 
         if (_pre_from_dict := getattr(cls, '_pre_from_dict', None)) is not None:
             new_locals['__pre_from_dict__'] = _pre_from_dict
             fn_gen.add_line('o = __pre_from_dict__(o)')
 
+        if field_to_key_idx:
+            fn_gen.add_line('case_keys = auto_key_case.keys')
+
         # Need to create a separate dictionary to copy over the constructor
         # args, as we don't want to mutate the original dictionary object.
-        if has_defaults:
+        if has_defaults and not direct:
             fn_gen.add_line('init_kwargs = {}')
         if pre_assign:
             fn_gen.add_line('i = 0')
 
+        if single_pass:
+            fn_gen.add_line('vals = [MISSING] * num_slots')
+            fn_gen.add_line('unknown = {}')
+
+            with fn_gen.for_('k, v in o.items()'):
+                with fn_gen.if_('(j := get_slot(k)) is None'):
+                    fn_gen.add_line('unknown[k] = v')
+                with fn_gen.else_():
+                    fn_gen.add_line('vals[j] = v')
+
         args = []
         kwargs = []
+        # required fields, which are unbound (not passed in) when missing
+        required_vars = []
 
         if cls_init_fields:
 
@@ -1304,6 +1865,15 @@ def load_func_for_dataclass(
                     with fn_gen.if_(f'{meta.tag_key!r} in o'):
                         fn_gen.add_line('i+=1')
 
+                if has_alias_paths:
+                    # a prefix which can't be found is set to `MISSING`,
+                    # so looking up a path with it fails below.
+                    for prefix, var in prefix_to_var.items():
+                        with fn_gen.try_():
+                            fn_gen.add_line(f'{var} = {path_expr(prefix)}')
+                        with fn_gen.except_(Exception):
+                            fn_gen.add_line(f'{var} = MISSING')
+
                 val = 'v1'
                 _val_is_found = f'{val} is not MISSING'
                 for i, f in enumerate(cls_init_fields):
@@ -1315,6 +1885,21 @@ def load_func_for_dataclass(
                     )
                     val_is_found = _val_is_found
 
+                    if projection is not None and name not in selected:
+                        # not loaded: set to the default value, or else
+                        # to `MISSING` for a required field.
+                        if has_default and not direct:
+                            continue
+
+                        value = default_of(f) if has_default else 'MISSING'
+                        fn_gen.add_line(f'{var} = {value}')
+
+                        if name in cls_init_kw_only_field_names:
+                            kwargs.append(f'{name}={var}')
+                        else:
+                            args.append(var)
+                        continue
+
                     if (check_aliases
                         and (_aliases := field_to_aliases.get(name)) is not None):
 
@@ -1324,7 +1909,7 @@ def load_func_for_dataclass(
                             if set_aliases:
                                 aliases.add(alias)
 
-                            f_assign = f'field={name!r}; {val}=o.get({alias!r}, MISSING)'
+                            f_assign = f'field={name!r}; {val}={get_key(alias)}'
                         else:
                             f_assign = None
 
@@ -1333,7 +1918,7 @@ def load_func_for_dataclass(
                                 aliases.update(_aliases)
 
                             fn_gen.add_line(f'field={name!r}')
-                            condition = [f'({val} := o.get({alias!r}, MISSING)) is not MISSING'
+                            condition = [f'({val} := {get_key(alias)}) is not MISSING'
                                          for alias in _aliases]
 
                             val_is_found = '(' + '\n     or '.join(condition) + ')'
@@ -1348,7 +1933,14 @@ def load_func_for_dataclass(
                             if set_aliases:
                                 aliases.add(path[0])
 
-                            f_assign = f'field={name!r}; {val}=safe_get(o, {path!r}, {not has_default})'
+                            # if the lookup fails, `safe_get` walks the path
+                            # again, and returns `MISSING` or raises an error.
+                            f_assign = None
+                            fn_gen.add_line(f'field={name!r}')
+                            with fn_gen.try_():
+                                fn_gen.add_line(f'{val} = {path_expr(path)}')
+                            with fn_gen.except_(Exception):
+                                fn_gen.add_line(f'{val} = safe_get(o, {path!r}, {not has_default})')
                         else:
                             f_assign = None
                             fn_gen.add_line(f'field={name!r}')
@@ -1377,7 +1969,10 @@ def load_func_for_dataclass(
                         if set_aliases:
                             aliases.add(name)
 
-                        f_assign = f'field={name!r}; {val}=o.get(field, MISSING)'
+                        if single_pass:
+                            f_assign = f'field={name!r}; {val}={get_key(name)}'
+                        else:
+                            f_assign = f'field={name!r}; {val}=o.get(field, MISSING)'
 
                     elif auto_key_case:
                         f_assign = None
@@ -1391,12 +1986,23 @@ def load_func_for_dataclass(
                             aliases.update(_aliases)
 
                         fn_gen.add_line(f'field={name!r}')
-                        condition = [f'({val} := o.get(field, MISSING)) is not MISSING']
+                        if single_pass:
+                            condition = [f'({val} := {get_key(name)}) is not MISSING']
+                        else:
+                            condition = [f'({val} := o.get(field, MISSING)) is not MISSING']
                         for alias in _aliases:
-                            condition.append(f'({val} := o.get({alias!r}, MISSING)) is not MISSING')
+                            condition.append(f'({val} := {get_key(alias)}) is not MISSING')
 
                         val_is_found = '(' + '\n     or '.join(condition) + ')'
 
+                        if field_to_key_idx:
+                            # look up the key in the learned casing first
+                            j = field_to_key_idx[name]
+                            val_is_found = (
+                                f'(({val} := o.get(case_keys[{j}], MISSING)) is not MISSING'
+                                f'\n     or {val_is_found}'
+                                f'\n     and auto_key_case.found(o, {j}))')
+
                     else:
                         alias = key_case(name)
 
@@ -1406,14 +2012,27 @@ def load_func_for_dataclass(
                         if alias != name:
                             field_to_aliases[name] = (alias,)
 
-                        f_assign = f'field={name!r}; {val}=o.get({alias!r}, MISSING)'
-
-                    string = generate_field_code(cls_loader, extras, f, i)
+                        f_assign = f'field={name!r}; {val}={get_key(alias)}'
+
+                    if (projection is not None
+                            and name in nested_only
+                            and name not in only_names):
+                        string = _projected_field_code(
+                            f, i, None, cls,
+                            lambda tp: get_projected_load_func(tp, nested_only[name]),
+                            new_locals)
+                        if string is None:
+                            paths = sorted(f'{name}.{rest}' for rest in nested_only[name])
+                            raise ValueError(
+                                f'Field {name!r} of {cls_name} is not a dataclass '
+                                f'(or a list of them), for `only` path(s): {paths!r}')
+                    else:
+                        string = generate_field_code(cls_loader, extras, f, i)
 
                     if f_assign is not None:
                         fn_gen.add_line(f_assign)
 
-                    if has_default:
+                    if has_default and not direct:
                         with fn_gen.if_(val_is_found):
                             fn_gen.add_line(f'{pre_assign}init_kwargs[field] = {string}')
 
@@ -1426,20 +2045,54 @@ def load_func_for_dataclass(
                         with fn_gen.if_(val_is_found):
                             fn_gen.add_line(f'{pre_assign}{var} = {string}')
 
+                        if has_default:
+                            with fn_gen.else_():
+                                fn_gen.add_line(f'{var} = {default_of(f)}')
+                        else:
+                            required_vars.append(var)
+
             # create a broad `except Exception` block, as we will be
             # re-raising all exception(s) as a custom `ParseError`.
             with fn_gen.except_(Exception, 'e', ParseError):
                 fn_gen.add_line("re_raise(e, cls, o, fields, field, locals().get('v1'))")
 
-        if has_catch_all:
+        if single_pass:
+            # the other known keys (such as the tag key, or the first key
+            # of each alias path) are mapped to a slot which is not read.
+            for key in aliases:
+                get_key(key)
+
+            new_locals['num_slots'] = len(key_to_slot)
+
+            if catch_all_field.endswith('?') and not direct:  # Default value
+                with fn_gen.if_('unknown'):
+                    fn_gen.add_line(f'init_kwargs[{catch_all_field_stripped!r}] = unknown')
+            else:
+                var = f'__{catch_all_field_stripped}'
+                if catch_all_field.endswith('?'):
+                    default = default_of(cls.__dataclass_fields__[catch_all_field_stripped])
+                    fn_gen.add_line(f'{var} = unknown if unknown else {default}')
+                else:
+                    fn_gen.add_line(f'{var} = unknown')
+
+                if catch_all_field_stripped in cls_init_kw_only_field_names:
+                    kwargs.append(f'{catch_all_field_stripped}={var}')
+                else:
+                    args.insert(catch_all_idx, var)
+
+        elif has_catch_all:
             catch_all_def = '{k: o[k] for k in o if k not in aliases}'
 
-            if catch_all_field.endswith('?'):  # Default value
+            if catch_all_field.endswith('?') and not direct:  # Default value
                 with fn_gen.if_('len(o) != i'):
                     fn_gen.add_line(f'init_kwargs[{catch_all_field_stripped!r}] = {catch_all_def}')
             else:
                 var = f'__{catch_all_field_stripped}'
-                fn_gen.add_line(f'{var} = {{}} if len(o) == i else {catch_all_def}')
+                if catch_all_field.endswith('?'):
+                    default = default_of(cls.__dataclass_fields__[catch_all_field_stripped])
+                    fn_gen.add_line(f'{var} = {catch_all_def} if len(o) != i else {default}')
+                else:
+                    fn_gen.add_line(f'{var} = {{}} if len(o) == i else {catch_all_def}')
 
                 if catch_all_field_stripped in cls_init_kw_only_field_names:
                     kwargs.append(f'{catch_all_field_stripped}={var}')
@@ -1467,16 +2120,79 @@ def load_func_for_dataclass(
         # the new dataclass instance. If there are any missing fields,
         # we raise them here.
 
-        if has_defaults:
-            args.append('**init_kwargs')
-        if kwargs:
-            args.extend(kwargs)
-        with fn_gen.try_():
-            fn_gen.add_line(f'return cls({", ".join(args)})')
-        with fn_gen.except_(UnboundLocalError):
-            # raise `MissingFields`, as required dataclass fields
-            # are not present in the input object `o`.
-            fn_gen.add_line("raise_missing_fields(locals(), o, cls, fields)")
+        if bypass_init:
+            # fields in the instance `__dict__`, and fields with a slot
+            dict_lines = []
+            slot_lines = []
+
+            for j, f in enumerate(fields):
+                name = f.name
+                if f.init:
+                    value = f'__{name}'
+                elif f.default is not MISSING or f.default_factory is not MISSING:
+                    # not passed to `__init__`, but set to the default
+                    value = default_of(f)
+                else:
+                    continue
+
+                if (setter := field_to_setter[name]) is None:
+                    dict_lines.append(f'inst_dict[{name!r}] = {value}')
+                else:
+                    new_locals[f'set_{j}__'] = setter
+                    slot_lines.append(f'set_{j}__(self, {value})')
+
+            with fn_gen.try_():
+                fn_gen.add_line('self = new_instance(cls)')
+                if dict_lines:
+                    fn_gen.add_line('inst_dict = self.__dict__')
+                    fn_gen.add_lines(*dict_lines)
+                fn_gen.add_lines(*slot_lines)
+            with fn_gen.except_(UnboundLocalError):
+                fn_gen.add_line("raise_missing_fields(locals(), o, cls, fields)")
+
+            if hasattr(cls, '__post_init__'):
+                fn_gen.add_line('self.__post_init__()')
+
+            ret_line = 'return self'
+            fn_gen.add_line(ret_line)
+
+        else:
+            if has_defaults and not direct:
+                args.append('**init_kwargs')
+            if kwargs:
+                args.extend(kwargs)
+
+            ret_line = f'return cls({", ".join(args)})'
+
+            with fn_gen.try_():
+                fn_gen.add_line(ret_line)
+            with fn_gen.except_(UnboundLocalError):
+                # raise `MissingFields`, as required dataclass fields
+                # are not present in the input object `o`.
+                fn_gen.add_line("raise_missing_fields(locals(), o, cls, fields)")
+
+    if is_main_class and with_list:
+        # The load function for a list of dicts: this is the same code as
+        # above, inlined in the body of a `for` loop, which saves a function
+        # call (and lookup) per item.
+
+        with fn_gen.function(list_fn_name, ['lst'], MISSING, new_locals):
+            fn_gen.add_line('result = []')
+            fn_gen.add_line('append = result.append')
+
+            with fn_gen.for_('o in lst'):
+                for line in fn_gen.functions[fn_name]['code'].split('\n'):
+                    if line.endswith(ret_line):
+                        line = line.replace(ret_line, f"append({ret_line.removeprefix('return ')})")
+                    # strip the function-level indent
+                    fn_gen.add_line(line[2:])
+
+                # reset the required fields, so that a missing field in the
+                # next item is not set from the current one.
+                if required_vars:
+                    fn_gen.add_line(f'del {", ".join(required_vars)}')
+
+            fn_gen.add_line('return result')
 
     # Save the load function for the main dataclass, so we don't need to run
     # this logic each time.
@@ -1486,6 +2202,9 @@ def load_func_for_dataclass(
 
         cls_fromdict = functions[fn_name]
 
+        if projection is not None:
+            return cls_fromdict
+
         # Check if the class has a `from_dict`, and it's
         # a class method bound to `fromdict`.
         if ((from_dict := getattr(cls, 'from_dict', None)) is not None
@@ -1502,6 +2221,14 @@ def load_func_for_dataclass(
             "setattr(%s, '__%s_from_dict__', %s)",
             cls_name, PACKAGE_NAME, fn_name)
 
+        if with_list:
+            set_new_attribute(
+                cls, '__dataclass_wizard_from_list__',
+                functions[list_fn_name], force=True)
+            LOG.debug(
+                "setattr(%s, '__%s_from_list__', %s)",
+                cls_name, PACKAGE_NAME, list_fn_name)
+
         return cls_fromdict
 
 
@@ -1650,7 +2377,77 @@ def get_loader(class_or_instance=None,
             CLASS_TO_LOADER, class_or_instance, base_cls)
 
 
-def fromdict(cls: type[T], d: JSONObject) -> T:
+def get_load_func(cls: type[T]) -> Callable[[JSONObject], T]:
+    """
+    Return the load function for a dataclass, generating it if needed.
+
+    This is single-flight: if several threads need the load function for a
+    class at once, only the first one generates it, and the others wait for
+    (and then use) the result.
+    """
+    with CODEGEN_LOCK:
+        fn = getattr(cls, '__dataclass_wizard_from_dict__', UNSET)
+
+        if fn is UNSET:
+            fn = load_func_for_dataclass(cls)
+            cls.__dataclass_wizard_from_dict__ = fn  # explicit cache
+
+        return fn
+
+
+def get_load_list_func(cls: type[T]) -> Callable[[list[JSONObject]], list[T]]:
+    """
+    Return the load function for a list of dicts (for a dataclass), which
+    generates the one for a single dict as well, if needed.
+
+    Like :func:`get_load_func`, this is single-flight.
+    """
+    with CODEGEN_LOCK:
+        fn = getattr(cls, '__dataclass_wizard_from_list__', UNSET)
+
+        if fn is UNSET:
+            cls.__dataclass_wizard_from_dict__ = load_func_for_dataclass(
+                cls, with_list=True)
+            fn = cls.__dataclass_wizard_from_list__
+
+        return fn
+
+
+def get_projected_load_func(cls: type[T],
+                            only: Collection[str]) -> Callable[[JSONObject], T]:
+    """
+    Return the load function for a dataclass which only loads the fields in
+    `only`, generating it if needed. Fields are matched by name, and can be
+    a dotted path for a nested dataclass, e.g. `owner.name`; a `ValueError`
+    is raised for a name which doesn't match a field.
+
+    Up to `PROJECTION_CACHE_SIZE` functions are cached per dataclass.
+    """
+    key = frozenset(only)
+
+    funcs = per_cls(CLASS_TO_PROJECTED_LOAD_FUNCS, cls)
+
+    if (fn := funcs.get(key)) is not None:
+        return fn
+
+    with CODEGEN_LOCK:
+        if (fn := funcs.get(key)) is None:
+            # first, apply the Meta config to any nested dataclasses
+            get_load_func(cls)
+
+            fn = load_func_for_dataclass(cls, projection=key)
+
+            if len(funcs) >= PROJECTION_CACHE_SIZE:
+                # evict the oldest function
+                del funcs[next(iter(funcs))]
+
+            funcs[key] = fn
+
+        return fn
+
+
+def fromdict(cls: type[T], d: JSONObject,
+             only: Collection[str] | None = None) -> T:
     """
     Converts a Python dictionary object to a dataclass instance.
 
@@ -1666,14 +2463,22 @@ def fromdict(cls: type[T], d: JSONObject) -> T:
         >>> LoadMeta(key_transform='CAMEL').bind_to(MyClass)
         >>> fromdict(MyClass, {"myStr": "value"})
 
+    To only load some of the fields, pass their names in `only`; a nested
+    dataclass field can be given as a dotted path, e.g. `owner.name`. The
+    fields which are not loaded are set to their default value, or else to
+    ``dataclasses.MISSING``. The load function for each set of fields is
+    generated once, and cached; a ``ValueError`` is raised if a name (or a
+    part of a dotted path) doesn't match a field.
+
     """
+    if only is not None:
+        return get_projected_load_func(cls, only)(d)
+
     try:
         return cls.__dataclass_wizard_from_dict__(d)
 
     except (AttributeError, TypeError):
-        fn = load_func_for_dataclass(cls)
-        cls.__dataclass_wizard_from_dict__ = fn  # explicit cache
-        return fn(d)
+        return get_load_func(cls)(d)
 
 
 def fromlist(cls: type[T], list_of_dict: list[JSONObject]) -> list[T]:
@@ -1684,13 +2489,9 @@ def fromlist(cls: type[T], list_of_dict: list[JSONObject]) -> list[T]:
     dataclasses will likewise be initialized as expected.
 
     """
-    try:
-        load = cls.__dataclass_wizard_from_dict__
-    except AttributeError:
-        load = UNSET
+    load = getattr(cls, '__dataclass_wizard_from_list__', UNSET)
 
     if load is UNSET:
-        load = load_func_for_dataclass(cls)
-        cls.__dataclass_wizard_from_dict__ = load  # explicit cache
+        load = get_load_list_func(cls)
 
-    return [load(d) for d in list_of_dict]
+    return load(list_of_dict)
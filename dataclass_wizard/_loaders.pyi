@@ -1,3 +1,4 @@
+from collections.abc import Collection
 from dataclasses import Field
 from datetime import date, datetime, timezone
 from types import EllipsisType
@@ -152,9 +153,13 @@ class LoadMixin(BaseLoadHook):
     def load_dispatcher_for_annotation(cls, tp, extras): ...
 def setup_default_loader(cls: type[LoadMixin] = ...): ...
 def check_and_raise_missing_fields(_locals, o, cls, fields: tuple[Field, ...] | None, **kwargs): ...
-def load_func_for_dataclass(cls: type, extras: Extras | None = ..., loader_cls: type[LoadMixin] = ..., base_meta_cls: type = ...) -> Callable[[JSONObject], T] | None: ...
+def dataclass_json_keys(cls: type, loader_cls: type[LoadMixin] = ...) -> tuple[list[tuple[str, ...]], set[str]] | None: ...
+def load_func_for_dataclass(cls: type, extras: Extras | None = ..., loader_cls: type[LoadMixin] = ..., base_meta_cls: type = ..., with_list: bool = ..., projection: frozenset[str] | None = ...) -> Callable[[JSONObject], T] | None: ...
 def generate_field_code(cls_loader: LoadMixin, extras: Extras, field: Field, field_i: int, var_name: Incomplete | None = ...) -> str | TypeInfo: ...
 def re_raise(e, cls, o, fields, field, value): ...
 def get_loader(class_or_instance: Incomplete | None = ..., create: bool = ..., base_cls: type[L] = ...) -> type[L]: ...
-def fromdict(cls: type[T], d: JSONObject) -> T: ...
+def get_load_func(cls: type[T]) -> Callable[[JSONObject], T]: ...
+def get_load_list_func(cls: type[T]) -> Callable[[list[JSONObject]], list[T]]: ...
+def get_projected_load_func(cls: type[T], only: Collection[str]) -> Callable[[JSONObject], T]: ...
+def fromdict(cls: type[T], d: JSONObject, only: Collection[str] | None = ...) -> T: ...
 def fromlist(cls: type[T], list_of_dict: list[JSONObject]) -> list[T]: ...
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections.abc import Mapping, Set as AbstractSet
 from weakref import WeakKeyDictionary
 
 from ._bases import AbstractMeta
@@ -25,6 +26,48 @@ def get_meta(cls, base_cls=AbstractMeta):
     return META_BY_DATACLASS.get(cls, base_cls)
 
 
+def _freeze(v):
+    """
+    Return a hashable form of the value `v`, which compares equal for an
+    equal value; raise a `TypeError` if there is none.
+    """
+    try:
+        hash(v)
+        return v
+    except TypeError:
+        pass
+
+    if isinstance(v, Mapping):
+        items = tuple((_freeze(k), _freeze(x)) for k, x in v.items())
+    elif isinstance(v, AbstractSet):
+        items = frozenset(map(_freeze, v))
+    elif isinstance(v, (list, tuple)):
+        items = tuple(map(_freeze, v))
+    else:
+        raise TypeError(f'unhashable type: {type(v).__name__!r}')
+
+    return v.__class__, items
+
+
+def meta_fingerprint(meta):
+    """
+    Return a hashable snapshot of the settings on a Meta config, which
+    identifies the code generated with it; return None if a setting can't
+    be made hashable.
+
+    Note that unhashable values (such as mappings) are compared by value.
+    """
+    values = [meta.all_fields]
+
+    for k in sorted(meta.all_fields):
+        try:
+            values.append(_freeze(getattr(meta, k, None)))
+        except TypeError:
+            return None
+
+    return tuple(values)
+
+
 def create_meta(cls, cls_name=None, **kwargs):
     """
     Create a Meta subclass for `cls` and store it in META_BY_DATACLASS.
@@ -49,5 +92,5 @@ def create_meta(cls, cls_name=None, **kwargs):
         cls_dict,
     )
 
-    META_BY_DATACLASS[cls] = meta
-    return meta
+    # `setdefault` so that concurrent callers all get the same Meta
+    return META_BY_DATACLASS.setdefault(cls, meta)
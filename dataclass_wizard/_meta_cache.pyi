@@ -23,6 +23,14 @@ def get_meta(cls: type, base_cls: type[_META]) -> type[_META]:
     """
     ...
 
+def meta_fingerprint(meta: type[META]) -> tuple | None:
+    """
+    Return a hashable snapshot of the settings on a Meta config, which
+    identifies the code generated with it; return None if a setting can't
+    be made hashable.
+    """
+    ...
+
 def create_meta(cls: type, cls_name: str | None = None, **kwargs) -> META:
     """
     Sets the Meta config for the :class:`AbstractJSONWizard` subclass.
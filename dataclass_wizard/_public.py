@@ -5,6 +5,7 @@ __all__ = [
     'EnvWizard',
     # Helper functions
     'asdict',
+    'asdict_many',
     'fromdict',
     'fromlist',
     'register_type',
@@ -19,7 +20,7 @@ __all__ = [
 ]
 
 from ._bases_meta import register_type
-from ._dumpers import asdict
+from ._dumpers import asdict, asdict_many
 from ._loaders import fromdict, fromlist
 from ._serial_json import DataclassWizard, JSONWizard
 from .env import EnvWizard
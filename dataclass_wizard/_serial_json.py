@@ -6,8 +6,8 @@ from dataclasses import MISSING, dataclass
 
 from ._bases_meta import BaseJSONWizardMeta, LoadMeta
 from ._class_helper import call_meta_initializer_if_needed
-from ._dumpers import asdict
-from ._loaders import fromdict, fromlist
+from ._dumpers import asdict, asdict_many, get_json_dump_func
+from ._loaders import fromdict, fromlist, get_load_func
 from ._log import enable_library_debug_logging
 from ._type_def import UNSET, dataclass_transform
 from .constants import PACKAGE_NAME
@@ -19,6 +19,11 @@ from .utils._dataclass_compat import (
     set_new_attribute,
     str_pprint_fn,
 )
+from .utils._json_stream import (
+    DEFAULT_CHUNK_SIZE,
+    DEFAULT_MAX_ELEMENT_SIZE,
+    iter_json_array,
+)
 
 
 def first_declared_attr_in_mro(cls, name):
@@ -39,7 +44,10 @@ def set_from_dict_and_to_dict_if_needed(cls):
     Defining defaults in `cls.__dict__` blocks that.
     """
     cls.__dataclass_wizard_from_dict__ = UNSET
+    cls.__dataclass_wizard_from_list__ = UNSET
     cls.__dataclass_wizard_to_dict__ = UNSET
+    cls.__dataclass_wizard_to_list__ = UNSET
+    cls.__dataclass_wizard_to_json__ = UNSET
 
     if 'from_dict' not in cls.__dict__:
         inherited = first_declared_attr_in_mro(cls, 'from_dict')
@@ -98,7 +106,10 @@ class DataclassWizard:
     __slots__ = ()
 
     __dataclass_wizard_from_dict__ = UNSET
+    __dataclass_wizard_from_list__ = UNSET
     __dataclass_wizard_to_dict__ = UNSET
+    __dataclass_wizard_to_list__ = UNSET
+    __dataclass_wizard_to_json__ = UNSET
 
     class Meta(BaseJSONWizardMeta):
 
@@ -118,6 +129,17 @@ class DataclassWizard:
 
         return fromdict(cls, o) if isinstance(o, dict) else fromlist(cls, o)
 
+    @classmethod
+    def iter_from_json(cls, string_or_stream, *,
+                       chunk_size=DEFAULT_CHUNK_SIZE,
+                       max_element_size=DEFAULT_MAX_ELEMENT_SIZE,
+                       **decoder_kwargs):
+
+        return map(get_load_func(cls),
+                   iter_json_array(string_or_stream, chunk_size,
+                                   max_element_size=max_element_size,
+                                   **decoder_kwargs))
+
     from_list = classmethod(fromlist)
 
     from_dict = classmethod(fromdict)
@@ -126,17 +148,25 @@ class DataclassWizard:
 
     def to_json(self, *,
                 encoder=json.dumps,
+                fast=False,
                 **encoder_kwargs):
 
+        if fast and encoder is json.dumps and not encoder_kwargs:
+            return get_json_dump_func(type(self))(self)
+
         return encoder(asdict(self), **encoder_kwargs)
 
     @classmethod
     def list_to_json(cls,
                      instances,
                      encoder=json.dumps,
+                     fast=False,
                      **encoder_kwargs):
 
-        list_of_dict = [asdict(o, cls=cls) for o in instances]
+        if fast and encoder is json.dumps and not encoder_kwargs:
+            return f"[{', '.join(map(get_json_dump_func(cls), instances))}]"
+
+        list_of_dict = asdict_many(instances, cls)
 
         return encoder(list_of_dict, **encoder_kwargs)
 
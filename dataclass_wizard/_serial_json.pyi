@@ -1,6 +1,7 @@
 import json
-from collections.abc import Collection
+from collections.abc import Collection, Iterator
 from typing import (
+    IO,
     Any,
     AnyStr,
     Callable,
@@ -106,6 +107,24 @@ class _JSONWizardMixin(AbstractJSONWizard, SerializerHookMixin):
         """
         ...
 
+    @classmethod
+    def iter_from_json(cls: type[W],
+                       string_or_stream: AnyStr | IO[str] | IO[bytes], *,
+                       chunk_size: int = ...,
+                       max_element_size: int | None = ...,
+                       **decoder_kwargs) -> Iterator[W]:
+        """
+        Incrementally decodes a JSON array -- from a `string`, or a text or
+        binary stream, read `chunk_size` at a time -- and yields an instance
+        of the dataclass for each element.
+
+        A :class:`json.JSONDecodeError` is raised if an element isn't
+        complete within `max_element_size` characters (unless it's None).
+
+        The keyword arguments are passed to :class:`json.JSONDecoder`.
+        """
+        ...
+
     @classmethod
     def from_list(cls: type[W], o: ListOfJSONObject) -> list[W]:
         """
@@ -124,6 +143,7 @@ class _JSONWizardMixin(AbstractJSONWizard, SerializerHookMixin):
                 dict_factory=dict,
                 exclude: Collection[str] | None = None,
                 skip_defaults: bool | None = None,
+                include: Collection[str] | None = None,
                 ) -> JSONObject:
         """
         Converts the dataclass instance to a Python dictionary object that is
@@ -144,15 +164,24 @@ class _JSONWizardMixin(AbstractJSONWizard, SerializerHookMixin):
         The function applies recursively to field values that are
         dataclass instances. This will also look into built-in containers:
         tuples, lists, and dicts.
+
+        If given, the fields in 'exclude' are skipped, or only the fields in
+        'include' are dumped. Fields can be a dotted path for a nested
+        dataclass, e.g. ``exclude={'owner.address'}``.
         """
         # alias: asdict(self)
         ...
 
     def to_json(self: W, *,
                 encoder: Encoder = json.dumps,
+                fast: bool = False,
                 **encoder_kwargs) -> str:
         """
         Converts the dataclass instance to a JSON `string` representation.
+
+        With `fast` enabled (and no custom `encoder` or `encoder_kwargs`),
+        the JSON text is generated directly from the instance, without
+        building the intermediate ``dict``; the output is the same.
         """
         ...
 
@@ -160,10 +189,13 @@ class _JSONWizardMixin(AbstractJSONWizard, SerializerHookMixin):
     def list_to_json(cls: type[W],
                      instances: list[W],
                      encoder: Encoder = json.dumps,
+                     fast: bool = False,
                      **encoder_kwargs) -> str:
         """
         Converts a ``list`` of dataclass instances to a JSON `string`
         representation.
+
+        See :meth:`to_json` for the `fast` parameter.
         """
         ...
 
@@ -177,10 +209,12 @@ class DataclassWizard(_JSONWizardMixin):
     def from_list(cls: type[W], o: ListOfJSONObject) -> list[W]: ...
     @classmethod
     def from_json(cls: type[W], string: AnyStr, *, decoder: Decoder = ..., **decoder_kwargs) -> W | list[W]: ...
-    def to_dict(self: W, *, dict_factory=..., exclude: Collection[str] | None = ..., skip_defaults: bool | None = ...) -> JSONObject: ...
-    def to_json(self: W, *, encoder: Encoder = ..., **encoder_kwargs) -> str: ...
     @classmethod
-    def list_to_json(cls: type[W], instances: list[W], encoder: Encoder = ..., **encoder_kwargs) -> str: ...
+    def iter_from_json(cls: type[W], string_or_stream: AnyStr | IO[str] | IO[bytes], *, chunk_size: int = ..., max_element_size: int | None = ..., **decoder_kwargs) -> Iterator[W]: ...
+    def to_dict(self: W, *, dict_factory=..., exclude: Collection[str] | None = ..., skip_defaults: bool | None = ..., include: Collection[str] | None = ...) -> JSONObject: ...
+    def to_json(self: W, *, encoder: Encoder = ..., fast: bool = ..., **encoder_kwargs) -> str: ...
+    @classmethod
+    def list_to_json(cls: type[W], instances: list[W], encoder: Encoder = ..., fast: bool = ..., **encoder_kwargs) -> str: ...
 
 class JSONWizard(_JSONWizardMixin): ...
 
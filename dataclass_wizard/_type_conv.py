@@ -6,6 +6,9 @@ __all__ = ['TRUTHY_VALUES',
            'as_date',
            'as_time',
            'as_timedelta',
+           'parse_duration',
+           'timedelta_to_iso',
+           'timedelta_to_compact',
            'datetime_to_timestamp',
            'as_collection',
            'as_list',
@@ -14,14 +17,16 @@ __all__ = ['TRUTHY_VALUES',
            ]
 
 import csv
+import re
 from collections.abc import Callable
 from datetime import date, datetime, time, timedelta, timezone, tzinfo
+from functools import lru_cache
 from json import JSONDecodeError, loads
 from typing import Any, AnyStr
 
-from ._lazy_imports import pytimeparse
 from ._models_date import UTC, ZERO
 from ._type_def import NUMBERS, E, N
+from .constants import DURATION_CACHE_SIZE
 from .errors import ParseError
 
 # What values are considered "truthy" when converting to a boolean type.
@@ -174,8 +179,8 @@ def as_timedelta(o: str | N | timedelta,
     below logic.
 
         * ``str``: If the string is in a numeric form like "1.23", we convert
-          it to a ``float`` and assume it's in seconds. Otherwise, we convert
-          strings via the ``pytimeparse.parse`` function.
+          it to a ``float`` and assume it's in seconds. Otherwise, we parse
+          the string with :func:`parse_duration`.
         * ``int`` or ``float``: A numeric value is assumed to be in seconds.
           In this case, it is passed in to the constructor like
           ``timedelta(seconds=...)``
@@ -191,17 +196,11 @@ def as_timedelta(o: str | N | timedelta,
     t = type(o)
 
     if t is str:
-        # Check if the string represents a numeric value like "1.23"
-        # Ref: https://stackoverflow.com/a/23639915/10237506
-        if o.replace('.', '', 1).isdigit():  # type: ignore
-            seconds = float(o)  # type: ignore[arg-type]
-        else:
-            # Otherwise, parse strings using `pytimeparse`
-            seconds = pytimeparse.parse(o)
+        return parse_duration(o)  # type: ignore[arg-type]
 
     # Check `type` explicitly, because `bool` is a sub-class of `int`
     elif t in NUMBERS:
-        seconds = o  # type: ignore[assignment]
+        return timedelta(seconds=o)  # type: ignore[arg-type]
 
     elif t is base_type:
         return o
@@ -212,11 +211,159 @@ def as_timedelta(o: str | N | timedelta,
     else:
         return default
 
-    try:
-        return timedelta(seconds=seconds)
 
-    except TypeError:
-        raise ValueError(f'Invalid value for timedelta, value={o!r}')
+_NUM = r'(\d+(?:\.\d*)?|\.\d+)'
+
+# e.g. "1.5", "-32"
+_SECONDS_RE = re.compile(rf'\s*([+-]?){_NUM}\s*')
+
+# e.g. "4:13", "1:02:03.5", "1:02:03:04", and `str(timedelta)`,
+# such as "1 day, 2:03:04" or "-1 day, 23:59:59.5"
+_CLOCK_RE = re.compile(
+    r'\s*(?P<sign>[+-])?\s*'
+    r'(?:(?P<days>\d+)\s*d(?:a?ys?)?\s*,?\s*)?'
+    r'(?:(?:(?P<cdays>\d+):)?(?P<hours>\d+):)?'
+    r'(?P<minutes>\d+):(?P<seconds>\d\d(?:\.\d+)?)\s*',
+    re.IGNORECASE)
+
+# e.g. "1h 30m", "2h32m", "5hr34m56s", "1.2 minutes", "3 days, 4 hours"
+_HUMAN_RE = re.compile(
+    r'\s*(?P<sign>[+-])?\s*'
+    rf'(?:(?P<weeks>{_NUM[1:-1]})\s*w(?:(?:ee)?ks?)?[\s,]*)?'
+    rf'(?:(?P<days>{_NUM[1:-1]})\s*d(?:a?ys?)?[\s,]*)?'
+    rf'(?:(?P<hours>{_NUM[1:-1]})\s*h(?:(?:ou)?rs?)?[\s,]*)?'
+    rf'(?:(?P<minutes>{_NUM[1:-1]})\s*m(?:in(?:ute)?s?)?[\s,]*)?'
+    rf'(?:(?P<seconds>{_NUM[1:-1]})\s*s(?:ec(?:ond)?s?)?)?\s*',
+    re.IGNORECASE)
+
+# ISO 8601 durations, e.g. "PT1H30M", "P1DT2H", "P2W", "-PT0.5S"
+_ISO_NUM = r'\d+(?:[.,]\d*)?'
+_ISO_RE = re.compile(
+    r'\s*(?P<sign>[+-])?P'
+    rf'(?:(?P<weeks>{_ISO_NUM})W)?'
+    rf'(?:(?P<days>{_ISO_NUM})D)?'
+    r'(?:T(?=\d)'
+    rf'(?:(?P<hours>{_ISO_NUM})H)?'
+    rf'(?:(?P<minutes>{_ISO_NUM})M)?'
+    rf'(?:(?P<seconds>{_ISO_NUM})S)?)?\s*',
+    re.IGNORECASE)
+
+_DURATION_UNITS = ('weeks', 'days', 'hours', 'minutes', 'seconds')
+
+
+def _num(s: str) -> int | float:
+    if '.' in s or ',' in s:
+        return float(s.replace(',', '.'))
+    return int(s)
+
+
+@lru_cache(maxsize=DURATION_CACHE_SIZE)
+def parse_duration(s: str) -> timedelta:
+    """
+    Parse a duration string `s` to a :class:`timedelta`. The supported
+    formats are:
+
+        * A number of seconds, e.g. "32" or "1.5"
+        * ``[[[D:]H:]M:]SS[.ffffff]``, e.g. "4:13" or "1:02:03.5", which
+          includes the output of ``str(timedelta)``, e.g. "1 day, 2:03:04"
+        * Human-readable forms, e.g. "1h 30m", "5hr34m56s", or "1.2 minutes"
+        * ISO 8601 durations, e.g. "PT1H30M" or "P1DT2H"
+
+    Each form accepts an optional leading sign. Results are cached, as
+    the same durations tend to repeat within (and across) inputs.
+
+    :raises ValueError: If `s` is not in a supported format.
+    """
+    if m := _SECONDS_RE.fullmatch(s):
+        sign, seconds = m.groups()
+        td = timedelta(seconds=_num(seconds))
+        return -td if sign == '-' else td
+
+    if ':' in s:
+        m = _CLOCK_RE.fullmatch(s)
+        if m is not None:
+            sign, days, cdays, hours, minutes, seconds = m.groups()
+            if days is not None and cdays is not None:
+                raise ValueError(f'Invalid value for timedelta, value={s!r}')
+            days = int(days or cdays or 0)
+            td = timedelta(hours=int(hours or 0), minutes=int(minutes),
+                           seconds=_num(seconds))
+            if sign != '-':
+                return td + timedelta(days=days)
+            # like `str(timedelta)`, a sign before days only applies to them
+            if days:
+                return td - timedelta(days=days)
+            return -td
+
+    elif (m := _ISO_RE.fullmatch(s) or _HUMAN_RE.fullmatch(s)) is not None:
+        values = m.group(*_DURATION_UNITS)
+        if any(v is not None for v in values):
+            td = timedelta(**{unit: _num(v)
+                              for unit, v in zip(_DURATION_UNITS, values)
+                              if v is not None})
+            return -td if m['sign'] == '-' else td
+
+    raise ValueError(f'Invalid value for timedelta, value={s!r}')
+
+
+def _seconds_str(seconds: int, microseconds: int) -> str:
+    if microseconds:
+        return f'{seconds}.{microseconds:06d}'.rstrip('0')
+    return str(seconds)
+
+
+def timedelta_to_iso(td: timedelta) -> str:
+    """
+    Return a :class:`timedelta` as an ISO 8601 duration string, such as
+    "PT1H30M" or "P1DT2H3M4.5S"; negative values have a leading "-".
+    """
+    sign = ''
+    if td.days < 0:
+        sign = '-'
+        td = -td
+
+    minutes, seconds = divmod(td.seconds, 60)
+    hours, minutes = divmod(minutes, 60)
+
+    parts = [f'{sign}P']
+    if td.days:
+        parts.append(f'{td.days}D')
+    if hours or minutes or seconds or td.microseconds or not td.days:
+        parts.append('T')
+        if hours:
+            parts.append(f'{hours}H')
+        if minutes:
+            parts.append(f'{minutes}M')
+        if seconds or td.microseconds or not (hours or minutes):
+            parts.append(f'{_seconds_str(seconds, td.microseconds)}S')
+
+    return ''.join(parts)
+
+
+def timedelta_to_compact(td: timedelta) -> str:
+    """
+    Return a :class:`timedelta` as a compact string, such as "1h30m" or
+    "1d2h3m4.5s"; negative values have a leading "-".
+    """
+    sign = ''
+    if td.days < 0:
+        sign = '-'
+        td = -td
+
+    minutes, seconds = divmod(td.seconds, 60)
+    hours, minutes = divmod(minutes, 60)
+
+    parts = [sign]
+    if td.days:
+        parts.append(f'{td.days}d')
+    if hours:
+        parts.append(f'{hours}h')
+    if minutes:
+        parts.append(f'{minutes}m')
+    if seconds or td.microseconds or len(parts) == 1:
+        parts.append(f'{_seconds_str(seconds, td.microseconds)}s')
+
+    return ''.join(parts)
 
 
 def datetime_to_timestamp(dt: datetime, assume_naive_tz: timezone) -> int:
@@ -7,7 +7,7 @@ from _typeshed import Incomplete
 
 from ._type_def import E, N
 
-__all__ = ['TRUTHY_VALUES', 'as_int', 'as_datetime', 'as_date', 'as_time', 'as_timedelta', 'datetime_to_timestamp', 'as_collection', 'as_list', 'as_dict', 'as_enum']
+__all__ = ['TRUTHY_VALUES', 'as_int', 'as_datetime', 'as_date', 'as_time', 'as_timedelta', 'parse_duration', 'timedelta_to_iso', 'timedelta_to_compact', 'datetime_to_timestamp', 'as_collection', 'as_list', 'as_dict', 'as_enum']
 
 TRUTHY_VALUES: frozenset
 def as_int(o: float | bool, tp: type, base_type: type[int] = ...): ...
@@ -16,6 +16,9 @@ def as_date(o: int | float | date, _from_timestamp: Callable[[float, tzinfo], da
 def as_time(o: time | Any, base_type: type[time]): ...
 # noinspection PyTypeHints
 def as_timedelta(o: str | N | timedelta, base_type: type[timedelta] = ..., default: Incomplete | None = ..., raise_: bool = ...): ...
+def parse_duration(s: str) -> timedelta: ...
+def timedelta_to_iso(td: timedelta) -> str: ...
+def timedelta_to_compact(td: timedelta) -> str: ...
 def datetime_to_timestamp(dt: datetime, assume_naive_tz: timezone) -> int: ...
 def as_collection(v: Any, *, strip: bool = ...) -> Any: ...
 def as_list(v: Any, *, sep: str = ..., strip: bool = ..., drop_empty: bool = ..., json_enabled: bool = ...) -> Any: ...
@@ -3,7 +3,8 @@ def per_cls(cache, cls, factory=dict):
     # returns the per-class dict, creating if absent
     value = cache.get(cls)
     if value is None:
-        value = cache[cls] = factory()
+        # `setdefault` is atomic, so concurrent callers get the same value
+        value = cache.setdefault(cls, factory())
     return value
 
 
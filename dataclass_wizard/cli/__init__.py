@@ -1,2 +1,3 @@
 from .cli import main
+from .compiler import compile_modules
 from .schema import PyCodeGenerator
@@ -4,6 +4,7 @@ Entry point for the Wizard CLI tool.
 import argparse
 import os
 import platform
+import py_compile
 import sys
 import textwrap
 from gettext import gettext as _
@@ -12,6 +13,7 @@ from pathlib import Path
 from typing import Optional, TextIO
 
 from ..__version__ import __version__
+from .compiler import compile_modules
 from .schema import PyCodeGenerator
 
 # Define the top-level parser
@@ -98,6 +100,29 @@ def setup_parser():
 
     gs_parser.set_defaults(func=gen_py_schema)
 
+    # create the parser for the "compile" command
+    compile_parser = subparsers.add_parser(
+        'compile', aliases=['c'],
+        help='Pre-compiles the load and dump functions for all dataclasses '
+             'in the given modules, and writes them to a Python module.')
+
+    compile_parser.add_argument('modules', metavar='module', nargs='+',
+                                help='Fully qualified name of a module to '
+                                     'import, e.g. `mypkg.models`')
+
+    compile_parser.add_argument('-o', '--out-file',
+                                type=FileTypeWithExt('w', ext='.py'),
+                                help="Path to new Python file. The default is "
+                                     "to print the output to stdout or '-'",
+                                default=sys.stdout)
+
+    compile_parser.add_argument('-s', '--skip-errors', action='store_true',
+                                help='Skip (and report) dataclasses that '
+                                     'cannot be compiled, instead of exiting '
+                                     'with an error.')
+
+    compile_parser.set_defaults(func=compile_py_module)
+
 
 class FileTypeWithExt(argparse.FileType):
     """
@@ -220,18 +245,55 @@ def gen_py_schema(args):
         out_file.write(code_gen.py_code)
 
 
+def compile_py_module(args):
+    """
+    Entry point for the `wiz compile (c)` command.
+    """
+
+    out_file: TextIO = args.out_file
+    skip_errors: bool = args.skip_errors
+
+    is_stdout: bool = out_file is sys.stdout or out_file.name == '<stdout>'
+
+    # Console scripts don't add the current directory to `sys.path`, but we
+    # want local packages to be importable, same as with `python -m`.
+    if os.getcwd() not in sys.path:
+        sys.path.insert(0, os.getcwd())
+
+    def on_error(cls, e):
+        print(f'Skipping {cls.__module__}.{cls.__qualname__}: '
+              f'{type(e).__name__}: {e}', file=sys.stderr)
+
+    try:
+        py_code, classes = compile_modules(
+            args.modules, on_error=on_error if skip_errors else None)
+
+    except Exception as e:
+        _exit_with_error(out_file, e, header='compiling the modules')
+
+    out_file.write(py_code)
+
+    if not is_stdout:
+        out_file.close()
+        # Byte-compile the new module, so it can be shipped as-is.
+        py_compile.compile(out_file.name, doraise=True)
+
+        print(f'Compiled {len(classes)} dataclass(es) to:  '
+              f'{Path(out_file.name).absolute()}')
+
+
 def _exit_with_error(out_file: TextIO,
                      e: Optional[Exception] = None,
                      msg: Optional[str] = None,
                      line_width=70,
-                     indent='  '):
+                     indent='  ',
+                     header='parsing the JSON input'):
     """
     Prints the error message from an error `e` or an error message `msg`
     and exits the program.
     """
 
-    msg_header = ('An error{err_cls}was encountered while parsing the JSON '
-                  'input:')
+    msg_header = f'An error{{err_cls}}was encountered while {header}:'
 
     if not msg:
         msg = str(e)
@@ -0,0 +1,98 @@
+"""
+Ahead-of-time compilation of the load and dump functions for dataclasses.
+The entry point for this module is the `compile` subcommand.
+
+The output is a plain Python module containing the generated code for every
+dataclass in the target modules, along with a registration stub; once the
+module is imported, the library re-creates the functions from their
+(byte-compiled) code objects when a class is first loaded or dumped, rather
+than calling ``exec`` on the generated source.
+
+Note that the registry is keyed on the generated source code, so a class
+which changes after the module is generated is simply compiled at runtime as
+usual.
+"""
+__all__ = ['compile_modules']
+
+from importlib import import_module
+from textwrap import indent
+
+from .._dumpers import dump_func_for_dataclass
+from .._env import EnvWizard
+from .._loaders import load_func_for_dataclass
+from ..__version__ import __version__
+from ..codegen import generate_functions, iter_dataclasses
+from ..utils import _code_cache
+
+_MODULE_HEADER = '''\
+"""
+Pre-compiled load and dump functions for dataclasses, generated by
+`wiz compile` (dataclass-wizard {version}) -- DO NOT EDIT.
+
+Source modules:
+{modules}
+
+Import this module once at startup (before the first load or dump), so
+that these functions are used instead of compiling the generated code.
+"""
+from dataclass_wizard.codegen import register_compiled
+'''
+
+
+def compile_modules(module_names, on_error=None):
+    """
+    Import each module in `module_names`, and generate the load and dump
+    functions for every dataclass in it.
+
+    :param module_names: Fully qualified names of the modules to compile.
+    :param on_error: Called as ``on_error(cls, exc)`` for a class that
+      can't be compiled; by default, the error is raised.
+    :return: A tuple of ``(py_code, classes)``, where `classes` are the
+      dataclasses that were compiled.
+    """
+    modules = [import_module(name) for name in module_names]
+    classes = []
+
+    captured = _code_cache.CAPTURED = []
+    try:
+        for module in modules:
+            for cls in iter_dataclasses(module):
+                try:
+                    generate_functions(cls)
+                    # `generate_functions` also adds the load and dump
+                    # functions for a list, which changes the generated code;
+                    # so also capture the code that `fromdict` and `asdict`
+                    # generate on their own.
+                    if not issubclass(cls, EnvWizard):
+                        load_func_for_dataclass(cls)
+                    dump_func_for_dataclass(cls)
+                except Exception as e:
+                    if on_error is None:
+                        raise
+                    on_error(cls, e)
+                else:
+                    classes.append(cls)
+    finally:
+        _code_cache.CAPTURED = None
+
+    lines = [_MODULE_HEADER.format(
+        version=__version__,
+        modules='\n'.join(f'    * {m.__name__}' for m in modules))]
+
+    groups = {}
+    for source, factory_names in captured:
+        key = _code_cache.source_key(source)
+        if key in groups:
+            continue
+
+        group_name = groups[key] = f'_group_{len(groups)}'
+        lines.append(f'\ndef {group_name}():')
+        lines.append(indent(source, '    '))
+        lines.append(f'    return ({", ".join(factory_names)},)\n')
+
+    lines.append(f'\nregister_compiled({__version__!r}, {{')
+    lines.extend(f'    {key!r}: {group_name},'
+                 for key, group_name in groups.items())
+    lines.append('})\n')
+
+    return '\n'.join(lines), classes
@@ -0,0 +1,240 @@
+"""
+Helpers for controlling how (and when) the library generates the load and
+dump functions for dataclasses.
+"""
+__all__ = [
+    'enable_code_cache',
+    'disable_code_cache',
+    'clear_code_cache',
+    'code_cache_info',
+    'key_case_info',
+    'datetime_parse_cache_info',
+    'register_compiled',
+    'warmup',
+]
+
+import dataclasses
+from concurrent.futures import Future
+from importlib import import_module
+from threading import Thread
+from time import perf_counter
+from types import ModuleType
+
+from ._log import LOG
+from .utils import _code_cache
+
+
+def enable_code_cache(directory=None):
+    """
+    Enable the on-disk cache of compiled load/dump functions.
+
+    On a cache hit, the ``compile()`` step for the generated source code is
+    skipped, which mostly benefits short-lived processes (CLI jobs, workers)
+    with many models.
+
+    The cache can also be enabled by setting the ``WIZARD_CODE_CACHE_DIR``
+    environment variable.
+
+    :param directory: The directory to store cache entries in. Defaults to
+      ``$XDG_CACHE_HOME/dataclass-wizard`` (or ``~/.cache/dataclass-wizard``).
+    :return: The resolved cache directory.
+    """
+    if directory is None:
+        directory = _code_cache.default_cache_dir()
+
+    return _code_cache.set_code_cache(directory).directory
+
+
+def disable_code_cache():
+    """Disable the on-disk cache of compiled load/dump functions."""
+    _code_cache.set_code_cache(None)
+
+
+def clear_code_cache(directory=None):
+    """
+    Remove all entries from the code cache directory; defaults to the
+    active cache directory, if any.
+
+    :return: The number of cache entries removed.
+    """
+    if directory is not None:
+        return _code_cache.CodeCache(directory).clear()
+
+    cache = _code_cache.get_code_cache()
+    return 0 if cache is None else cache.clear()
+
+
+def code_cache_info():
+    """
+    Return the directory and hit/miss counts for the active code cache,
+    or ``None`` if the cache is disabled.
+    """
+    cache = _code_cache.get_code_cache()
+    return None if cache is None else cache.stats()
+
+
+def key_case_info(cls):
+    """
+    Return the key casing learned for a dataclass, with ``load_case='AUTO'``
+    and ``load_case_learn_after`` set in its ``Meta`` config, along with the
+    number of keys seen in each casing (other than in the learned casing),
+    and the number of times the casing was learned again.
+
+    Returns ``None`` if the casing isn't learned for the dataclass, or its
+    load function wasn't generated yet.
+    """
+    from ._class_helper import CLASS_TO_AUTO_KEY_CASE
+
+    learner = CLASS_TO_AUTO_KEY_CASE.get(cls)
+    return None if learner is None else learner.info()
+
+
+def datetime_parse_cache_info(cls):
+    """
+    Return the cache hits, misses, and size for the `date`, `datetime`, and
+    `time` values parsed from strings for a dataclass, with
+    ``datetime_parse_cache_size`` set in its ``Meta`` config, per type.
+
+    Returns ``None`` if the values aren't cached for the dataclass, or its
+    load function wasn't generated yet.
+    """
+    from ._class_helper import CLASS_TO_DATETIME_PARSE_CACHE
+
+    caches = CLASS_TO_DATETIME_PARSE_CACHE.get(cls)
+    if caches is None:
+        return None
+
+    return {tp: cached.cache_info()._asdict() for tp, cached in caches.items()}
+
+
+def register_compiled(version, groups):
+    """
+    Register the functions pre-compiled by the ``wiz compile`` command;
+    this is called by the module it generates, and is not meant to be
+    called directly.
+
+    The functions are ignored (with a warning) if they were generated
+    for a different version of the library.
+
+    :return: The number of function groups registered.
+    """
+    return _code_cache.register_precompiled(version, groups)
+
+
+def iter_dataclasses(module):
+    """Yield all dataclasses defined in `module`, in definition order."""
+    for obj in list(vars(module).values()):
+        if (isinstance(obj, type)
+                and obj.__module__ == module.__name__
+                and dataclasses.is_dataclass(obj)):
+            yield obj
+
+
+def generate_functions(cls, load=True, dump=True):
+    """
+    Run the load and/or dump codegen for a dataclass `cls`, and return the
+    time (in seconds) spent on each.
+    """
+    from ._class_helper import CODEGEN_LOCK
+    from ._dumpers import dump_func_for_dataclass
+    from ._env import EnvWizard
+
+    timings = {}
+
+    with CODEGEN_LOCK:
+        if load:
+            start = perf_counter()
+
+            if issubclass(cls, EnvWizard):
+                from ._bases import AbstractEnvMeta
+                from ._env import LoadMixin, load_func_for_dataclass
+
+                load_func_for_dataclass(cls, LoadMixin, AbstractEnvMeta)
+            else:
+                from ._loaders import load_func_for_dataclass
+
+                load_func_for_dataclass(cls, with_list=True)
+
+            timings['load'] = perf_counter() - start
+
+        if dump:
+            start = perf_counter()
+            # same as in `asdict`, as the function is not set on the class
+            # if it already defines the attribute (e.g. `JSONWizard`)
+            cls.__dataclass_wizard_to_dict__ = dump_func_for_dataclass(
+                cls, with_list=True)
+            timings['dump'] = perf_counter() - start
+
+    return timings
+
+
+def _resolve_classes(classes_or_modules, env):
+    from ._env import EnvWizard
+
+    seen = set()
+
+    for obj in classes_or_modules:
+        if isinstance(obj, str):
+            obj = import_module(obj)
+
+        if isinstance(obj, ModuleType):
+            classes = iter_dataclasses(obj)
+        elif isinstance(obj, type) and dataclasses.is_dataclass(obj):
+            classes = (obj, )
+        else:
+            raise TypeError(f'Expected a dataclass or a module, got {obj!r}')
+
+        for cls in classes:
+            if cls in seen or (not env and issubclass(cls, EnvWizard)):
+                continue
+            seen.add(cls)
+            yield cls
+
+
+def warmup(*classes_or_modules, load=True, dump=True, env=True,
+           background=False):
+    """
+    Eagerly generate the load and/or dump functions for dataclasses, which
+    otherwise happens the first time each class is loaded or dumped.
+
+    This is useful to move the codegen cost to startup time, for example
+    before forking workers, or in a readiness probe.
+
+    :param classes_or_modules: Dataclasses, modules, or names of modules to
+      import; all dataclasses defined in a module are included.
+    :param load: Generate the load functions (i.e. ``from_dict``).
+    :param dump: Generate the dump functions (i.e. ``to_dict``).
+    :param env: Include ``EnvWizard`` subclasses.
+    :param background: Run in a (daemon) background thread, and return a
+      :class:`concurrent.futures.Future` for the result instead.
+    :return: A mapping of each class to the time (in seconds) spent on
+      each of ``load`` and ``dump``.
+    """
+    # resolve modules and classes up front, so errors are raised here
+    classes = list(_resolve_classes(classes_or_modules, env))
+
+    def run():
+        start = perf_counter()
+        timings = {cls: generate_functions(cls, load, dump)
+                   for cls in classes}
+        LOG.debug('Warmed up %d dataclass(es) in %.3fs',
+                  len(classes), perf_counter() - start)
+        return timings
+
+    if not background:
+        return run()
+
+    future = Future()
+
+    def run_in_background():
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(run())
+        except BaseException as e:
+            future.set_exception(e)
+
+    Thread(target=run_in_background, name='dataclass-wizard-warmup',
+           daemon=True).start()
+
+    return future
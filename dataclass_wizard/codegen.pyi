@@ -0,0 +1,53 @@
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future
+from os import PathLike
+from types import ModuleType
+from typing import Callable, Literal, TypedDict, overload
+
+from .utils._auto_key_case import AutoKeyCaseInfo
+from .utils._code_cache import CodeCacheStats
+
+__all__ = [
+    'enable_code_cache',
+    'disable_code_cache',
+    'clear_code_cache',
+    'code_cache_info',
+    'key_case_info',
+    'datetime_parse_cache_info',
+    'register_compiled',
+    'warmup',
+]
+
+def enable_code_cache(directory: str | PathLike[str] | None = None) -> str: ...
+def disable_code_cache() -> None: ...
+def clear_code_cache(directory: str | PathLike[str] | None = None) -> int: ...
+def code_cache_info() -> CodeCacheStats | None: ...
+def key_case_info(cls: type) -> AutoKeyCaseInfo | None: ...
+
+class DateTimeParseCacheInfo(TypedDict):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+def datetime_parse_cache_info(cls: type) -> dict[type, DateTimeParseCacheInfo] | None: ...
+def register_compiled(version: str,
+                      groups: dict[str, Callable[[], tuple[Callable, ...]]]) -> int: ...
+def iter_dataclasses(module: ModuleType) -> Iterator[type]: ...
+def generate_functions(cls: type, load: bool = True,
+                       dump: bool = True) -> dict[str, float]: ...
+def _resolve_classes(classes_or_modules: Iterable[type | ModuleType | str],
+                     env: bool) -> Iterator[type]: ...
+
+@overload
+def warmup(*classes_or_modules: type | ModuleType | str,
+           load: bool = True,
+           dump: bool = True,
+           env: bool = True,
+           background: Literal[False] = False) -> dict[type, dict[str, float]]: ...
+@overload
+def warmup(*classes_or_modules: type | ModuleType | str,
+           load: bool = True,
+           dump: bool = True,
+           env: bool = True,
+           background: Literal[True]) -> Future[dict[type, dict[str, float]]]: ...
@@ -7,6 +7,24 @@ PACKAGE_NAME = 'dataclass_wizard'
 # Library Log Level
 LOG_LEVEL = os.getenv('WIZARD_LOG_LEVEL', 'ERROR').upper()
 
+# Directory for the (opt-in) on-disk cache of compiled load/dump functions.
+# Caching is disabled when this is unset or empty.
+CODE_CACHE_DIR = os.getenv('WIZARD_CODE_CACHE_DIR') or None
+
+# The minimum number of fields in a dataclass with a `CatchAll` field, for
+# its load function to match the keys in the input (and capture the unknown
+# keys) with a single pass over the input object.
+SINGLE_PASS_MIN_FIELDS = 64
+
+# The maximum number of duration strings (e.g. "1h30m") for which the
+# parsed `timedelta` is cached, when loading `timedelta` fields.
+DURATION_CACHE_SIZE = 1024
+
+# The maximum number of `exclude` / `include` combinations (or sets of
+# `only` fields), per dataclass, for which a specialized dump (or load)
+# function is cached.
+PROJECTION_CACHE_SIZE = 64
+
 # Current system Python version
 _PY_VERSION = sys.version_info[:2]
 
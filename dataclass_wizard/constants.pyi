@@ -4,6 +4,13 @@ import sys
 PACKAGE_NAME: str
 # Library Log Level
 LOG_LEVEL: str
+# Directory for the on-disk cache of compiled load/dump functions
+CODE_CACHE_DIR: str | None
+# Minimum field count for loading with a single pass over the input keys
+SINGLE_PASS_MIN_FIELDS: int
+# Maximum number of parsed duration strings to cache
+DURATION_CACHE_SIZE: int
+PROJECTION_CACHE_SIZE: int
 # Current system Python version
 _PY_VERSION: tuple[int, int] = sys.version_info[:2]
 # Check if currently running Python 3.x or higher
@@ -123,6 +123,12 @@ class DateTimeTo(Enum):
     TIMESTAMP = 1  # Unix timestamp (seconds)
 
 
+class TimedeltaTo(Enum):
+    STR = 0  # `str(td)`, e.g. "1 day, 2:03:04.5" (default)
+    ISO = 1  # ISO 8601 duration, e.g. "P1DT2H3M4.5S"
+    COMPACT = 2  # Compact string, e.g. "1d2h3m4.5s"
+
+
 class EnvPrecedence(Enum):
     SECRETS_ENV_DOTENV = 'secrets > env > dotenv'  # default
     SECRETS_DOTENV_ENV = 'secrets > dotenv > env'  # dev-heavy
@@ -56,6 +56,15 @@ class DateTimeTo(enum.Enum):
     @classmethod
     def __init__(cls, value) -> None: ...
 
+class TimedeltaTo(enum.Enum):
+    STR = ...
+    ISO = ...
+    COMPACT = ...
+    @staticmethod
+    def _generate_next_value_(name, start, count, last_values): ...
+    @classmethod
+    def __init__(cls, value) -> None: ...
+
 class EnvPrecedence(enum.Enum):
     SECRETS_ENV_DOTENV = ...
     SECRETS_DOTENV_ENV = ...
@@ -1,8 +1,13 @@
 import json
 
 from .._dumpers import asdict
-from .._loaders import fromdict, fromlist
+from .._loaders import fromdict, fromlist, get_load_func
 from .._serial_json import JSONWizard
+from ..utils._json_stream import (
+    DEFAULT_CHUNK_SIZE,
+    DEFAULT_MAX_ELEMENT_SIZE,
+    iter_json_array,
+)
 from ..utils.containers import Container
 
 
@@ -69,6 +74,23 @@ class JSONFileWizard:
 
         return fromdict(cls, o) if isinstance(o, dict) else fromlist(cls, o)
 
+    @classmethod
+    def iter_from_json_file(cls, file, *,
+                            chunk_size=DEFAULT_CHUNK_SIZE,
+                            max_element_size=DEFAULT_MAX_ELEMENT_SIZE,
+                            **decoder_kwargs):
+        """
+        Reads in a JSON file containing a (top-level) array incrementally,
+        and yields an instance of the dataclass for each element.
+        """
+        load = get_load_func(cls)
+
+        with open(file, 'rb') as in_file:
+            yield from map(load, iter_json_array(
+                in_file, chunk_size,
+                max_element_size=max_element_size,
+                **decoder_kwargs))
+
     def to_json_file(self, file, mode='w',
                      encoder=json.dump,
                      **encoder_kwargs):
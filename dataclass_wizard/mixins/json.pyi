@@ -1,4 +1,5 @@
 import json
+from collections.abc import Iterator
 from typing import AnyStr
 
 from .._abstractions import W
@@ -34,6 +35,13 @@ class JSONFileWizard(SerializerHookMixin):
                        **decoder_kwargs) -> T | list[T]:
         ...
 
+    @classmethod
+    def iter_from_json_file(cls: type[T], file: FileType, *,
+                            chunk_size: int = ...,
+                            max_element_size: int | None = ...,
+                            **decoder_kwargs) -> Iterator[T]:
+        ...
+
     def to_json_file(self: T, file: FileType, mode: str = 'w',
                      encoder: FileEncoder = json.dump,
                      **encoder_kwargs) -> None:
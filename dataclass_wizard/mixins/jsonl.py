@@ -0,0 +1,93 @@
+import json
+from typing import NamedTuple
+
+from .._loaders import get_load_func
+from ..errors import JSONWizardError
+from ..stream import _open, dump_iter_jsonl
+
+
+class InvalidLine(NamedTuple):
+    """A line which could not be loaded, in ``skip_invalid`` mode."""
+    lineno: int
+    line: str
+    error: Exception
+
+
+class JSONLinesWizard:
+    """
+    A Mixin class that makes it easier to interact with JSON Lines
+    (also known as NDJSON) data, where each line is a JSON object.
+
+    This can be paired with the :class:`JSONWizard` Mixin
+    class for more complete extensibility.
+
+    """
+    @classmethod
+    def iter_from_jsonl(cls, path_or_stream, *,
+                        skip_invalid=False,
+                        errors=None,
+                        **decoder_kwargs):
+        """
+        Reads JSON Lines from a file path or a text stream, and yields an
+        instance of the dataclass for each (non-blank) line.
+
+        If ``skip_invalid`` is enabled, a line which can't be decoded or
+        loaded is skipped rather than raising an error; if an ``errors``
+        list is passed in, an :class:`InvalidLine` is also added to it for
+        each such line.
+        """
+        decode = json.JSONDecoder(**decoder_kwargs).decode
+        load = get_load_func(cls)
+
+        with _open(path_or_stream, 'r') as in_file:
+            for lineno, line in enumerate(in_file, 1):
+                if line.isspace():
+                    continue
+
+                try:
+                    obj = load(decode(line))
+
+                except (ValueError, JSONWizardError) as e:
+                    if not skip_invalid:
+                        raise
+                    if errors is not None:
+                        errors.append(InvalidLine(lineno, line.rstrip('\r\n'), e))
+                    continue
+
+                yield obj
+
+    @classmethod
+    def from_jsonl(cls, path_or_stream, *,
+                   skip_invalid=False,
+                   errors=None,
+                   **decoder_kwargs):
+        """
+        Reads JSON Lines from a file path or a text stream, and returns a
+        list of the dataclass instances.
+        """
+        return list(cls.iter_from_jsonl(path_or_stream,
+                                        skip_invalid=skip_invalid,
+                                        errors=errors,
+                                        **decoder_kwargs))
+
+    @classmethod
+    def to_jsonl(cls, instances, path_or_stream, mode='w',
+                 **encoder_kwargs):
+        """
+        Serializes the dataclass instances, and writes them as JSON Lines
+        to a file path or a text stream.
+
+        :return: The number of lines written.
+        """
+        return dump_iter_jsonl(instances, path_or_stream, cls, mode=mode,
+                               **encoder_kwargs)
+
+    @classmethod
+    def append_jsonl(cls, instances, path_or_stream, **encoder_kwargs):
+        """
+        Serializes the dataclass instances, and appends them as JSON Lines
+        to a file path or a text stream.
+
+        :return: The number of lines written.
+        """
+        return cls.to_jsonl(instances, path_or_stream, 'a', **encoder_kwargs)
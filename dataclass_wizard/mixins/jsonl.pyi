@@ -0,0 +1,39 @@
+from collections.abc import Iterable, Iterator
+from typing import NamedTuple, TextIO
+
+from .._serial_json import SerializerHookMixin
+from .._type_def import FileType, T
+
+class InvalidLine(NamedTuple):
+    lineno: int
+    line: str
+    error: Exception
+
+class JSONLinesWizard(SerializerHookMixin):
+
+    @classmethod
+    def iter_from_jsonl(cls: type[T], path_or_stream: FileType | TextIO, *,
+                        skip_invalid: bool = False,
+                        errors: list[InvalidLine] | None = None,
+                        **decoder_kwargs) -> Iterator[T]:
+        ...
+
+    @classmethod
+    def from_jsonl(cls: type[T], path_or_stream: FileType | TextIO, *,
+                   skip_invalid: bool = False,
+                   errors: list[InvalidLine] | None = None,
+                   **decoder_kwargs) -> list[T]:
+        ...
+
+    @classmethod
+    def to_jsonl(cls: type[T], instances: Iterable[T],
+                 path_or_stream: FileType | TextIO,
+                 mode: str = 'w',
+                 **encoder_kwargs) -> int:
+        ...
+
+    @classmethod
+    def append_jsonl(cls: type[T], instances: Iterable[T],
+                     path_or_stream: FileType | TextIO,
+                     **encoder_kwargs) -> int:
+        ...
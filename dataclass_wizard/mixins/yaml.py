@@ -1,5 +1,5 @@
 from .._bases_meta import DumpMeta
-from .._dumpers import asdict
+from .._dumpers import asdict, asdict_many
 from .._lazy_imports import yaml
 from .._loaders import fromdict, fromlist
 from .._meta_cache import META_BY_DATACLASS
@@ -91,6 +91,6 @@ class YAMLWizard:
         if encoder is None:
             encoder = yaml.dump
 
-        list_of_dict = [asdict(o, cls=cls) for o in instances]
+        list_of_dict = asdict_many(instances, cls)
 
         return encoder(list_of_dict, **encoder_kwargs)
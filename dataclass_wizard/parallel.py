@@ -0,0 +1,239 @@
+"""
+Load and dump large lists of dataclass instances in parallel.
+
+Each function splits its input into chunks, which are handled by the
+compiled load or dump functions in an executor; the results are returned in
+the same order as the input.
+
+By default, a :class:`ProcessPoolExecutor` is used, as the load and dump
+functions are CPU-bound; on a free-threaded (no-GIL) build of CPython, a
+:class:`ThreadPoolExecutor` is used instead.
+
+With processes, the dataclass (and the instances, for dumping) need to be
+picklable, so classes should be defined at the module level. Also note that
+the results are pickled on the way back, which for dataclass instances can
+cost about as much as loading them in the first place; so processes mostly
+pay off when there's more work per item, such as decoding JSON Lines with
+:func:`fromjsonl_parallel`, or custom load hooks.
+
+For smaller inputs, where starting the workers would cost more than it
+saves, the work is done in the current thread instead.
+"""
+__all__ = [
+    'fromlist_parallel',
+    'asdict_many_parallel',
+    'fromjsonl_parallel',
+]
+
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import NamedTuple
+
+from ._dumpers import get_dump_func, get_dump_list_func
+from ._loaders import fromlist, get_load_func
+from .stream import _open
+
+
+# Minimum number of items per worker, below which the work is done in the
+# current process.
+MIN_ITEMS_PER_WORKER = 1000
+
+# True if threads can't run Python code in parallel.
+_GIL_ENABLED = getattr(sys, '_is_gil_enabled', lambda: True)()
+
+
+class _ChunkError(NamedTuple):
+    """Returned by a worker for the first item in a chunk that failed."""
+    index: int
+    message: str
+
+
+def _init_worker(cls, load, dump):
+    # generate the functions once per worker, rather than for each chunk.
+    from .codegen import warmup
+
+    warmup(cls, load=load, dump=dump)
+
+
+def _new_executor(workers, cls, load, dump):
+    if _GIL_ENABLED:
+        return ProcessPoolExecutor(workers,
+                                   initializer=_init_worker,
+                                   initargs=(cls, load, dump))
+
+    # free-threaded build: threads run in parallel, with no need to pickle
+    # the input or results; codegen only needs to run once, up front.
+    _init_worker(cls, load, dump)
+    return ThreadPoolExecutor(workers)
+
+
+def _find_error(fn, start, items, error):
+    """
+    Return a `_ChunkError` for the first item which fails with `fn`; if no
+    item fails on its own, re-raise the `error` for the chunk as a whole.
+    """
+    for i, item in enumerate(items, start):
+        try:
+            fn(item)
+        except Exception as e:
+            return _ChunkError(i, f'{type(e).__name__}: {e}')
+
+    raise error
+
+
+def _load_chunk(cls, start, chunk):
+    try:
+        return fromlist(cls, chunk)
+    except Exception as e:
+        return _find_error(get_load_func(cls), start, chunk, e)
+
+
+def _dump_chunk(cls, start, chunk):
+    try:
+        return get_dump_list_func(cls)(chunk)
+    except Exception as e:
+        return _find_error(get_dump_func(cls), start, chunk, e)
+
+
+def _load_lines_chunk(cls, start, lines, decoder_kwargs):
+    decode = json.JSONDecoder(**decoder_kwargs).decode
+
+    try:
+        return fromlist(cls, [decode(line) for line in lines])
+    except Exception as e:
+        load = get_load_func(cls)
+        return _find_error(lambda line: load(decode(line)), start, lines, e)
+
+
+def _reraise(error, fn, item):
+    """
+    Re-run `fn` on the `item` which failed in a worker, so that the original
+    error is raised in this process, with the index of the item added.
+    """
+    try:
+        fn(item)
+    except Exception as e:
+        e.index = error.index
+        if isinstance(kwargs := getattr(e, 'kwargs', None), dict):
+            kwargs['index'] = error.index
+        raise
+
+    # the item doesn't fail in this process (for example, due to a change
+    # in global state); raise the error message from the worker instead.
+    raise RuntimeError(f'Item at index {error.index} failed in a worker '
+                       f'process: {error.message}')
+
+
+def _run(fn, cls, items, workers, chunksize, executor, load, dump, *args):
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if chunksize is None:
+        # a few chunks per worker, to even out the load between them
+        chunksize = max(len(items) // (workers * 4), 1)
+
+    if executor is None and (
+            workers <= 1 or len(items) < MIN_ITEMS_PER_WORKER * 2):
+        results = [fn(cls, 0, items, *args)]
+
+    elif executor is None:
+        with _new_executor(workers, cls, load, dump) as pool:
+            results = _map(pool, fn, cls, items, chunksize, *args)
+    else:
+        results = _map(executor, fn, cls, items, chunksize, *args)
+
+    out = []
+    for result in results:
+        if type(result) is _ChunkError:
+            return result
+        out += result
+
+    return out
+
+
+def _map(executor, fn, cls, items, chunksize, *args):
+    futures = [executor.submit(fn, cls, start,
+                               items[start:start + chunksize], *args)
+               for start in range(0, len(items), chunksize)]
+
+    return [f.result() for f in futures]
+
+
+def fromlist_parallel(cls, data, workers=None, chunksize=None, executor=None):
+    """
+    Converts a Python list object to a list of dataclass instances, using
+    multiple processes.
+
+    :param cls: The dataclass type (defined at the module level).
+    :param data: A list of dictionaries.
+    :param workers: The number of worker processes; defaults to the number
+      of CPUs.
+    :param chunksize: The number of items sent to a worker at a time;
+      defaults to a quarter of an even split between workers.
+    :param executor: An existing executor to use, rather than starting a
+      new one.
+    :return: The list of dataclass instances, in the same order as `data`.
+    :raises ParseError: For the first item which can't be loaded; the
+      position of the item in `data` is set as the ``index`` attribute.
+    """
+    result = _run(_load_chunk, cls, data, workers, chunksize, executor,
+                  True, False)
+
+    if type(result) is _ChunkError:
+        _reraise(result, get_load_func(cls), data[result.index])
+
+    return result
+
+
+def asdict_many_parallel(instances, cls=None, workers=None, chunksize=None,
+                         executor=None):
+    """
+    Converts a list of dataclass instances to a list of Python dictionary
+    objects, using multiple processes.
+
+    :param instances: A list of instances of the same dataclass.
+    :param cls: The dataclass type; defaults to the type of the first
+      instance.
+    :return: The list of dictionaries, in the same order as `instances`.
+
+    See :func:`fromlist_parallel` for the other parameters.
+    """
+    if not instances:
+        return []
+    if cls is None:
+        cls = type(instances[0])
+
+    result = _run(_dump_chunk, cls, instances, workers, chunksize, executor,
+                  False, True)
+
+    if type(result) is _ChunkError:
+        _reraise(result, get_dump_func(cls), instances[result.index])
+
+    return result
+
+
+def fromjsonl_parallel(cls, path_or_stream, workers=None, chunksize=None,
+                       executor=None, **decoder_kwargs):
+    """
+    Reads JSON Lines (NDJSON) from a file path or a text stream, and returns
+    a list of the dataclass instances; the lines are decoded and loaded
+    using multiple processes.
+
+    Blank lines are skipped; on an error, the ``index`` attribute is set to
+    the (zero-based) position among the non-blank lines.
+
+    See :func:`fromlist_parallel` for the other parameters.
+    """
+    with _open(path_or_stream, 'r') as in_file:
+        lines = [line for line in in_file if not line.isspace()]
+
+    result = _run(_load_lines_chunk, cls, lines, workers, chunksize,
+                  executor, True, False, decoder_kwargs)
+
+    if type(result) is _ChunkError:
+        decode = json.JSONDecoder(**decoder_kwargs).decode
+        load = get_load_func(cls)
+        _reraise(result, lambda line: load(decode(line)), lines[result.index])
+
+    return result
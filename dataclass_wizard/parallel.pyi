@@ -0,0 +1,43 @@
+from collections.abc import Callable, Sequence
+from concurrent.futures import Executor
+from typing import Any, NamedTuple, TextIO
+
+from ._type_def import FileType, JSONObject, T
+
+__all__ = ['fromlist_parallel', 'asdict_many_parallel', 'fromjsonl_parallel']
+
+MIN_ITEMS_PER_WORKER: int
+_GIL_ENABLED: bool
+
+class _ChunkError(NamedTuple):
+    index: int
+    message: str
+
+def _init_worker(cls: type, load: bool, dump: bool) -> None: ...
+def _new_executor(workers: int, cls: type, load: bool, dump: bool) -> Executor: ...
+def _find_error(fn: Callable[[Any], Any], start: int, items: Sequence, error: Exception) -> _ChunkError: ...
+def _load_chunk(cls: type[T], start: int, chunk: Sequence[JSONObject]) -> list[T] | _ChunkError: ...
+def _dump_chunk(cls: type[T], start: int, chunk: Sequence[T]) -> list[JSONObject] | _ChunkError: ...
+def _load_lines_chunk(cls: type[T], start: int, lines: Sequence[str], decoder_kwargs: dict[str, Any]) -> list[T] | _ChunkError: ...
+def _reraise(error: _ChunkError, fn: Callable[[Any], Any], item: Any) -> None: ...
+def _run(fn: Callable, cls: type, items: Sequence, workers: int | None, chunksize: int | None, executor: Executor | None, load: bool, dump: bool, *args) -> list | _ChunkError: ...
+def _map(executor: Executor, fn: Callable, cls: type, items: Sequence, chunksize: int, *args) -> list: ...
+
+def fromlist_parallel(cls: type[T],
+                      data: Sequence[JSONObject],
+                      workers: int | None = None,
+                      chunksize: int | None = None,
+                      executor: Executor | None = None) -> list[T]: ...
+
+def asdict_many_parallel(instances: Sequence[T],
+                         cls: type[T] | None = None,
+                         workers: int | None = None,
+                         chunksize: int | None = None,
+                         executor: Executor | None = None) -> list[JSONObject]: ...
+
+def fromjsonl_parallel(cls: type[T],
+                       path_or_stream: FileType | TextIO,
+                       workers: int | None = None,
+                       chunksize: int | None = None,
+                       executor: Executor | None = None,
+                       **decoder_kwargs) -> list[T]: ...
@@ -16,6 +16,7 @@ __all__ = [
 ]
 
 import hashlib
+import re
 import sys
 from datetime import date, datetime, time, tzinfo
 from typing import cast
@@ -45,6 +46,93 @@ def _get_zoneinfo(key: str) -> ZoneInfo:
         raise
 
 
+# Regexes for the (locale-independent, numeric) `strptime` directives that
+# `_compile_pattern` supports; these match the ones `_strptime` uses, except
+# that seconds stop at 59, since `datetime` rejects leap seconds anyway.
+_DIRECTIVE_TO_REGEX = {
+    'Y': r'\d\d\d\d',
+    'y': r'\d\d',
+    'm': r'1[0-2]|0[1-9]|[1-9]',
+    'd': r'3[01]|[12]\d|0[1-9]|[1-9]| [1-9]',
+    'H': r'2[0-3]|[0-1]\d|\d',
+    'M': r'[0-5]\d|\d',
+    'S': r'[0-5]\d|\d',
+    'f': r'[0-9]{1,6}',
+}
+
+_DIRECTIVE_TO_FIELD = {
+    'Y': 'year',
+    'y': 'year',
+    'm': 'month',
+    'd': 'day',
+    'H': 'hour',
+    'M': 'minute',
+    'S': 'second',
+    'f': 'microsecond',
+}
+
+_DATE_FIELDS = ('year', 'month', 'day')
+_TIME_FIELDS = ('hour', 'minute', 'second', 'microsecond')
+_FIELD_DEFAULTS = {'year': '1900', 'month': '1', 'day': '1'}
+
+_DIRECTIVE_OR_SPACE_RE = re.compile(r'%(.)|(\s+)', re.DOTALL)
+
+
+def _compile_pattern(pattern, fields, m='__m'):
+    """
+    Translate a `strptime` format into a compiled regex, and a list of
+    Python expressions (one per field in `fields`) that build the field
+    values from a match object named `m`.
+
+    Returns `None` if the format has a directive which is not supported,
+    or which is not part of `fields` -- e.g. `%H` for a `date` -- in which
+    case the caller should fall back to `strptime`.
+    """
+    parts = []
+    field_to_expr = {}
+    pos = 0
+
+    for match in _DIRECTIVE_OR_SPACE_RE.finditer(pattern):
+        literal = pattern[pos:match.start()]
+        # a stray `%` is an error for `strptime`
+        if '%' in literal:
+            return None
+        parts.append(re.escape(literal))
+        pos = match.end()
+
+        directive = match[1]
+        if directive is None:
+            # like `strptime`, whitespace matches one or more spaces
+            parts.append(r'\s+')
+        elif directive == '%':
+            parts.append('%')
+        elif (field := _DIRECTIVE_TO_FIELD.get(directive)) is None \
+                or field not in fields \
+                or field in field_to_expr:
+            return None
+        else:
+            parts.append(f'({_DIRECTIVE_TO_REGEX[directive]})')
+            g = f'{m}[{len(field_to_expr) + 1}]'
+            if directive == 'y':
+                expr = f'int({g}) + (2000 if int({g}) <= 68 else 1900)'
+            elif directive == 'f':
+                expr = f"int({g}.ljust(6, '0'))"
+            else:
+                expr = f'int({g})'
+            field_to_expr[field] = expr
+
+    literal = pattern[pos:]
+    if '%' in literal:
+        return None
+    parts.append(re.escape(literal))
+
+    # `strptime` also matches case-insensitively
+    regex = re.compile(''.join(parts), re.IGNORECASE)
+    exprs = [field_to_expr.get(f, _FIELD_DEFAULTS.get(f, '0')) for f in fields]
+
+    return regex, exprs
+
+
 class PatternBase:
     __dcw_pattern__ = True
     __slots__ = ('base',
@@ -116,15 +204,12 @@ class PatternBase:
             is_date = True
         elif __base__ is time:
             is_time = True
-            _locals['cls'] = time
         elif issubclass(__base__, datetime):
             is_datetime = is_subclass_datetime = True
         elif issubclass(__base__, date):
             is_date = is_subclass_date = True
-            _locals['cls'] = __base__
         elif issubclass(__base__, time):
             is_time = is_subclass_time = True
-            _locals['cls'] = __base__
 
         _fromisoformat = f'__{tn}_fromisoformat'
         _fromtimestamp = f'__{tn}_fromtimestamp'
@@ -161,6 +246,52 @@ class PatternBase:
 
         tp.ensure_in_locals(extras, **name_to_func)
 
+        if is_date:
+            fields = _DATE_FIELDS
+        elif is_time:
+            fields = _TIME_FIELDS
+        else:
+            fields = _DATE_FIELDS + _TIME_FIELDS
+
+        _locals['cls'] = __base__
+        tz_kwarg = ', tzinfo=__tz' if has_tz else ''
+
+        def parse_with_pattern(i, p):
+            # Parse with a precompiled regex when possible, and construct
+            # the object directly; this is much faster than `strptime`, and
+            # a string which doesn't match raises no error.
+            if (compiled := _compile_pattern(p, fields)) is not None:
+                regex, exprs = compiled
+                _locals[f'__pattern_{i}'] = regex.fullmatch
+
+                with fn_gen.try_():
+                    with fn_gen.if_(f'(__m := __pattern_{i}({v})) is not None'):
+                        fn_gen.add_line(f"return cls({', '.join(exprs)}{tz_kwarg})")
+                with fn_gen.except_(Exception):
+                    fn_gen.add_line('pass')
+                return
+
+            # Otherwise, fall back to `datetime.strptime`
+            with fn_gen.try_():
+                if is_subclass_date:
+                    fn_gen.add_line(f'__dt = {_strptime}({v}, {p!r})')
+                    fn_gen.add_line('return cls('
+                                    '__dt.year, '
+                                    '__dt.month, '
+                                    '__dt.day)')
+                elif is_subclass_time:
+                    fn_gen.add_line(f'__dt = {_strptime}({v}, {p!r})')
+                    fn_gen.add_line('return cls('
+                                    '__dt.hour, '
+                                    '__dt.minute, '
+                                    '__dt.second, '
+                                    '__dt.microsecond'
+                                    f'{tz_kwarg}, fold=__dt.fold)')
+                else:
+                    fn_gen.add_line(f'return {_strptime}({v}, {p!r}){tz_part}{end_part}')
+            with fn_gen.except_(Exception):
+                fn_gen.add_line('pass')
+
         if PY311_OR_ABOVE:
             _parse_iso_string = f'{_fromisoformat}({v}){tz_part}'
             errors_to_except = (TypeError, )
@@ -172,23 +303,9 @@ class PatternBase:
         if (is_time and
                 any('-' in s or '+' in s for s in patterns)):
 
-            for p in patterns:
-                # Try to parse with `datetime.strptime` first
-                with fn_gen.try_():
-                    if is_subclass_time:
-                        tz_arg = '__tz, ' if has_tz else ''
-
-                        fn_gen.add_line(f'__dt = {_strptime}({v}, {p!r})')
-                        fn_gen.add_line('return cls('
-                                        '__dt.hour, '
-                                        '__dt.minute, '
-                                        '__dt.second, '
-                                        '__dt.microsecond, '
-                                        f'{tz_arg}fold=__dt.fold)')
-                    else:
-                        fn_gen.add_line(f'return {_strptime}({v}, {p!r}){tz_part}{end_part}')
-                with fn_gen.except_(Exception):
-                    fn_gen.add_line('pass')
+            # Try to parse with the provided patterns first
+            for i, p in enumerate(patterns):
+                parse_with_pattern(i, p)
             # If that doesn't work, fallback to `time.fromisoformat`
             with fn_gen.try_():
                 fn_gen.add_line(f'return {_parse_iso_string}')
@@ -204,29 +321,9 @@ class PatternBase:
             with fn_gen.except_multi(*errors_to_except):
                 fn_gen.add_line(f'return {_as_func}({_as_func_args})')
             with fn_gen.except_(ValueError):
-                # If that doesn't work, fallback to `datetime.strptime`
-                for p in patterns:
-                    with fn_gen.try_():
-                        if is_subclass_date:
-                            fn_gen.add_line(f'__dt = {_strptime}({v}, {p!r})')
-                            fn_gen.add_line('return cls('
-                                            '__dt.year, '
-                                            '__dt.month, '
-                                            '__dt.day)')
-                        elif is_subclass_time:
-                            fn_gen.add_line(f'__dt = {_strptime}({v}, {p!r})')
-                            tz_arg = '__tz, ' if has_tz else ''
-
-                            fn_gen.add_line('return cls('
-                                            '__dt.hour, '
-                                            '__dt.minute, '
-                                            '__dt.second, '
-                                            '__dt.microsecond, '
-                                            f'{tz_arg}fold=__dt.fold)')
-                        else:
-                            fn_gen.add_line(f'return {_strptime}({v}, {p!r}){tz_part}{end_part}')
-                    with fn_gen.except_(Exception):
-                        fn_gen.add_line('pass')
+                # If that doesn't work, fallback to the provided patterns
+                for i, p in enumerate(patterns):
+                    parse_with_pattern(i, p)
         # Raise a helpful error if we are unable to parse
         # the date string with the provided patterns.
         fn_gen.add_line(
@@ -0,0 +1,228 @@
+"""
+Dump large (or unbounded) sequences of dataclass instances to a file or a
+stream incrementally, as a JSON array, JSON Lines (NDJSON), or a YAML
+sequence.
+
+Each instance is dumped and encoded as it's consumed from the iterable --
+for example, a generator over the rows of a database cursor -- and the
+encoded text is written out `chunk_size` characters at a time, so memory
+use doesn't grow with the number of instances.
+
+The output can be written to a file path, or to an open text or binary
+stream, such as ``socket.makefile('wb')``; text is encoded as UTF-8 for a
+binary stream.
+"""
+__all__ = [
+    'dump_iter_json',
+    'dump_iter_jsonl',
+    'dump_iter_yaml',
+]
+
+import io
+import json
+from contextlib import nullcontext
+from dataclasses import MISSING
+from itertools import chain, islice
+
+from ._dumpers import asdict_many, get_dump_func, get_json_dump_func
+from ._lazy_imports import yaml
+from .utils._json_stream import DEFAULT_CHUNK_SIZE
+
+
+# Number of instances encoded with each `yaml.dump()` call.
+YAML_BATCH_SIZE = 1000
+
+
+def _open(path_or_stream, mode):
+    """Open a file path, or return a context manager for an open stream."""
+    if hasattr(path_or_stream, 'read' if mode == 'r' else 'write'):
+        return nullcontext(path_or_stream)
+
+    return open(path_or_stream, mode, encoding='utf-8')
+
+
+def _with_cls(instances, cls):
+    """
+    Return the dataclass type -- the type of the first instance, if `cls`
+    is not given -- and an iterator over `instances`.
+    """
+    it = iter(instances)
+
+    if cls is None:
+        if (first := next(it, MISSING)) is MISSING:
+            return None, it
+        cls = type(first)
+        it = chain((first, ), it)
+
+    return cls, it
+
+
+def _chunked_writer(out_file, chunk_size):
+    """
+    Return a `write(text)` function which buffers the text, and writes it
+    to `out_file` once there are at least `chunk_size` characters; and a
+    `flush()` function to write the rest.
+    """
+    parts = []
+    size = 0
+
+    out_write = out_file.write
+
+    if isinstance(out_file, (io.RawIOBase, io.BufferedIOBase)):
+        write_bytes = out_write
+
+        def out_write(text):
+            write_bytes(text.encode('utf-8'))
+
+    def flush():
+        nonlocal size
+
+        if parts:
+            out_write(''.join(parts))
+            parts.clear()
+            size = 0
+
+    def write(text):
+        nonlocal size
+
+        parts.append(text)
+        size += len(text)
+
+        if size >= chunk_size:
+            flush()
+
+    return write, flush
+
+
+def _json_encoder(cls, encoder_kwargs):
+    """Return a function to encode an instance of `cls` as JSON text."""
+    if not encoder_kwargs:
+        # same output as `json.dumps(asdict(o))`, but encoded directly
+        return get_json_dump_func(cls)
+
+    encoder_cls = encoder_kwargs.pop('cls', None) or json.JSONEncoder
+    encode = encoder_cls(**encoder_kwargs).encode
+    dump = get_dump_func(cls)
+
+    return lambda o: encode(dump(o))
+
+
+def dump_iter_json(instances, fp, cls=None, *,
+                   chunk_size=DEFAULT_CHUNK_SIZE,
+                   **encoder_kwargs):
+    """
+    Serializes the dataclass instances, and writes them as a (top-level)
+    JSON array to a file path or a stream, incrementally.
+
+    The output is the same as with ``json.dump([asdict(o) for o in
+    instances], fp, **encoder_kwargs)``, including for the ``indent`` and
+    ``separators`` arguments.
+
+    :param instances: An iterable of instances of the same dataclass.
+    :param fp: A file path, or a text or binary stream.
+    :param cls: The dataclass type; defaults to the type of the first
+      instance.
+    :param chunk_size: The (minimum) number of characters for each
+      ``write()`` call.
+    :return: The number of instances written.
+    """
+    cls, it = _with_cls(instances, cls)
+
+    if (indent := encoder_kwargs.get('indent')) is not None and not isinstance(indent, str):
+        indent = ' ' * indent
+
+    if (separators := encoder_kwargs.get('separators')) is not None:
+        item_separator = separators[0]
+    else:
+        item_separator = ', ' if indent is None else ','
+
+    if indent is None:
+        start, end = '[', ']'
+    else:
+        # an element spans several lines, which are indented one level
+        start, end = f'[\n{indent}', '\n]'
+        item_separator += f'\n{indent}'
+
+    count = 0
+
+    with _open(fp, 'w') as out_file:
+        write, flush = _chunked_writer(out_file, chunk_size)
+
+        if cls is not None:
+            encode = _json_encoder(cls, encoder_kwargs)
+
+            for o in it:
+                write(item_separator if count else start)
+                write(encode(o).replace('\n', f'\n{indent}') if indent else encode(o))
+                count += 1
+
+        write(end if count else '[]')
+        flush()
+
+    return count
+
+
+def dump_iter_jsonl(instances, fp, cls=None, *,
+                    mode='w',
+                    chunk_size=DEFAULT_CHUNK_SIZE,
+                    **encoder_kwargs):
+    """
+    Serializes the dataclass instances, and writes them as JSON Lines
+    (NDJSON) to a file path or a stream, incrementally.
+
+    :param mode: The mode to open a file path with, e.g. ``a`` to append.
+    :return: The number of lines written.
+
+    See :func:`dump_iter_json` for the other parameters.
+    """
+    cls, it = _with_cls(instances, cls)
+
+    count = 0
+
+    with _open(fp, mode) as out_file:
+        if cls is not None:
+            write, flush = _chunked_writer(out_file, chunk_size)
+            encode = _json_encoder(cls, encoder_kwargs)
+
+            for o in it:
+                write(encode(o) + '\n')
+                count += 1
+
+            flush()
+
+    return count
+
+
+def dump_iter_yaml(instances, fp, cls=None, *,
+                   chunk_size=DEFAULT_CHUNK_SIZE,
+                   **encoder_kwargs):
+    """
+    Serializes the dataclass instances, and writes them as a (top-level)
+    YAML sequence to a file path or a stream, incrementally.
+
+    The instances are encoded ``YAML_BATCH_SIZE`` at a time, with
+    ``yaml.dump(..., **encoder_kwargs)``; so the encoder arguments should
+    keep the default (block) style, with no explicit document start or end.
+
+    :return: The number of instances written.
+
+    See :func:`dump_iter_json` for the other parameters.
+    """
+    cls, it = _with_cls(instances, cls)
+
+    count = 0
+
+    with _open(fp, 'w') as out_file:
+        write, flush = _chunked_writer(out_file, chunk_size)
+
+        if cls is not None:
+            while batch := list(islice(it, YAML_BATCH_SIZE)):
+                write(yaml.dump(asdict_many(batch, cls), **encoder_kwargs))
+                count += len(batch)
+
+        if not count:
+            write(yaml.dump([], **encoder_kwargs))
+
+        flush()
+
+    return count
@@ -0,0 +1,32 @@
+from collections.abc import Callable, Iterable, Iterator
+from typing import Any, BinaryIO, TextIO
+
+from ._type_def import FileType, T
+
+__all__ = ['dump_iter_json', 'dump_iter_jsonl', 'dump_iter_yaml']
+
+YAML_BATCH_SIZE: int
+
+def _open(path_or_stream: FileType | TextIO | BinaryIO, mode: str): ...
+def _with_cls(instances: Iterable[T], cls: type[T] | None) -> tuple[type[T] | None, Iterator[T]]: ...
+def _chunked_writer(out_file: TextIO | BinaryIO, chunk_size: int) -> tuple[Callable[[str], None], Callable[[], None]]: ...
+def _json_encoder(cls: type[T], encoder_kwargs: dict[str, Any]) -> Callable[[T], str]: ...
+
+def dump_iter_json(instances: Iterable[T],
+                   fp: FileType | TextIO | BinaryIO,
+                   cls: type[T] | None = None, *,
+                   chunk_size: int = ...,
+                   **encoder_kwargs) -> int: ...
+
+def dump_iter_jsonl(instances: Iterable[T],
+                    fp: FileType | TextIO | BinaryIO,
+                    cls: type[T] | None = None, *,
+                    mode: str = 'w',
+                    chunk_size: int = ...,
+                    **encoder_kwargs) -> int: ...
+
+def dump_iter_yaml(instances: Iterable[T],
+                   fp: FileType | TextIO | BinaryIO,
+                   cls: type[T] | None = None, *,
+                   chunk_size: int = ...,
+                   **encoder_kwargs) -> int: ...
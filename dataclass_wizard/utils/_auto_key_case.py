@@ -0,0 +1,105 @@
+"""
+Learning the key casing of the input, for a dataclass loaded with
+``load_case='AUTO'`` and ``load_case_learn_after`` set.
+"""
+from ._string_conv import AUTO_KEY_CASES, json_keys_by_case
+
+
+# The key is the same as the field name.
+EXACT = 'EXACT'
+
+# All the casings, in the order they are tried.
+_CASES = (EXACT, *AUTO_KEY_CASES)
+
+
+class AutoKeyCase:
+    """
+    Tracks the casing of the keys found for a dataclass by the load
+    function.
+
+    Each field is first looked up by its key in :attr:`keys` -- initially,
+    the field name -- and only if that is missing, by all the possible keys.
+    When a field is found by one of those, :meth:`found` is called; once
+    `threshold` keys in a row are found in the same casing, :attr:`keys` is
+    swapped for the keys in that casing, so that a single lookup is needed
+    per field.
+
+    If a key is later found in a different casing, the casing is learned
+    again, starting from the field names.
+    """
+    __slots__ = ('fields',
+                 'keys',
+                 'learned',
+                 'seen',
+                 'relearned',
+                 'threshold',
+                 '_case_to_keys',
+                 '_field_keys',
+                 '_candidates',
+                 '_streak')
+
+    def __init__(self, fields, threshold):
+        self.fields = self.keys = fields = tuple(fields)
+        self.learned = None
+        self.seen = dict.fromkeys(_CASES, 0)
+        self.relearned = 0
+        self.threshold = threshold
+        self._candidates = frozenset()
+        self._streak = 0
+
+        self._case_to_keys = case_to_keys = {EXACT: fields}
+        for case, keys in zip(AUTO_KEY_CASES,
+                              zip(*map(json_keys_by_case, fields))):
+            case_to_keys[case] = keys
+
+        # per field: each possible key, and the casings which produce it
+        self._field_keys = field_keys = []
+        for i in range(len(fields)):
+            key_to_cases = {}
+            for case in _CASES:
+                key_to_cases.setdefault(case_to_keys[case][i], set()).add(case)
+
+            field_keys.append([(key, frozenset(cases))
+                               for key, cases in key_to_cases.items()])
+
+    def found(self, o, i):
+        """
+        Called when field `i` is found in `o`, but not by its key in
+        :attr:`keys`; always returns True.
+        """
+        for key, cases in self._field_keys[i]:
+            if key in o:
+                break
+        else:
+            return True
+
+        if self.learned in cases:
+            # the casing was learned while loading the current object
+            return True
+
+        candidates = self._candidates & cases
+        if candidates:
+            self._streak += 1
+        else:
+            candidates = cases
+            self._streak = 1
+        self._candidates = candidates
+
+        case = next(c for c in _CASES if c in candidates)
+        self.seen[case] += 1
+
+        if self.learned is not None:
+            self.learned = None
+            self.keys = self.fields
+            self.relearned += 1
+
+        elif self._streak >= self.threshold:
+            self.learned = case
+            self.keys = self._case_to_keys[case]
+
+        return True
+
+    def info(self):
+        return {'learned': self.learned,
+                'seen': {case: n for case, n in self.seen.items() if n},
+                'relearned': self.relearned}
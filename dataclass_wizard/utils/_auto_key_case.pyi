@@ -0,0 +1,21 @@
+from collections.abc import Iterable, Mapping
+from typing import Any, TypedDict
+
+EXACT: str
+
+class AutoKeyCaseInfo(TypedDict):
+    learned: str | None
+    seen: dict[str, int]
+    relearned: int
+
+class AutoKeyCase:
+    fields: tuple[str, ...]
+    keys: tuple[str, ...]
+    learned: str | None
+    seen: dict[str, int]
+    relearned: int
+    threshold: int
+
+    def __init__(self, fields: Iterable[str], threshold: int) -> None: ...
+    def found(self, o: Mapping[str, Any], i: int) -> bool: ...
+    def info(self) -> AutoKeyCaseInfo: ...
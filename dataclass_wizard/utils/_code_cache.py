@@ -0,0 +1,201 @@
+"""
+Caches for the code compiled by :meth:`FunctionBuilder.create_functions`:
+
+* an opt-in, on-disk cache of marshalled code objects, and
+* a registry of "pre-compiled" functions, which are emitted as a plain
+  Python module by the ``wiz compile`` command.
+
+The generated source text is a deterministic function of a class's fields,
+resolved annotations, ``Meta`` settings and the library version, so it is
+used (hashed) as the key for both; the expensive part on a cold start is the
+``compile()`` step, which is what gets skipped on a hit.
+"""
+import marshal
+import os
+import sys
+from hashlib import blake2b
+from importlib.util import MAGIC_NUMBER
+from types import CodeType, FunctionType
+
+from .._log import LOG
+from ..__version__ import __version__
+from ..constants import CODE_CACHE_DIR, PACKAGE_NAME
+
+
+# Salt mixed into every cache key, so that entries written by a different
+# interpreter (bytecode format) or library version are never re-used.
+_KEY_SALT = b'|'.join((
+    MAGIC_NUMBER,
+    (sys.implementation.cache_tag or '').encode(),
+    __version__.encode(),
+))
+
+# File name (suffix) for cached code objects.
+_SUFFIX = '.marshal'
+
+
+def source_key(source, salt=__version__.encode()):
+    """Return the cache key (a hex digest) for generated source code."""
+    h = blake2b(salt, digest_size=20)
+    h.update(source.encode())
+    return h.hexdigest()
+
+
+def default_cache_dir():
+    """Return the default cache directory (``$XDG_CACHE_HOME`` aware)."""
+    base = os.getenv('XDG_CACHE_HOME') or os.path.join(
+        os.path.expanduser('~'), '.cache')
+    return os.path.join(base, PACKAGE_NAME.replace('_', '-'))
+
+
+class CodeCache:
+    """
+    Stores marshalled code objects in a directory, one file per generated
+    source text.
+
+    All I/O errors are swallowed (and logged), in which case we simply fall
+    back to compiling the source, as if the cache was disabled.
+    """
+    __slots__ = ('directory', 'hits', 'misses')
+
+    def __init__(self, directory):
+        self.directory = os.fspath(directory)
+        self.hits = self.misses = 0
+
+    def _path(self, source):
+        return os.path.join(self.directory,
+                            source_key(source, _KEY_SALT) + _SUFFIX)
+
+    def load_or_compile(self, source, filename='<string>'):
+        """Return the code object for `source`, compiling it on a miss."""
+        path = self._path(source)
+
+        try:
+            with open(path, 'rb') as f:
+                code = marshal.load(f)
+        except FileNotFoundError:
+            pass
+        except (OSError, EOFError, ValueError, TypeError) as e:
+            LOG.debug('Ignoring unreadable code cache entry %s: %s', path, e)
+        else:
+            if isinstance(code, CodeType):
+                self.hits += 1
+                return code
+
+        self.misses += 1
+        code = compile(source, filename, 'exec')
+
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            # write to a temp file and then rename, so that concurrent
+            # processes never observe a partially-written entry.
+            tmp_path = f'{path}.{os.getpid()}.tmp'
+            with open(tmp_path, 'wb') as f:
+                marshal.dump(code, f)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            LOG.debug('Unable to write code cache entry %s: %s', path, e)
+
+        return code
+
+    def clear(self):
+        """Remove all cache entries from the directory."""
+        removed = 0
+        try:
+            names = os.listdir(self.directory)
+        except OSError:
+            return removed
+
+        for name in names:
+            if name.endswith(_SUFFIX):
+                try:
+                    os.remove(os.path.join(self.directory, name))
+                except OSError:
+                    continue
+                removed += 1
+
+        return removed
+
+    def stats(self):
+        return {'directory': self.directory,
+                'hits': self.hits,
+                'misses': self.misses}
+
+
+# The active code cache, or `None` if the cache is disabled (default).
+CODE_CACHE = CodeCache(CODE_CACHE_DIR) if CODE_CACHE_DIR else None
+
+
+def get_code_cache():
+    return CODE_CACHE
+
+
+def set_code_cache(directory):
+    global CODE_CACHE
+
+    CODE_CACHE = None if directory is None else CodeCache(directory)
+    return CODE_CACHE
+
+
+# Maps a source key to a function which returns the pre-compiled factory
+# functions for that source; populated by modules that ``wiz compile`` emits.
+PRECOMPILED = {}
+
+# A list of `(source, factory_names)` for all generated code, only set while
+# capturing the output for ``wiz compile``.
+CAPTURED = None
+
+
+def is_aot_active():
+    """
+    Return true if pre-compiled functions are registered, or are being
+    captured for ``wiz compile``.
+
+    In that case, generated code needs to be the same regardless of the
+    order in which classes are first used, so functions for nested
+    dataclasses are not shared across root classes.
+    """
+    return CAPTURED is not None or bool(PRECOMPILED)
+
+
+def register_precompiled(version, groups):
+    """Register pre-compiled function groups, generated for `version`."""
+    if version != __version__:
+        LOG.warning('Ignoring functions pre-compiled for dataclass-wizard '
+                    '%s (installed version: %s); re-run `wiz compile` to '
+                    'update them.', version, __version__)
+        return 0
+
+    PRECOMPILED.update(groups)
+    return len(groups)
+
+
+def compile_source(source):
+    """
+    Return the code object for `source` from the code cache, or `source`
+    itself (to be passed to ``exec`` as-is) if the cache is disabled.
+    """
+    cache = CODE_CACHE
+    if cache is None:
+        return source
+    return cache.load_or_compile(source)
+
+
+def exec_source(source, factory_names, _globals):
+    """
+    Define the (factory) functions in `source`, and return the namespace
+    containing them.
+
+    If `source` was pre-compiled by ``wiz compile``, the functions are
+    re-created from their code objects instead, which avoids ``exec``.
+    """
+    if CAPTURED is not None:
+        CAPTURED.append((source, factory_names))
+
+    if PRECOMPILED and (group := PRECOMPILED.get(source_key(source))):
+        return {f.__name__: FunctionType(f.__code__, _globals)
+                for f in group()}
+
+    ns = {}
+    exec(compile_source(source), _globals, ns)
+    return ns
@@ -0,0 +1,38 @@
+from os import PathLike
+from types import CodeType
+from typing import Any, Callable, TypedDict
+
+_KEY_SALT: bytes
+_SUFFIX: str
+
+class CodeCacheStats(TypedDict):
+    directory: str
+    hits: int
+    misses: int
+
+def source_key(source: str, salt: bytes = ...) -> str: ...
+def default_cache_dir() -> str: ...
+
+class CodeCache:
+    directory: str
+    hits: int
+    misses: int
+    def __init__(self, directory: str | PathLike[str]) -> None: ...
+    def _path(self, source: str) -> str: ...
+    def load_or_compile(self, source: str, filename: str = '<string>') -> CodeType: ...
+    def clear(self) -> int: ...
+    def stats(self) -> CodeCacheStats: ...
+
+CODE_CACHE: CodeCache | None
+
+def get_code_cache() -> CodeCache | None: ...
+def set_code_cache(directory: str | PathLike[str] | None) -> CodeCache | None: ...
+PRECOMPILED: dict[str, Callable[[], tuple[Callable, ...]]]
+CAPTURED: list[tuple[str, list[str]]] | None
+
+def is_aot_active() -> bool: ...
+def register_precompiled(version: str,
+                         groups: dict[str, Callable[[], tuple[Callable, ...]]]) -> int: ...
+def compile_source(source: str) -> CodeType | str: ...
+def exec_source(source: str, factory_names: list[str],
+                _globals: dict[str, Any]) -> dict[str, Callable]: ...
@@ -2,6 +2,7 @@ from dataclasses import MISSING
 from typing import Any
 
 from .._log import LOG
+from . import _code_cache
 
 
 def is_builtin_class(cls):
@@ -9,11 +10,23 @@ def is_builtin_class(cls):
     return cls.__module__ == 'builtins'
 
 
+def called_function_name(expr, arg):
+    """
+    Return the function name, if `expr` is a plain call of a (generated)
+    function with `arg`, as in ``name(arg)``; otherwise, return None.
+    """
+    name, sep, rest = expr.partition('(')
+    if sep and rest == f'{arg})' and name.isidentifier():
+        return name
+    return None
+
+
 class FunctionBuilder:
     __slots__ = (
         'current_function',
         'prev_function',
         'functions',
+        'exports',
         'globals',
         'indent_level',
         'namespace',
@@ -21,6 +34,9 @@ class FunctionBuilder:
 
     def __init__(self):
         self.functions = {}
+        # list of `(mapping, key, fn_name)`: the function named `fn_name`
+        # (created, or linked in globals) is saved as `mapping[key]`
+        self.exports = []
         self.indent_level = 0
         self.globals = {}
         self.namespace = {}
@@ -34,6 +50,7 @@ class FunctionBuilder:
 
         """
         self.functions |= other.functions
+        self.exports += other.exports
         self.globals |= other.globals
         return self
 
@@ -310,14 +327,15 @@ class FunctionBuilder:
         # logging.debug(f"Generated function code:\n{all_func_code}")
         LOG.debug("Generated function code:\n%s", txt)
 
-        ns = {}
-
         # TODO
         _globals = self.globals if _globals is None else _globals | self.globals
 
         LOG.debug("Globals before function compilation: %s", _globals)
 
-        exec(txt, _globals, ns)
+        ns = _code_cache.exec_source(
+            txt,
+            [f'__create_{name}_fn__' for name, _, _ in fn_name_locals_and_code],
+            _globals)
 
         # TODO do we need self.namespace?
         final_ns = self.namespace = {}
@@ -332,6 +350,9 @@ class FunctionBuilder:
         #     for name, locals, _ in fn_name_locals_and_code
         # }
 
+        for mapping, key, name in self.exports:
+            mapping[key] = _globals[name]
+
         # Print namespace for debugging
         LOG.debug("Namespace after function compilation: %s", final_ns)
 
@@ -5,10 +5,12 @@ from typing import Any
 from _typeshed import Incomplete
 
 def is_builtin_class(cls: type) -> bool: ...
+def called_function_name(expr: str, arg: str) -> str | None: ...
 
 class FunctionBuilder:
     current_function: Incomplete
     functions: Incomplete
+    exports: list[tuple[dict, Any, str]]
     globals: Incomplete
     indent_level: Incomplete
     namespace: Incomplete
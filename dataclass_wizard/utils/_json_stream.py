@@ -0,0 +1,166 @@
+"""
+Incremental decoding of a top-level JSON array, one element at a time.
+"""
+import json
+import re
+from codecs import getincrementaldecoder
+
+
+# Number of characters (or bytes) to read from a stream at a time.
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+# Maximum number of characters which an element of the array can take up
+# in the buffer, before it's decoded.
+DEFAULT_MAX_ELEMENT_SIZE = 64 * 1024 * 1024
+
+_WHITESPACE = re.compile(r'[ \t\n\r]*').match
+
+
+def _skip_ws(buf, pos):
+    return _WHITESPACE(buf, pos).end()
+
+
+def _stream_reader(stream):
+    """Return a `read(size)` function which always returns text."""
+    stream_read = stream.read
+    decode = None
+
+    def read(size):
+        nonlocal decode
+
+        while True:
+            chunk = stream_read(size)
+            if isinstance(chunk, str):
+                return chunk
+
+            # binary stream: decode the bytes as they come in
+            if decode is None:
+                encoding = json.detect_encoding(chunk) if chunk else 'utf-8'
+                decode = getincrementaldecoder(encoding)().decode
+
+            text = decode(chunk, final=not chunk)
+            # an empty result can also mean a partial (multibyte) character
+            if text or not chunk:
+                return text
+
+    return read
+
+
+def iter_json_array(stream, chunk_size=DEFAULT_CHUNK_SIZE, *,
+                    max_element_size=DEFAULT_MAX_ELEMENT_SIZE,
+                    **decoder_kwargs):
+    """
+    Decode a top-level JSON array from `stream` -- a text or binary file
+    object, or a ``str`` / ``bytes`` document -- and yield each element.
+
+    Streams are read `chunk_size` at a time, and the consumed part of the
+    buffer is dropped, so peak memory scales with the largest element rather
+    than the whole document. A :class:`json.JSONDecodeError` is raised if an
+    element can't be decoded within `max_element_size` characters (unless
+    it's None), so a malformed element doesn't read the rest of the stream.
+
+    `decoder_kwargs` are passed to :class:`json.JSONDecoder` (or the
+    subclass given as `cls`), same as with :func:`json.loads`. Note that
+    the position in a :class:`json.JSONDecodeError` is relative to the
+    current buffer, rather than the start of the document.
+    """
+    buf = ''
+    pos = 0
+    eof = False
+
+    if isinstance(stream, (str, bytes, bytearray)):
+        if not isinstance(stream, str):
+            stream = stream.decode(json.detect_encoding(stream))
+        buf = stream
+        eof = True
+        read = None
+    else:
+        read = _stream_reader(stream)
+
+    cls = decoder_kwargs.pop('cls', None) or json.JSONDecoder
+    raw_decode = cls(**decoder_kwargs).raw_decode
+
+    def fill(size):
+        # drop the consumed part of the buffer, then read more data.
+        nonlocal buf, pos, eof
+
+        chunk = read(size)
+        if chunk:
+            buf = buf[pos:] + chunk
+        else:
+            buf = buf[pos:]
+            eof = True
+        pos = 0
+
+    def next_char():
+        # position of the next non-whitespace character, reading as needed.
+        nonlocal pos
+
+        while True:
+            pos = _skip_ws(buf, pos)
+            if pos < len(buf) or eof:
+                return pos
+            fill(chunk_size)
+
+    def check_end():
+        # only whitespace can follow the closing `]`.
+        if next_char() < len(buf):
+            raise json.JSONDecodeError('Extra data', buf, pos)
+
+    if next_char() >= len(buf) or buf[pos] != '[':
+        raise json.JSONDecodeError(
+            'Expecting a top-level JSON array', buf, pos)
+
+    pos += 1
+    if next_char() < len(buf) and buf[pos] == ']':
+        pos += 1
+        check_end()
+        return
+
+    while True:
+        next_char()
+
+        # read until the element is complete; the read size is doubled each
+        # time, so that large elements are not decoded too many times.
+        size = chunk_size
+        while True:
+            error = None
+            try:
+                obj, end = raw_decode(buf, pos)
+            except json.JSONDecodeError as e:
+                if eof:
+                    raise
+                error = e
+            else:
+                # a complete element is followed by a `,` or `]` -- this also
+                # makes sure we don't stop in the middle of a number.
+                end = _skip_ws(buf, end)
+                if end < len(buf) or eof:
+                    break
+
+            read_size = max(size, len(buf) - pos)
+
+            if max_element_size is not None:
+                if (pending := len(buf) - pos) > max_element_size:
+                    raise json.JSONDecodeError(
+                        f'Element is not complete within {max_element_size} '
+                        f'characters (max_element_size)', buf, pos) from error
+                # read at most one chunk past the limit
+                read_size = min(read_size,
+                                max_element_size - pending + chunk_size)
+
+            fill(read_size)
+            size *= 2
+
+        pos = end
+        yield obj
+
+        if pos < len(buf) and buf[pos] == ',':
+            pos += 1
+        elif pos < len(buf) and buf[pos] == ']':
+            pos += 1
+            check_end()
+            return
+        else:
+            raise json.JSONDecodeError(
+                "Expecting ',' delimiter or ']'", buf, pos)
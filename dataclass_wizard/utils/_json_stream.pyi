@@ -0,0 +1,14 @@
+import json
+from typing import Any, Callable, IO, Iterator
+
+DEFAULT_CHUNK_SIZE: int
+DEFAULT_MAX_ELEMENT_SIZE: int
+
+def _skip_ws(buf: str, pos: int) -> int: ...
+def _stream_reader(stream: IO[str] | IO[bytes]) -> Callable[[int], str]: ...
+def iter_json_array(stream: IO[str] | IO[bytes] | str | bytes | bytearray,
+                    chunk_size: int = DEFAULT_CHUNK_SIZE,
+                    *,
+                    max_element_size: int | None = DEFAULT_MAX_ELEMENT_SIZE,
+                    cls: type[json.JSONDecoder] | None = None,
+                    **decoder_kwargs: Any) -> Iterator[Any]: ...
@@ -1,4 +1,6 @@
 __all__ = ['normalize',
+           'AUTO_KEY_CASES',
+           'json_keys_by_case',
            'possible_json_keys',
            'possible_env_vars',
            'repl_or_with_union']
@@ -17,45 +19,59 @@ def normalize(string: str) -> str:
     return string.replace('-', '').replace('_', '').upper()
 
 
-def possible_json_keys(field: str) -> list[str]:
-    """
-    Maps a dataclass field name to its possible keys in a JSON object.
+# The key casings for `KeyCase.AUTO`, in the order they are tried.
+AUTO_KEY_CASES = ('CAMEL', 'PASCAL', 'KEBAB', 'UPPER_KEBAB', 'UPPER_SNAKE', 'SNAKE')
 
-    This function checks multiple naming conventions (e.g., camelCase,
-    PascalCase, kebab-case, etc.) to find the matching key in the JSON
-    object `o`. It also caches the mapping for future use.
 
-    Args:
-        field (str): The dataclass field name to map.
-
-    Returns:
-        list[str]: The possible JSON keys for the given field.
+def json_keys_by_case(field: str) -> list[str]:
+    """
+    Maps a dataclass field name to its key in a JSON object, for each
+    casing in :data:`AUTO_KEY_CASES` (some keys may be the same).
     """
-    possible_keys = []
+    keys = []
 
     # `camelCase`
     _key = to_camel_case(field)
-    possible_keys.append(_key)
+    keys.append(_key)
 
     # `PascalCase`: same as `camelCase` but first letter is capitalized
     _key = _key[0].upper() + _key[1:]
-    possible_keys.append(_key)
+    keys.append(_key)
 
     # `kebab-case`
     _key = to_lisp_case(field)
-    possible_keys.append(_key)
+    keys.append(_key)
 
     # `Upper-Kebab`: same as `kebab-case`, each word is title-cased
     _key = _key.title()
-    possible_keys.append(_key)
+    keys.append(_key)
 
     # `Upper_Snake`
     _key = _key.replace('-', '_')
-    possible_keys.append(_key)
+    keys.append(_key)
 
     # `snake_case`
     _key = _key.lower()
-    possible_keys.append(_key)
+    keys.append(_key)
+
+    return keys
+
+
+def possible_json_keys(field: str) -> list[str]:
+    """
+    Maps a dataclass field name to its possible keys in a JSON object.
+
+    This function checks multiple naming conventions (e.g., camelCase,
+    PascalCase, kebab-case, etc.) to find the matching key in the JSON
+    object `o`. It also caches the mapping for future use.
+
+    Args:
+        field (str): The dataclass field name to map.
+
+    Returns:
+        list[str]: The possible JSON keys for the given field.
+    """
+    possible_keys = json_keys_by_case(field)
 
     # remove 1:1 field mapping from possible keys,
     # as that's the first thing we check.
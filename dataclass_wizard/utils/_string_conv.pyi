@@ -1,4 +1,6 @@
 __all__ = ['normalize',
+           'AUTO_KEY_CASES',
+           'json_keys_by_case',
            'possible_json_keys',
            'possible_env_vars',
            'repl_or_with_union']
@@ -6,6 +8,9 @@ __all__ = ['normalize',
 from ..enums import EnvKeyStrategy
 
 def normalize(string: str) -> str: ...
+AUTO_KEY_CASES: tuple[str, ...]
+
+def json_keys_by_case(field: str) -> list[str]: ...
 def possible_json_keys(field: str) -> list: ...
 def possible_env_vars(field: str, lookup_strat: EnvKeyStrategy) -> list: ...
 def to_camel_case(string: str) -> str: ...
@@ -1,8 +1,9 @@
 import json
 
 from .._decorators import cached_property
-from .._dumpers import asdict
+from .._dumpers import asdict_many
 from .._type_def import T
+from ..stream import dump_iter_json
 from ._dataclass_compat import set_new_attribute, str_pprint_fn
 
 
@@ -51,7 +52,7 @@ class Container(list[T]):
                 **encoder_kwargs):
 
         cls = self.__model__
-        list_of_dict = [asdict(o, cls=cls) for o in self]
+        list_of_dict = asdict_many(self, cls)
 
         return encoder(list_of_dict, **encoder_kwargs)
 
@@ -60,7 +61,10 @@ class Container(list[T]):
                      **encoder_kwargs):
 
         cls = self.__model__
-        list_of_dict = [asdict(o, cls=cls) for o in self]
 
         with open(file, mode) as out_file:
-            encoder(list_of_dict, out_file, **encoder_kwargs)
+            if encoder is json.dump:
+                # write the JSON array incrementally
+                dump_iter_json(self, out_file, cls, **encoder_kwargs)
+            else:
+                encoder(asdict_many(self, cls), out_file, **encoder_kwargs)
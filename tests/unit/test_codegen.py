@@ -0,0 +1,329 @@
+from dataclasses import dataclass
+from datetime import date, datetime, time, timezone
+
+import pytest
+
+from dataclass_wizard import LoadMeta, asdict, fromdict
+from dataclass_wizard.codegen import (
+    enable_code_cache, disable_code_cache, clear_code_cache, code_cache_info,
+    key_case_info, datetime_parse_cache_info,
+)
+
+
+@pytest.fixture
+def code_cache(tmp_path):
+    directory = enable_code_cache(tmp_path / 'cache')
+    yield directory
+    disable_code_cache()
+
+
+def _new_class():
+    @dataclass
+    class MyClass:
+        my_str: str
+        my_int: int = 1
+
+    return MyClass
+
+
+def test_code_cache_is_disabled_by_default():
+    assert code_cache_info() is None
+    assert clear_code_cache() == 0
+
+
+def test_code_cache_hit_on_identical_class(code_cache):
+    c1 = _new_class()
+    assert fromdict(c1, {'my_str': 'a', 'my_int': '2'}) == c1('a', 2)
+    assert asdict(c1('b')) == {'my_str': 'b', 'my_int': 1}
+
+    info = code_cache_info()
+    assert info['directory'] == code_cache
+    assert (info['hits'], info['misses']) == (0, 2)
+
+    # a new (but identical) class generates the same source code, so both
+    # the load and dump functions are re-used from the code cache.
+    c2 = _new_class()
+    assert fromdict(c2, {'my_str': 'a'}) == c2('a')
+    assert asdict(c2('b', 3)) == {'my_str': 'b', 'my_int': 3}
+
+    info = code_cache_info()
+    assert (info['hits'], info['misses']) == (2, 2)
+
+    assert clear_code_cache() == 2
+    assert clear_code_cache(code_cache) == 0
+
+
+def test_code_cache_ignores_corrupt_entries(code_cache, tmp_path):
+    c1 = _new_class()
+    fromdict(c1, {'my_str': 'a'})
+
+    for path in (tmp_path / 'cache').iterdir():
+        path.write_bytes(b'not a code object')
+
+    c2 = _new_class()
+    assert fromdict(c2, {'my_str': 'a', 'my_int': 5}) == c2('a', 5)
+
+    info = code_cache_info()
+    assert (info['hits'], info['misses']) == (0, 2)
+
+
+def test_warmup_classes():
+    from dataclass_wizard import JSONWizard
+    from dataclass_wizard.codegen import warmup
+
+    @dataclass
+    class Inner:
+        my_int: int
+
+    @dataclass
+    class Outer(JSONWizard):
+        inner: Inner
+
+    timings = warmup(Outer, Inner, Outer, dump=False)
+
+    assert list(timings) == [Outer, Inner]
+    assert list(timings[Outer]) == ['load']
+    assert timings[Outer]['load'] > 0
+
+    # the load function is already generated, and is bound to the class
+    assert Outer.from_dict is vars(Outer)['__dataclass_wizard_from_dict__']
+    assert Outer.from_dict({'inner': {'my_int': '1'}}) == Outer(Inner(1))
+
+    warmup(Outer, load=False)
+    assert callable(vars(Outer)['__dataclass_wizard_to_dict__'])
+
+
+def test_warmup_modules_in_background(mocker):
+    from types import ModuleType
+
+    from dataclass_wizard import EnvWizard
+    from dataclass_wizard.codegen import warmup
+    from .conftest import SampleClass
+
+    class MyEnv(EnvWizard):
+        my_value: str = 'test'
+
+    module = ModuleType('my_module')
+    module.MyEnv = MyEnv
+    # classes imported from other modules are not included
+    module.SampleClass = SampleClass
+    MyEnv.__module__ = module.__name__
+
+    mock_gen = mocker.patch('dataclass_wizard.codegen.generate_functions',
+                            return_value={'load': 0.1, 'dump': 0.2})
+
+    future = warmup(module, 'tests.unit.conftest', background=True)
+    timings = future.result(timeout=10)
+
+    assert list(timings) == [MyEnv, SampleClass]
+    assert timings[SampleClass] == {'load': 0.1, 'dump': 0.2}
+    assert mock_gen.call_count == 2
+
+    assert list(warmup(module, env=False)) == []
+
+
+def test_warmup_with_invalid_argument():
+    from dataclass_wizard.codegen import warmup
+
+    with pytest.raises(TypeError, match='Expected a dataclass or a module'):
+        warmup(int)
+
+
+def test_nested_functions_are_shared_across_root_classes():
+    from dataclass_wizard import JSONWizard
+    from dataclass_wizard._class_helper import (
+        NESTED_DUMP_FUNCTIONS, NESTED_LOAD_FUNCTIONS,
+    )
+
+    @dataclass
+    class Address:
+        street_name: str
+
+    @dataclass
+    class User:
+        address: Address
+
+    @dataclass
+    class Company:
+        addresses: list[Address]
+
+    @dataclass
+    class CamelCompany(JSONWizard):
+        class _(JSONWizard.Meta):
+            recursive = True
+            case = 'CAMEL'
+
+        address: Address
+
+    fn_name = '__dataclass_wizard_from_dict_Address__'
+
+    assert fromdict(User, {'address': {'street_name': 'a'}}) == User(Address('a'))
+    assert fromdict(Company, {'addresses': [{'street_name': 'b'}]}) == Company([Address('b')])
+
+    # `Company` links to the function compiled for `User`
+    assert len(NESTED_LOAD_FUNCTIONS[Address]) == 1
+    load_address = User.__dataclass_wizard_from_dict__.__globals__[fn_name]
+    assert Company.__dataclass_wizard_from_dict__.__globals__[fn_name] is load_address
+
+    assert asdict(User(Address('a'))) == {'address': {'street_name': 'a'}}
+    assert asdict(Company([Address('b')])) == {'addresses': [{'street_name': 'b'}]}
+    assert len(NESTED_DUMP_FUNCTIONS[Address]) == 1
+
+    # a different (recursive) Meta config results in a new function
+    assert CamelCompany.from_dict(
+        {'address': {'streetName': 'c'}}) == CamelCompany(Address('c'))
+    assert len(NESTED_LOAD_FUNCTIONS[Address]) == 2
+    assert CamelCompany.__dataclass_wizard_from_dict__.__globals__[fn_name] is not load_address
+
+
+def test_codegen_is_single_flight(mocker):
+    import sys
+    from threading import Barrier, Thread
+
+    from dataclass_wizard import _dumpers, _loaders
+
+    @dataclass
+    class MyClass:
+        my_int: int
+        my_list: list[str]
+
+    spy_load = mocker.spy(_loaders, 'load_func_for_dataclass')
+    spy_dump = mocker.spy(_dumpers, 'dump_func_for_dataclass')
+
+    n = 16
+    barrier = Barrier(n)
+    results = []
+
+    def run():
+        barrier.wait()
+        obj = fromdict(MyClass, {'my_int': '1', 'my_list': ['a']})
+        results.append(asdict(obj))
+
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        threads = [Thread(target=run) for _ in range(n)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+    finally:
+        sys.setswitchinterval(interval)
+
+    assert results == [{'my_int': 1, 'my_list': ['a']}] * n
+    assert spy_load.call_count == 1
+    assert spy_dump.call_count == 1
+
+
+def test_key_case_is_learned_for_auto_load_case():
+    @dataclass
+    class MyClass:
+        my_str: str
+        other_int: int = 0
+
+    LoadMeta(load_case='AUTO', load_case_learn_after=3).bind_to(MyClass)
+
+    assert key_case_info(MyClass) is None
+
+    camel = {'myStr': 'a', 'otherInt': '1'}
+    assert fromdict(MyClass, camel) == MyClass('a', 1)
+    assert key_case_info(MyClass) == {
+        'learned': None, 'seen': {'CAMEL': 2}, 'relearned': 0}
+
+    assert fromdict(MyClass, camel) == MyClass('a', 1)
+    assert key_case_info(MyClass) == {
+        'learned': 'CAMEL', 'seen': {'CAMEL': 3}, 'relearned': 0}
+
+    # fields are looked up by the camelCase keys now
+    assert fromdict(MyClass, camel) == MyClass('a', 1)
+    assert fromdict(MyClass, {'myStr': 'b'}) == MyClass('b')
+    assert key_case_info(MyClass)['seen'] == {'CAMEL': 3}
+
+    # a key in another casing is still found, and the casing is re-learned
+    assert fromdict(MyClass, {'my-str': 'c'}) == MyClass('c')
+    assert key_case_info(MyClass) == {
+        'learned': None, 'seen': {'CAMEL': 3, 'KEBAB': 1}, 'relearned': 1}
+
+    for _ in range(3):
+        assert fromdict(MyClass, {'My-Str': 'd'}) == MyClass('d')
+    assert key_case_info(MyClass)['learned'] == 'UPPER_KEBAB'
+
+
+def test_key_case_is_not_learned_by_default():
+    @dataclass
+    class MyClass:
+        my_str: str
+
+    LoadMeta(load_case='AUTO').bind_to(MyClass)
+
+    assert fromdict(MyClass, {'myStr': 'a'}) == MyClass('a')
+    assert key_case_info(MyClass) is None
+
+
+def test_datetime_parse_cache():
+    @dataclass
+    class Event:
+        ts: datetime
+        day: date
+        at: time
+        history: list[datetime]
+
+    LoadMeta(datetime_parse_cache_size=2).bind_to(Event)
+
+    assert datetime_parse_cache_info(Event) is None
+
+    ts = '2024-05-06T07:08:09Z'
+    e1 = fromdict(Event, {'ts': ts, 'day': '2024-05-06', 'at': '07:08',
+                          'history': [ts, '1700000000']})
+    e2 = fromdict(Event, {'ts': ts, 'day': '2024-05-06', 'at': '07:08',
+                          'history': []})
+
+    assert e1.ts == datetime(2024, 5, 6, 7, 8, 9, tzinfo=timezone.utc)
+    assert e1.history[1] == datetime.fromtimestamp(1700000000, timezone.utc)
+    assert e1.day == date(2024, 5, 6) and e1.at == time(7, 8)
+    # identical strings return the same object
+    assert e1.ts is e2.ts is e1.history[0]
+    assert e1.day is e2.day and e1.at is e2.at
+
+    assert datetime_parse_cache_info(Event) == {
+        datetime: {'hits': 2, 'misses': 2, 'maxsize': 2, 'currsize': 2},
+        date: {'hits': 1, 'misses': 1, 'maxsize': 2, 'currsize': 1},
+        time: {'hits': 1, 'misses': 1, 'maxsize': 2, 'currsize': 1},
+    }
+
+    # non-string values are not cached
+    e3 = fromdict(Event, {'ts': 1700000000, 'day': e1.day, 'at': e1.at,
+                          'history': []})
+    assert e3.ts == e1.history[1]
+    assert datetime_parse_cache_info(Event)[datetime]['misses'] == 2
+
+
+def test_datetime_parse_cache_is_disabled_by_default():
+    @dataclass
+    class Event:
+        ts: datetime
+
+    ts = '2024-05-06T07:08:09Z'
+    assert fromdict(Event, {'ts': ts}) == fromdict(Event, {'ts': ts})
+    assert datetime_parse_cache_info(Event) is None
+
+
+def test_meta_fingerprint_compares_unhashable_values_by_value():
+    from dataclass_wizard._meta_cache import create_meta, meta_fingerprint
+
+    def fingerprint(**kwargs):
+        @dataclass
+        class A:
+            my_str: str
+
+        return meta_fingerprint(create_meta(A, **kwargs))
+
+    fp = fingerprint(field_to_alias={'my_str': ['a', 'b']})
+
+    assert fp == fingerprint(field_to_alias={'my_str': ['a', 'b']})
+    assert fp != fingerprint(field_to_alias={'my_str': ['a', 'c']})
+    assert fp != fingerprint(field_to_alias={'my_str': 'a'})
+    hash(fp)
+
+    # a value which can't be made hashable: the config isn't shared
+    assert fingerprint(field_to_alias={'my_str': bytearray(b'a')}) is None
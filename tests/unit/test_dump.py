@@ -1,19 +1,24 @@
+import json
 import logging
 from abc import ABC
 from base64 import b64decode
 from collections import deque, defaultdict
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, make_dataclass
 from datetime import datetime, timedelta, timezone, date
-from typing import (Set, FrozenSet, Optional, Union, List,
+from enum import Enum
+from typing import (Any, Set, FrozenSet, Optional, Union, List,
                     DefaultDict, Annotated, Literal)
 from uuid import UUID
 
 import pytest
 
 from dataclass_wizard import *
+from dataclass_wizard import _dumpers
 from dataclass_wizard._meta_cache import get_meta
+from dataclass_wizard.conditions import SkipIfNone
 from dataclass_wizard.constants import TAG
 from dataclass_wizard.errors import ParseError
+from dataclass_wizard.models import CatchAll
 from dataclass_wizard.enums import KeyAction
 from tests.unit.conftest import *
 from tests._typing import *
@@ -289,6 +294,71 @@ def test_to_dict_with_excluded_fields():
     assert out_dict == {'my_str': 'my string'}
 
 
+def test_to_dict_with_excluded_and_included_nested_fields():
+    """
+    `exclude` and `include` support dotted paths for nested dataclasses,
+    and the specialized dump functions are cached per projection.
+    """
+
+    @dataclass
+    class Address:
+        street: str
+        city: str
+        history: list[str] = field(default_factory=list)
+
+    @dataclass
+    class Owner:
+        name: str
+        address: Address
+        past_addresses: list[Address]
+        mailing_address: Optional[Address] = None
+
+    @dataclass
+    class Record(JSONWizard):
+        class _(JSONWizard.Meta):
+            dump_case = 'CAMEL'
+
+        record_id: int
+        owner: Owner
+        extra: CatchAll = None
+
+    address = Address('Main St.', 'Springfield', ['Elm St.'])
+    r = Record(1, Owner('Jane', address, [address]), {'unknown': True})
+
+    assert r.to_dict(exclude={'extra', 'owner.address', 'owner.pastAddresses.history'}) == {
+        'recordId': 1,
+        'owner': {
+            'name': 'Jane',
+            'pastAddresses': [{'street': 'Main St.', 'city': 'Springfield'}],
+            'mailingAddress': None,
+        },
+    }
+
+    # names or keys of the catch-all field are excluded from the output
+    assert r.to_dict(exclude=['unknown', 'owner']) == {'recordId': 1}
+
+    assert asdict(r, include=['record_id', 'owner.address.city']) == {
+        'recordId': 1,
+        'owner': {'address': {'city': 'Springfield'}},
+    }
+
+    assert r.to_dict(include=['owner.name', 'owner.pastAddresses']) == {
+        'owner': {
+            'name': 'Jane',
+            'pastAddresses': [{'street': 'Main St.', 'city': 'Springfield',
+                               'history': ['Elm St.']}],
+        },
+    }
+
+    assert r.to_dict(include=()) == {}
+    assert r.to_dict(exclude=()) == r.to_dict()
+
+    # functions are cached per `exclude` / `include` combination
+    f1 = _dumpers.get_projected_dump_func(Record, ['owner'])
+    assert _dumpers.get_projected_dump_func(Record, ('owner', )) is f1
+    assert _dumpers.get_projected_dump_func(Record, include=['owner']) is not f1
+
+
 @pytest.mark.parametrize(
     'input,expected,expectation',
     [
@@ -462,6 +532,36 @@ def test_timedelta(input, expectation):
         log.debug('Parsed object: %r', actual)
 
 
+@pytest.mark.parametrize(
+    'dump_as,input,expected',
+    [
+        ('ISO', timedelta(0), 'PT0S'),
+        ('ISO', timedelta(hours=1, minutes=30), 'PT1H30M'),
+        ('ISO', timedelta(days=2), 'P2D'),
+        ('ISO', timedelta(days=1, seconds=4, microseconds=500000), 'P1DT4.5S'),
+        ('ISO', timedelta(minutes=-90), '-PT1H30M'),
+        ('COMPACT', timedelta(0), '0s'),
+        ('COMPACT', timedelta(hours=1, minutes=30), '1h30m'),
+        ('COMPACT', timedelta(days=1, hours=2, minutes=3, seconds=4.25), '1d2h3m4.25s'),
+        ('COMPACT', timedelta(seconds=-1), '-1s'),
+        ('STR', timedelta(seconds=-1), '-1 day, 23:59:59'),
+    ]
+)
+def test_timedelta_with_dump_timedelta_as(dump_as, input, expected):
+
+    @dataclass
+    class MyClass(JSONWizard):
+        class _(JSONWizard.Meta):
+            dump_timedelta_as = dump_as
+
+        my_td: timedelta
+
+    d = MyClass(my_td=input).to_dict()
+
+    assert d == {'my_td': expected}
+    assert MyClass.from_dict(d).my_td == input
+
+
 @pytest.mark.parametrize(
     'input,expectation',
     [
@@ -530,3 +630,154 @@ def test_bytes_and_bytes_array_are_supported():
               s='foobar')
 
     assert foo.to_dict() == data
+
+
+def test_dataclass_in_union_with_many_tags():
+    """
+    Confirm the dump function is looked up by type for dataclasses in a
+    `Union`, and the tag is added only for the dataclasses which have one.
+    """
+    members = [make_dataclass(f'Item{i}', [('value', int)]) for i in range(20)]
+
+    # leave the last two dataclasses untagged
+    for i, tp in enumerate(members[:-2]):
+        DumpMeta(tag=f'item-{i}').bind_to(tp)
+
+    @dataclass
+    class Container:
+        item: Union[tuple(members)]
+
+    for i in (0, 10, 17):
+        assert asdict(Container(members[i](7))) == {
+            'item': {TAG: f'item-{i}', 'value': 7}}
+
+    assert asdict(Container(members[19](7))) == {'item': {'value': 7}}
+
+    with pytest.raises(ParseError):
+        asdict(Container(make_dataclass('Other', [('value', int)])(7)))
+
+
+def test_to_json_fast():
+    """
+    Confirm `to_json(fast=True)` returns the same JSON text as `to_json()`,
+    including for nested dataclasses, and dataclasses which are encoded
+    from `to_dict` (e.g. with a `SkipIf` condition).
+    """
+    class Color(Enum):
+        RED = 'red'
+
+    @dataclass
+    class Address:
+        street: str
+        zip_code: Optional[int] = None
+
+    @dataclass
+    class Skipped:
+        value: Annotated[Optional[int], SkipIfNone] = None
+
+    @dataclass
+    class Person(JSONWizard):
+        class _(JSONWizard.Meta):
+            dump_case = 'CAMEL'
+
+        full_name: str
+        address: Address
+        addresses: list[Address]
+        nickname: str = Alias('nick', default='x')
+        hidden: int = Alias(skip=True, default=1)
+        maybe_address: Optional[Address] = None
+        skipped: Skipped = field(default_factory=Skipped)
+        created: datetime = datetime(2024, 1, 2, 3, 4)
+        color: Color = Color.RED
+        score: float = float('nan')
+        active: bool = True
+        count: int = 1
+        tags: list[str] = field(default_factory=list)
+
+    p = Person('Jane "JD" Doé\n', Address('Main St.', 12345),
+               [Address('A'), Address('B', 1)], tags=['x'], score=float('inf'),
+               count=True, active=1)
+    p2 = Person('John', Address('C'), [], skipped=Skipped(1))
+
+    assert p.to_json(fast=True) == p.to_json()
+    assert Person.list_to_json([p, p2], fast=True) == Person.list_to_json([p, p2])
+
+    # encoder options are passed to the (regular) encoder
+    assert p.to_json(fast=True, indent=2) == p.to_json(indent=2)
+
+    @dataclass
+    class Empty(JSONWizard):
+        pass
+
+    assert Empty().to_json(fast=True) == '{}'
+
+    @dataclass
+    class Bad(JSONWizard):
+        value: Any
+
+    with pytest.raises(ParseError):
+        Bad(object()).to_json(fast=True)
+
+    class SomeEnum(Enum):
+        B = 'b'
+
+    @dataclass
+    class M(JSONWizard):
+        s: str
+        opt: Optional[str]
+        ds: dict
+
+    # the field which failed is reported, rather than one set before it
+    with pytest.raises(ParseError) as e:
+        M(s='a', opt=None, ds={'e': SomeEnum.B}).to_json(fast=True)
+
+    assert e.value.field_name == 'ds'
+    assert e.value.obj == {'e': SomeEnum.B}
+
+
+def test_asdict_many():
+    """
+    Confirm `asdict_many` returns the same as `asdict` for each instance,
+    including with `skip_defaults`, a catch-all field, or a `dict_factory`.
+    """
+    from collections import OrderedDict
+
+    @dataclass
+    class Item:
+        sku: str
+        quantity: int = 1
+
+    @dataclass
+    class Order(JSONWizard):
+        class _(JSONWizard.Meta):
+            dump_case = 'CAMEL'
+            skip_defaults = True
+
+        order_id: int
+        items: list[Item]
+        notes: Optional[str] = None
+        extra: CatchAll = None
+
+    orders = [Order(1, [Item('a'), Item('b', 2)]),
+              Order(2, [], 'gift', {'source': 'web'})]
+
+    expected = [asdict(o) for o in orders]
+
+    assert asdict_many(orders) == expected == [
+        {'orderId': 1, 'items': [{'sku': 'a'}, {'sku': 'b', 'quantity': 2}]},
+        {'orderId': 2, 'items': [], 'notes': 'gift', 'source': 'web'},
+    ]
+    # an iterator, with the dataclass type
+    assert asdict_many(iter(orders), Order) == expected
+    assert asdict_many([]) == []
+
+    result = asdict_many(orders, Order, OrderedDict)
+    assert all(type(d) is OrderedDict for d in result)
+    assert result == expected
+
+    # the list function is used by `list_to_json`
+    assert Order.list_to_json(orders) == json.dumps(expected)
+    assert Order.__dataclass_wizard_to_list__ is _dumpers.get_dump_list_func(Order)
+
+    with pytest.raises(ParseError):
+        asdict_many([Order(1, [Item('a', 1)]), Order(2, [object()])])
@@ -8,8 +8,8 @@ import json
 import logging
 from abc import ABC
 from base64 import b64decode
-from collections import namedtuple, defaultdict, deque
-from dataclasses import dataclass, field
+from collections import OrderedDict, namedtuple, defaultdict, deque
+from dataclasses import MISSING, InitVar, dataclass, field, make_dataclass
 from datetime import datetime, date, time, timedelta, timezone
 from decimal import Decimal
 from pathlib import Path
@@ -25,6 +25,7 @@ from dataclass_wizard import *
 from dataclass_wizard.conditions import *
 from dataclass_wizard.patterns import *
 from dataclass_wizard.models import CatchAll
+from dataclass_wizard import _loaders
 from dataclass_wizard.mixins.toml import TOMLWizard
 from dataclass_wizard.constants import TAG
 from dataclass_wizard.errors import (
@@ -74,6 +75,50 @@ def test_missing_fields_is_raised():
     assert e.missing_fields == ['my_str', 'my_int']
 
 
+def test_from_list():
+
+    @dataclass
+    class Inner:
+        my_float: float
+
+    @dataclass
+    class Test(JSONWizard):
+        my_str: str
+        my_int: int
+        inner: list[Inner] = field(default_factory=list)
+
+    data = [
+        {'my_str': 'a', 'my_int': '1', 'inner': [{'my_float': '1.5'}]},
+        {'my_str': 'b', 'my_int': 2},
+    ]
+
+    assert Test.from_list(data) == [Test('a', 1, [Inner(1.5)]), Test('b', 2)]
+    assert Test.from_list([]) == []
+    assert fromlist(Inner, [{'my_float': 2}]) == [Inner(2.0)]
+
+    assert Test.__dataclass_wizard_from_list__.__name__ == (
+        '__dataclass_wizard_from_list_Test__')
+
+
+def test_from_list_raises_for_missing_fields_in_any_item():
+
+    @dataclass
+    class Test(JSONWizard):
+        my_str: str
+        my_int: int
+
+    # required fields set from one item should not leak into the next one
+    with pytest.raises(MissingFields) as exc_info:
+        _ = Test.from_list([{'my_str': 'a', 'my_int': 1}, {'my_str': 'b'}])
+
+    assert exc_info.value.missing_fields == ['my_int']
+
+    with pytest.raises(ParseError) as exc_info:
+        _ = Test.from_list([{'my_str': 'a', 'my_int': 1}, 'b'])
+
+    assert exc_info.value.obj == 'b'
+
+
 def test_auto_key_casing():
 
     @dataclass
@@ -707,6 +752,45 @@ def test_date_times_with_subclass_of_time_and_plus_or_minus_in_pattern():
     assert fromdict(MyClass, serialized_dict) == expected_obj
 
 
+def test_date_times_with_compiled_pattern():
+    """
+    Patterns with only numeric directives are parsed with a precompiled
+    regex, and should give the same result as `datetime.strptime`.
+    """
+    from dataclass_wizard.patterns import _compile_pattern, _DATE_FIELDS
+
+    assert _compile_pattern('%Y/%m/%d', _DATE_FIELDS) is not None
+    # not supported, or not a `date` field: fall back to `strptime`
+    assert _compile_pattern('%d %b %Y', _DATE_FIELDS) is None
+    assert _compile_pattern('%Y-%m-%d %H', _DATE_FIELDS) is None
+    assert _compile_pattern('%Y-%m-%d %', _DATE_FIELDS) is None
+
+    @dataclass
+    class MyClass:
+        dates: list[DatePattern['%m/%d/%Y', '%y%m%d', '%d %b %Y']]
+        dts: list[DateTimePattern['%Y%m%d  %H%M%S.%f', '%d.%m.%Y %H:%M']]
+        times: list[UTCTimePattern['%Hh%M', '%H %M %S']]
+
+    data = {'dates': ['1/2/2021', '690102', '680102', '3 Feb 2021'],
+            'dts': ['20210102 030405.12', '20210102  030405.123456',
+                    '2.1.2021 3:04'],
+            'times': ['03H04', '3 4  5']}
+
+    obj = fromdict(MyClass, data)
+
+    assert obj.dates == [date(2021, 1, 2), date(1969, 1, 2),
+                         date(2068, 1, 2), date(2021, 2, 3)]
+    assert obj.dts == [datetime(2021, 1, 2, 3, 4, 5, 120000),
+                       datetime(2021, 1, 2, 3, 4, 5, 123456),
+                       datetime(2021, 1, 2, 3, 4)]
+    assert obj.times == [time(3, 4, tzinfo=timezone.utc),
+                         time(3, 4, 5, tzinfo=timezone.utc)]
+
+    for invalid in ('2/30/2021', '1/2/2021x', '13/2/2021'):
+        with pytest.raises(ParseError):
+            fromdict(MyClass, {**data, 'dates': [invalid]})
+
+
 def test_date_times_with_custom_pattern_when_input_is_invalid():
     """
     Date, time, and datetime objects with a custom date string
@@ -1374,6 +1458,148 @@ def test_coerce_none_to_empty_str():
         'expected `my_str` to be set to an empty string'
 
 
+def test_trusted_input():
+    """`trusted_input` loads leaf values and containers of them as-is."""
+    @dataclass
+    class Inner:
+        my_int: int
+
+    @dataclass
+    class MyClass(JSONWizard):
+
+        class _(JSONWizard.Meta):
+            trusted_input = True
+
+        my_str: str
+        my_int: int
+        my_float: float
+        my_opt_bool: Optional[bool]
+        my_list: List[int]
+        my_dict: Dict[str, Union[int, str]]
+        my_set: Set[str]
+        my_tuple: Tuple[int, ...]
+        my_literal: Literal['x', 'y']
+        my_inner_list: List[Inner]
+        my_dict_int_keys: Dict[int, str]
+
+    d = {'my_str': 'test', 'my_int': 1, 'my_float': 2, 'my_opt_bool': None,
+         'my_list': [1, 2], 'my_dict': {'a': 1, 'b': 'c'}, 'my_set': ['a'],
+         'my_tuple': [1, 2], 'my_literal': 'x',
+         'my_inner_list': [{'my_int': 3}], 'my_dict_int_keys': {'1': 'a'}}
+
+    result = MyClass.from_dict(d)
+    log.debug('Parsed object: %r', result)
+
+    assert result == MyClass(
+        'test', 1, 2, None, [1, 2], {'a': 1, 'b': 'c'}, {'a'}, (1, 2), 'x',
+        [Inner(3)], {1: 'a'})
+
+    # containers of leaf types are reused
+    assert result.my_list is d['my_list']
+    assert result.my_dict is d['my_dict']
+    # values are not converted
+    assert type(result.my_float) is int
+
+
+@pytest.mark.parametrize('dc_kwargs', [
+    {},
+    {'frozen': True},
+    pytest.param({'slots': True}, marks=pytest.mark.skipif(
+        not PY310_OR_ABOVE, reason='requires Python 3.10 or higher')),
+    pytest.param({'frozen': True, 'slots': True}, marks=pytest.mark.skipif(
+        not PY310_OR_ABOVE, reason='requires Python 3.10 or higher')),
+])
+def test_direct_construction(dc_kwargs):
+    """`direct_construction` sets default values (and frozen fields) directly."""
+    post_init_calls = []
+
+    @dataclass(**dc_kwargs)
+    class MyClass(JSONWizard):
+
+        class _(JSONWizard.Meta):
+            direct_construction = True
+
+        my_int: int
+        my_list: List[int] = field(default_factory=list)
+        my_str: str = 'test'
+        my_float: float = field(init=False, default=1.5)
+
+        def __post_init__(self):
+            post_init_calls.append(self.my_int)
+
+    result = MyClass.from_dict({'my_int': '1', 'my_str': 2})
+    log.debug('Parsed object: %r', result)
+
+    assert post_init_calls == [1]
+    assert result == MyClass(1, [], '2')
+    assert result.my_float == 1.5
+
+    post_init_calls.clear()
+    result = MyClass.from_list([{'my_int': 2, 'my_list': ['3']}, {'my_int': 3}])
+
+    assert post_init_calls == [2, 3]
+    assert result == [MyClass(2, [3]), MyClass(3)]
+    assert result[0].my_list is not result[1].my_list
+
+    with pytest.raises(MissingFields) as e:
+        _ = MyClass.from_dict({'my_str': 'test'})
+
+    assert e.value.missing_fields == ['my_int']
+
+
+def test_direct_construction_with_init_var():
+    @dataclass
+    class MyClass(JSONWizard):
+
+        class _(JSONWizard.Meta):
+            direct_construction = True
+
+        my_int: int
+        my_factor: InitVar[int] = 2
+
+        def __post_init__(self, my_factor):
+            self.my_int *= my_factor
+
+    assert MyClass.from_dict({'my_int': 3}) == MyClass(3)
+    assert MyClass.from_dict({'my_int': 3}).my_int == 6
+
+
+def test_direct_construction_with_exec_compiled_init():
+    """An `__init__` compiled from other `exec`'d source is still called."""
+    ns = {}
+    exec('def __init__(self, a):\n'
+         '    object.__setattr__(self, "a", a * 10)\n', ns)
+
+    @dataclass(frozen=True)
+    class MyClass(JSONWizard):
+
+        class _(JSONWizard.Meta):
+            direct_construction = True
+
+        a: int
+
+    MyClass.__init__ = ns['__init__']
+    MyClass.__init__.__qualname__ = f'{MyClass.__qualname__}.__init__'
+
+    assert MyClass(1).a == 10
+    assert MyClass.from_dict({'a': 1}) == MyClass(1)
+
+
+def test_trusted_input_is_not_the_default():
+    @dataclass
+    class MyClass(JSONWizard):
+        my_float: float
+        my_list: List[int]
+
+    d = {'my_float': 2, 'my_list': ['1']}
+
+    result = MyClass.from_dict(d)
+
+    assert type(result.my_float) is float
+    assert result.my_list == [1]
+    assert result.my_list is not d['my_list']
+
+
 @pytest.mark.parametrize(
     'input,expectation,expected',
     [
@@ -1545,6 +1771,47 @@ def test_timedelta(input, expectation, base_err):
         assert type(e.value.base_error) == base_err
 
 
+@pytest.mark.parametrize(
+    'input,expected',
+    [
+        ('-5', timedelta(seconds=-5)),
+        ('1:02:03.5', timedelta(hours=1, minutes=2, seconds=3.5)),
+        ('1:02:03:04', timedelta(days=1, hours=2, minutes=3, seconds=4)),
+        ('2 days, 0:51:07', timedelta(days=2, minutes=51, seconds=7)),
+        ('-1 day, 23:59:59', timedelta(seconds=-1)),
+        ('-4:13', -timedelta(minutes=4, seconds=13)),
+        ('1h 30m', timedelta(hours=1, minutes=30)),
+        ('3 days, 4 hours', timedelta(days=3, hours=4)),
+        ('2wks 1.5d', timedelta(weeks=2, days=1.5)),
+        ('PT1H30M', timedelta(hours=1, minutes=30)),
+        ('P1DT2H3M4.5S', timedelta(days=1, hours=2, minutes=3, seconds=4.5)),
+        ('P2W', timedelta(weeks=2)),
+        ('-PT0,5S', timedelta(seconds=-0.5)),
+    ]
+)
+def test_timedelta_duration_formats(input, expected):
+    """Confirm the supported duration string formats for `timedelta`."""
+
+    @dataclass
+    class MyClass(JSONWizard):
+        my_td: timedelta
+
+    assert MyClass.from_dict({'my_td': input}).my_td == expected
+
+
+@pytest.mark.parametrize('input', ['P', 'PT', 'P1Y', '5ms', '1h 30', '1 day, 1:02:03:04'])
+def test_timedelta_invalid_duration(input):
+
+    @dataclass
+    class MyClass(JSONWizard):
+        my_td: timedelta
+
+    with pytest.raises(ParseError) as e:
+        MyClass.from_dict({'my_td': input})
+
+    assert type(e.value.base_error) is ValueError
+
+
 @pytest.mark.parametrize(
     'input,expectation,expected',
     [
@@ -2806,6 +3073,81 @@ def test_catch_all_with_auto_key_case():
     assert opt == Options(my_extras={}, the_email='x@y.com')
 
 
+def test_catch_all_in_single_pass(monkeypatch):
+    """'Catch All' with the keys in the input matched in a single pass."""
+    monkeypatch.setattr('dataclass_wizard._loaders.SINGLE_PASS_MIN_FIELDS', 1)
+
+    @dataclass
+    class A:
+        mynumber: int
+        extra: CatchAll = None
+
+    @dataclass
+    class B:
+        mystring: str
+        extra: CatchAll = None
+
+    @dataclass
+    class Container(JSONWizard):
+        class _(JSONWizard.Meta):
+            case = 'AUTO'
+            auto_assign_tags = True
+            tag_key = 'type'
+
+        my_extras: CatchAll
+        the_email: str
+        my_bool: bool = Alias('my_json_bool', 'myTestBool', default=False)
+        a_str: str = AliasPath('x.y.0', default='xyz')
+        obj2: Union[A, B, None] = None
+
+    c = Container.from_dict({
+        'The-Email': 'a@b.org',
+        'myTestBool': 'false',
+        'my_json_bool': 'true',
+        'x': {'y': ['abc']},
+        'obj2': {'mystring': 'bar', 'type': 'B', 'z': 1},
+        'token': '<PASSWORD>',
+    })
+    assert c == Container(my_extras={'token': '<PASSWORD>'},
+                          the_email='a@b.org',
+                          my_bool=True,
+                          a_str='abc',
+                          obj2=B('bar', {'z': 1}))
+
+    c = Container.from_dict({'theEmail': 'a@b.org'})
+    assert c == Container(my_extras={}, the_email='a@b.org')
+
+    c = Container.from_dict({'the_email': 'a@b.org', 'obj2': {'mynumber': '1', 'type': 'A'}})
+    assert c == Container(my_extras={}, the_email='a@b.org', obj2=A(1))
+
+    with pytest.raises(MissingFields):
+        _ = Container.from_dict({'theMail': 'a@b.org'})
+
+    assert Container.from_list([{'theEmail': 'a@b.org', 'k': 1},
+                                {'theEmail': 'x@y.com'}]) == [
+        Container(my_extras={'k': 1}, the_email='a@b.org'),
+        Container(my_extras={}, the_email='x@y.com'),
+    ]
+
+
+def test_catch_all_for_wide_dataclass():
+    """'Catch All' for a dataclass with many fields."""
+    fields = [(f'field_{i}', int) for i in range(100)]
+    cls = make_dataclass('Wide', fields + [('extra', CatchAll, field(default=None))])
+
+    data = {f'field_{i}': i for i in range(100)}
+    obj = fromdict(cls, data)
+
+    assert obj.extra is None
+    assert obj.field_99 == 99
+
+    data['field_x'] = 'x'
+    obj = fromdict(cls, data)
+
+    assert obj.extra == {'field_x': 'x'}
+    assert asdict(obj) == data
+
+
 def test_from_dict_with_nested_object_alias_path():
     """
     Specifying a custom mapping of "nested" alias to dataclass field,
@@ -3129,6 +3471,52 @@ def test_from_dict_with_multiple_nested_object_alias_paths():
     assert e.value.kwargs['path'] == "'bears' => 'eat' => 'b33ts'"
 
 
+def test_alias_paths_with_shared_prefixes():
+    """
+    `AliasPath` fields sharing a prefix (e.g. `data.attrs`) load and dump
+    correctly, including when the shared part is missing or not a `dict`.
+    """
+
+    @dataclass
+    class MyClass(JSONWizard):
+        a: int = AliasPath('data.attrs.a')
+        b: str = AliasPath('data.attrs.b')
+        top: int = AliasPath('top')
+        c: Optional[int] = AliasPath('data.meta.c', default=None)
+        d: Annotated[Optional[int], SkipIfNone] = AliasPath('data.extra.d', default=None)
+
+    d = {'data': {'attrs': {'a': '1', 'b': 'x'}, 'meta': {'c': 3}}, 'top': 5}
+    instance = MyClass.from_dict(d)
+    assert instance == MyClass(a=1, b='x', top=5, c=3)
+    assert instance.to_dict() == {
+        'data': {'attrs': {'a': 1, 'b': 'x'}, 'meta': {'c': 3}},
+        'top': 5,
+    }
+
+    instance.d = 7
+    assert instance.to_dict() == {
+        'data': {'attrs': {'a': 1, 'b': 'x'}, 'meta': {'c': 3}, 'extra': {'d': 7}},
+        'top': 5,
+    }
+
+    # Optional fields under a missing prefix fall back to their defaults
+    instance = MyClass.from_dict({'data': {'attrs': {'a': 2, 'b': 'y'}}, 'top': 0})
+    assert instance == MyClass(a=2, b='y', top=0)
+
+    # Required fields under a missing prefix
+    with pytest.raises(ParseError) as e:
+        _ = MyClass.from_dict({'data': {'meta': {}}, 'top': 0})
+
+    assert e.value.kwargs['current_path'] == "'attrs'"
+    assert e.value.kwargs['path'] == "'data' => 'attrs' => 'a'"
+
+    # The shared prefix is present, but is not a `dict`
+    with pytest.raises(ParseError) as e:
+        _ = MyClass.from_dict({'data': ['attrs'], 'top': 0})
+
+    assert e.value.kwargs['path'] == "'data' => 'attrs' => 'a'"
+
+
 def test_auto_assign_tags_and_raise_on_unknown_keys():
 
     @dataclass
@@ -3400,6 +3788,83 @@ def test_dataclass_in_union_when_tag_key_is_field():
     assert t1 == Result(data=XML(id=1, type='xml', field_type_1='value'))
 
 
+def test_dataclass_in_union_with_many_tags():
+    """
+    Test case for a `Union` with many tagged dataclasses; the load function
+    is looked up by tag, and an unknown or invalid tag raises an error.
+    """
+    members = [make_dataclass(f'Item{i}', [('value', int)]) for i in range(20)]
+
+    for i, tp in enumerate(members):
+        LoadMeta(tag=f'item-{i}').bind_to(tp)
+
+    @dataclass
+    class Container:
+        item: Union[tuple(members)]
+
+    for i in (0, 10, 19):
+        c = fromdict(Container, {'item': {TAG: f'item-{i}', 'value': '7'}})
+        assert c.item == members[i](value=7)
+
+    with pytest.raises(ParseError) as e:
+        fromdict(Container, {'item': {TAG: 'item-99', 'value': 7}})
+
+    assert e.value.kwargs['input_tag'] == 'item-99'
+
+    # an unhashable tag value is not found either
+    with pytest.raises(ParseError) as e:
+        fromdict(Container, {'item': {TAG: ['item-1'], 'value': 7}})
+
+    assert e.value.kwargs['input_tag'] == ['item-1']
+
+
+def test_untagged_dataclasses_in_union_are_picked_by_keys():
+    """
+    Test case for untagged dataclasses in a `Union`, with the
+    `unsafe_parse_dataclass_in_union` setting; the dataclass is picked by
+    the keys in the object, including aliases and key transforms.
+    """
+    @dataclass
+    class A:
+        x: int
+        y: int
+
+    @dataclass
+    class B:
+        x: int
+        my_z: str = Alias('zee')
+
+    @dataclass
+    class C:
+        x: int
+        my_w: str
+        extra: int = 0
+
+    @dataclass
+    class Container(JSONWizard):
+        class _(JSONWizard.Meta):
+            unsafe_parse_dataclass_in_union = True
+            load_case = 'AUTO'
+
+        value: Union[A, B, C, int]
+
+    assert Container.from_dict({'value': {'x': 1, 'y': '2'}}).value == A(1, 2)
+    assert Container.from_dict({'value': {'x': 1, 'zee': 2}}).value == B(1, '2')
+    assert Container.from_dict({'value': {'x': 1, 'myW': 2}}).value == C(1, '2')
+    assert Container.from_dict({'value': '3'}).value == 3
+
+    # more than one match: the first dataclass which loads is used
+    assert Container.from_dict({'value': {'x': 1, 'y': 2, 'zee': 3}}).value == A(1, 2)
+    assert Container.from_dict({'value': {'x': 1, 'y': 'a', 'zee': 3}}).value == B(1, '3')
+
+    # not a `dict`: the dataclasses are tried in order
+    value = OrderedDict(x=1, my_w='w')
+    assert Container.from_dict({'value': value}).value == C(1, 'w')
+
+    with pytest.raises(ParseError):
+        Container.from_dict({'value': {'y': 2, 'zee': 3}})
+
+
 def test_sequence_and_mutable_sequence_are_supported():
     """
     Confirm  `Collection`, `Sequence`, and `MutableSequence` -- imported
@@ -3646,3 +4111,135 @@ def test_str_and_int_enum():
     t2 = Test.from_dict(t.to_dict())
     assert t2.str_e is MyStrEnum.B
     assert t2.int_e is MyIntEnum.Z
+
+
+def test_enum_with_alias_missing_and_flags():
+    """
+    Confirm `Enum` members are looked up by value, and that aliases,
+    `_missing_`, falsy members, and `Flag` composites are still supported.
+    """
+
+    class Color(enum.Enum):
+        RED = 'red'
+        CRIMSON = 'red'
+        BLUE = 'blue'
+
+        @classmethod
+        def _missing_(cls, value):
+            if isinstance(value, str):
+                return cls._value2member_map_.get(value.lower())
+            return None
+
+    class Perm(enum.IntFlag):
+        NONE = 0
+        R = 4
+        W = 2
+        X = 1
+
+    @dataclass
+    class Test(JSONWizard):
+        color: Color
+        perm: Perm
+        perms: list[Perm]
+
+    t = Test.from_dict({'color': 'BLUE', 'perm': 0, 'perms': [4, 6, 7, 6]})
+    assert t.color is Color.BLUE
+    assert t.perm is Perm.NONE
+    assert t.perms == [Perm.R, Perm.R | Perm.W, Perm.R | Perm.W | Perm.X,
+                       Perm.R | Perm.W]
+    assert all(type(p) is Perm for p in t.perms)
+
+    assert Test.from_dict({'color': 'red', 'perm': 1, 'perms': []}).color is Color.CRIMSON
+
+    with pytest.raises(ParseError):
+        Test.from_dict({'color': 'green', 'perm': 0, 'perms': []})
+
+    # an unhashable value is reported as not valid, as with `Color(o)`
+    with pytest.raises(ParseError, match=r"\['red'\] is not a valid .*Color") as e:
+        Test.from_dict({'color': ['red'], 'perm': 0, 'perms': []})
+
+    assert e.value.field_name == 'color'
+
+    d = t.to_dict()
+    assert d == {'color': 'blue', 'perm': 0, 'perms': [4, 6, 7, 6]}
+    assert all(type(v) is int for v in d['perms'])
+    assert Test.from_dict(d) == t
+
+
+def test_fromdict_with_only_fields():
+    """
+    `fromdict(cls, d, only=...)` only loads the selected fields, including
+    dotted paths for a nested dataclass, or a `list` of them.
+    """
+
+    @dataclass
+    class Address:
+        street: str
+        city: str
+
+    @dataclass
+    class Owner:
+        name: str
+        address: Address
+        email: str = 'n/a'
+
+    @dataclass
+    class Repo(JSONWizard):
+        class _(JSONWizard.Meta):
+            on_unknown_key = 'RAISE'
+
+        id: int
+        name: str
+        owner: Optional[Owner]
+        members: list[Owner]
+        tags: list[str] = field(default_factory=list)
+        extra: CatchAll = None
+
+    d = {
+        'id': '1', 'name': 'repo',
+        'owner': {'name': 'a', 'address': {'street': 's', 'city': 'c'}},
+        'members': [{'name': 'b', 'address': {'street': 't', 'city': 'd'},
+                     'email': 'b@x.org'}],
+        'tags': ['x'],
+    }
+
+    repo = fromdict(Repo, d, only={'id', 'tags'})
+    assert repo.id == 1
+    assert repo.tags == ['x']
+    # not loaded: required fields are `MISSING`, the others are defaults
+    assert repo.name is repo.owner is repo.members is MISSING
+    assert repo.extra is None
+
+    # unknown keys are ignored
+    repo = fromdict(Repo, {**d, 'other': True}, only=['owner.name', 'members.address.city'])
+    assert repo.id is repo.name is MISSING
+    assert repo.owner == Owner('a', MISSING)
+    assert repo.members == [Owner(MISSING, Address(MISSING, 'd'))]
+    assert repo.tags == []
+
+    assert fromdict(Repo, {**d, 'owner': None}, only={'owner.name'}).owner is None
+    assert fromdict(Repo, d, only={'owner', 'owner.name'}).owner == Owner(
+        'a', Address('s', 'c'))
+
+    # the load function is cached, for each set of fields
+    assert (_loaders.get_projected_load_func(Repo, ['id', 'tags'])
+            is _loaders.get_projected_load_func(Repo, ('tags', 'id')))
+
+    # the regular load function is not changed
+    assert Repo.from_dict(d) == Repo(
+        1, 'repo', Owner('a', Address('s', 'c')),
+        [Owner('b', Address('t', 'd'), 'b@x.org')], ['x'])
+
+    # a selected field is still required
+    with pytest.raises(MissingFields):
+        _ = fromdict(Repo, {'name': 'repo'}, only={'id'})
+
+    # an unknown field name raises an error, rather than being ignored
+    with pytest.raises(ValueError, match=r"Unknown field\(s\) in `only` for Repo: \['nope'\]"):
+        _ = fromdict(Repo, d, only={'id', 'nope'})
+
+    with pytest.raises(ValueError, match=r"Unknown field\(s\) in `only` for Address: \['town'\]"):
+        _ = fromdict(Repo, d, only={'owner.name', 'owner.address.town'})
+
+    with pytest.raises(ValueError, match="Field 'tags' of Repo is not a dataclass"):
+        _ = fromdict(Repo, d, only={'tags.x'})
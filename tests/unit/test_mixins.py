@@ -1,3 +1,5 @@
+import io
+import json
 from dataclasses import dataclass
 from typing import List, Optional, Dict
 
@@ -6,7 +8,9 @@ from pytest_mock import MockerFixture
 
 from dataclass_wizard.mixins.yaml import YAMLWizard
 from dataclass_wizard.mixins.toml import TOMLWizard
+from dataclass_wizard.errors import MissingFields, ParseError
 from dataclass_wizard.mixins.json import JSONListWizard, JSONFileWizard
+from dataclass_wizard.mixins.jsonl import JSONLinesWizard
 from dataclass_wizard.utils.containers import Container
 from .conftest import SampleClass
 
@@ -84,6 +88,24 @@ def test_json_file_wizard_methods(mocker: MockerFixture, mock_json_open):
     mock_encoder.assert_called_once_with(my_dict, mocker.ANY)
 
 
+def test_iter_from_json(tmp_path):
+    """Test the streaming `iter_from_json` and `iter_from_json_file`."""
+    string = '[{"f1": "hello", "f2": "111"}, {"f1": "world", "f2": 222}]'
+    expected = [MyFileWizard('hello', 111), MyFileWizard('world', 222)]
+
+    it = MyListWizard.iter_from_json(io.StringIO(string), chunk_size=8)
+    assert next(it) == MyListWizard('hello', 111)
+    assert list(it) == [MyListWizard('world', 222)]
+
+    assert list(MyListWizard.iter_from_json(string.encode())) == [
+        MyListWizard('hello', 111), MyListWizard('world', 222)]
+
+    file = tmp_path / 'my_file.json'
+    file.write_text(string)
+
+    assert list(MyFileWizard.iter_from_json_file(file, chunk_size=8)) == expected
+
+
 def test_yaml_wizard_methods(mocker: MockerFixture):
     """Test and coverage the base methods in YAMLWizard."""
     yaml_data = """\
@@ -284,3 +306,65 @@ def test_toml_wizard_for_branch_coverage(mocker: MockerFixture):
 
     assert result == mock_return_val
     mock_encoder.assert_any_call({'items': []})
+
+
+def test_json_lines_wizard_methods(tmp_path):
+    """Test and coverage the base methods in JSONLinesWizard."""
+    @dataclass
+    class MyClass(JSONLinesWizard):
+        my_str: str
+        my_int: int = 0
+
+    file = tmp_path / 'my_file.jsonl'
+    instances = [MyClass('a', 1), MyClass('b')]
+
+    assert MyClass.to_jsonl(instances, file) == 2
+    assert MyClass.append_jsonl([MyClass('c', 3)], str(file)) == 1
+
+    assert file.read_text() == (
+        '{"my_str": "a", "my_int": 1}\n'
+        '{"my_str": "b", "my_int": 0}\n'
+        '{"my_str": "c", "my_int": 3}\n')
+
+    assert MyClass.from_jsonl(file) == instances + [MyClass('c', 3)]
+
+    stream = io.StringIO()
+    MyClass.to_jsonl(instances, stream, separators=(',', ':'))
+    assert stream.getvalue() == ('{"my_str":"a","my_int":1}\n'
+                                 '{"my_str":"b","my_int":0}\n')
+
+    stream.seek(0)
+    it = MyClass.iter_from_jsonl(stream)
+    assert next(it) == MyClass('a', 1)
+    assert list(it) == [MyClass('b')]
+
+
+def test_json_lines_wizard_with_invalid_lines():
+    """Test the `skip_invalid` mode in JSONLinesWizard."""
+    @dataclass
+    class MyClass(JSONLinesWizard):
+        my_str: str
+        my_int: int = 0
+
+    data = ('{"my_str": "a", "my_int": "1"}\n'
+            '\n'
+            '{"my_str": "b", \n'
+            '{"my_int": 2}\n'
+            '{"my_str": "c", "my_int": "three"}\n'
+            '{"my_str": "d"}\n')
+
+    with pytest.raises(ValueError):
+        MyClass.from_jsonl(io.StringIO(data))
+
+    errors = []
+    assert MyClass.from_jsonl(io.StringIO(data), skip_invalid=True,
+                              errors=errors) == [MyClass('a', 1), MyClass('d')]
+
+    assert [(e.lineno, e.line) for e in errors] == [
+        (3, '{"my_str": "b", '),
+        (4, '{"my_int": 2}'),
+        (5, '{"my_str": "c", "my_int": "three"}'),
+    ]
+    assert isinstance(errors[0].error, json.JSONDecodeError)
+    assert isinstance(errors[1].error, MissingFields)
+    assert isinstance(errors[2].error, ParseError)
@@ -0,0 +1,120 @@
+import io
+import json
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+
+import pytest
+
+from dataclass_wizard import asdict, fromlist
+from dataclass_wizard import parallel
+from dataclass_wizard.errors import MissingFields, ParseError
+from dataclass_wizard.parallel import (
+    asdict_many_parallel, fromjsonl_parallel, fromlist_parallel,
+)
+
+
+@dataclass
+class Item:
+    name: str
+    count: int
+    created: datetime
+
+
+@pytest.fixture
+def data():
+    return [{'name': f'item {i}', 'count': str(i), 'created': '2024-01-01T00:00:00'}
+            for i in range(100)]
+
+
+@pytest.fixture
+def executor():
+    with ThreadPoolExecutor(3) as pool:
+        yield pool
+
+
+def test_fromlist_parallel_with_processes(data, monkeypatch):
+    monkeypatch.setattr(parallel, 'MIN_ITEMS_PER_WORKER', 10)
+
+    items = fromlist_parallel(Item, data, workers=2, chunksize=7)
+    assert items == fromlist(Item, data)
+
+    assert asdict_many_parallel(items, workers=2) == [asdict(o) for o in items]
+
+
+def test_fromlist_parallel_in_process(data, mocker):
+    spy = mocker.spy(parallel, 'ProcessPoolExecutor')
+
+    # too few items to start the worker processes
+    assert fromlist_parallel(Item, data, workers=2) == fromlist(Item, data)
+    assert fromlist_parallel(Item, data, workers=1) == fromlist(Item, data)
+
+    spy.assert_not_called()
+
+
+def test_fromlist_parallel_preserves_order(data, executor):
+    items = fromlist_parallel(Item, data, chunksize=3, executor=executor)
+    assert [o.count for o in items] == list(range(100))
+
+    assert asdict_many_parallel([], executor=executor) == []
+
+
+def test_fromlist_parallel_raises_with_index(data, executor):
+    data[42]['count'] = 'forty-two'
+    del data[77]['name']
+
+    with pytest.raises(ParseError) as e:
+        fromlist_parallel(Item, data, chunksize=10, executor=executor)
+
+    assert e.value.index == 42
+    assert e.value.obj == 'forty-two'
+    assert 'index: 42' in str(e.value)
+
+    with pytest.raises(MissingFields) as e:
+        fromlist_parallel(Item, data[50:], chunksize=10, executor=executor)
+
+    assert e.value.index == 27
+
+
+def test_parallel_reraises_chunk_error_if_no_item_fails(data, executor, monkeypatch):
+    # the call for a whole chunk fails, but each item succeeds on its own
+    def fail(*args):
+        raise RuntimeError('chunk failed')
+
+    monkeypatch.setattr(parallel, 'get_dump_list_func', lambda cls: fail)
+    monkeypatch.setattr(parallel, 'fromlist', fail)
+
+    instances = fromlist(Item, data)
+
+    with pytest.raises(RuntimeError, match='chunk failed'):
+        asdict_many_parallel(instances, chunksize=10, executor=executor)
+
+    with pytest.raises(RuntimeError, match='chunk failed'):
+        fromlist_parallel(Item, data, chunksize=10, executor=executor)
+
+
+def test_fromjsonl_parallel(data, executor):
+    lines = [json.dumps(d) for d in data]
+    lines.insert(10, '')
+
+    stream = io.StringIO('\n'.join(lines))
+    assert fromjsonl_parallel(Item, stream, chunksize=9,
+                              executor=executor) == fromlist(Item, data)
+
+    lines[61] = '{"name": "item 60"'
+    stream = io.StringIO('\n'.join(lines))
+
+    with pytest.raises(json.JSONDecodeError) as e:
+        fromjsonl_parallel(Item, stream, chunksize=9, executor=executor)
+
+    # blank lines are not counted
+    assert e.value.index == 60
+
+
+def test_fromlist_parallel_with_threads_without_gil(data, monkeypatch, mocker):
+    monkeypatch.setattr(parallel, 'MIN_ITEMS_PER_WORKER', 10)
+    monkeypatch.setattr(parallel, '_GIL_ENABLED', False)
+    spy = mocker.spy(parallel, 'ThreadPoolExecutor')
+
+    assert fromlist_parallel(Item, data, workers=2) == fromlist(Item, data)
+    spy.assert_called_once_with(2)
@@ -0,0 +1,98 @@
+import io
+import json
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Optional
+
+import pytest
+import yaml
+
+from dataclass_wizard import asdict
+from dataclass_wizard.stream import dump_iter_json, dump_iter_jsonl, dump_iter_yaml
+from dataclass_wizard.utils.containers import Container
+
+
+@dataclass
+class Item:
+    name: str
+    count: int
+    created: datetime
+    tags: list[str] = field(default_factory=list)
+    note: Optional[str] = None
+
+
+@pytest.fixture
+def items():
+    return [Item(f'item {i} é', i, datetime(2024, 1, 1, i), ['a', 'b'])
+            for i in range(10)]
+
+
+@pytest.mark.parametrize('encoder_kwargs', [
+    {},
+    {'indent': 2},
+    {'indent': '\t', 'sort_keys': True},
+    {'separators': (',', ':')},
+    {'ensure_ascii': False},
+])
+def test_dump_iter_json(items, encoder_kwargs):
+    stream = io.StringIO()
+
+    # a generator, which is consumed as the output is written
+    count = dump_iter_json((o for o in items), stream, Item, chunk_size=16,
+                           **encoder_kwargs)
+
+    assert count == len(items)
+    assert stream.getvalue() == json.dumps([asdict(o) for o in items],
+                                           **encoder_kwargs)
+
+
+def test_dump_iter_json_with_no_instances():
+    stream = io.StringIO()
+
+    assert dump_iter_json(iter([]), stream) == 0
+    assert stream.getvalue() == '[]'
+
+
+def test_dump_iter_json_to_binary_stream_and_file(items, tmp_path):
+    stream = io.BytesIO()
+    dump_iter_json(items, stream)
+
+    assert json.loads(stream.getvalue()) == [asdict(o) for o in items]
+
+    file = tmp_path / 'items.json'
+    dump_iter_json(items, file, indent=2)
+
+    assert file.read_text('utf-8') == json.dumps([asdict(o) for o in items], indent=2)
+
+
+def test_dump_iter_jsonl(items, tmp_path):
+    file = tmp_path / 'items.jsonl'
+
+    assert dump_iter_jsonl(iter(items[:4]), file) == 4
+    assert dump_iter_jsonl(iter(items[4:]), str(file), mode='a') == 6
+
+    lines = file.read_text('utf-8').splitlines()
+    assert lines == [json.dumps(asdict(o)) for o in items]
+
+
+def test_dump_iter_yaml(items, monkeypatch):
+    from dataclass_wizard import stream as stream_mod
+
+    monkeypatch.setattr(stream_mod, 'YAML_BATCH_SIZE', 3)
+
+    stream = io.StringIO()
+
+    assert dump_iter_yaml((o for o in items), stream) == len(items)
+    assert stream.getvalue() == yaml.dump([asdict(o) for o in items])
+
+    stream = io.StringIO()
+    dump_iter_yaml([], stream)
+
+    assert yaml.safe_load(stream.getvalue()) == []
+
+
+def test_container_to_json_file(items, tmp_path):
+    file = tmp_path / 'items.json'
+    Container[Item](items).to_json_file(file, indent=2)
+
+    assert file.read_text() == json.dumps([asdict(o) for o in items], indent=2)
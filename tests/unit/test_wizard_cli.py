@@ -1,4 +1,5 @@
 import logging
+import sys
 from textwrap import dedent
 from unittest.mock import ANY
 
@@ -826,3 +827,115 @@ def test_input_8(capfd):
     gen_schema('test8.json')
 
     assert_py_code(expected, capfd)
+
+
+_COMPILE_MODELS = '''
+from dataclasses import dataclass, field
+from typing import Optional
+
+from dataclass_wizard import JSONWizard, EnvWizard
+
+
+@dataclass
+class Address:
+    street: str
+    zip_code: int = 0
+
+
+@dataclass
+class User(JSONWizard):
+    name: str
+    address: Address
+    others: list[Address] = field(default_factory=list)
+    nickname: Optional[str] = None
+
+
+class Settings(EnvWizard):
+    my_value: str = 'default'
+'''
+
+
+@pytest.fixture
+def compile_models(tmp_path, monkeypatch):
+    from dataclass_wizard.utils import _code_cache
+
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.setattr(_code_cache, 'PRECOMPILED', {})
+    (tmp_path / 'compile_models.py').write_text(_COMPILE_MODELS)
+
+    yield tmp_path
+
+    for name in ('compile_models', 'compiled_models'):
+        sys.modules.pop(name, None)
+
+
+def test_compile(compile_models, capfd, mocker: MockerFixture):
+    out_path = compile_models / 'compiled_models.py'
+
+    main(['compile', 'compile_models', '-o', str(out_path.with_suffix(''))])
+
+    out, err = capfd.readouterr()
+    assert not err
+    assert out.startswith('Compiled 3 dataclass(es) to:')
+    assert out_path.exists()
+    # the new module is also byte-compiled
+    assert list((compile_models / '__pycache__').glob('compiled_models.*.pyc'))
+
+    # imported for the side effect of registering the pre-compiled functions
+    import compiled_models  # noqa: F401
+    from dataclass_wizard.utils import _code_cache
+
+    assert len(_code_cache.PRECOMPILED) > 0
+
+    # re-import the models, so that we have new classes which are not yet
+    # compiled; pre-compiled functions should be used, rather than `exec`.
+    sys.modules.pop('compile_models')
+    import compile_models as models
+
+    mock_exec = mocker.patch.object(_code_cache, 'exec', create=True)
+
+    d = {'name': 'Alice', 'address': {'street': 'Main St.', 'zip_code': '123'},
+         'others': [{'street': 'Side St.'}]}
+    user = models.User.from_dict(d)
+    assert user == models.User(
+        'Alice', models.Address('Main St.', 123), [models.Address('Side St.')])
+
+    assert user.to_dict() == {
+        'name': 'Alice',
+        'address': {'street': 'Main St.', 'zip_code': 123},
+        'others': [{'street': 'Side St.', 'zip_code': 0}],
+        'nickname': None,
+    }
+
+    assert models.Settings(my_value='test').raw_dict() == {'my_value': 'test'}
+    assert models.User.from_list([d]) == [user]
+
+    mock_exec.assert_not_called()
+
+
+def test_compile_skip_errors(compile_models, capfd):
+    (compile_models / 'compile_models.py').write_text(
+        _COMPILE_MODELS + '''
+
+@dataclass
+class Bad:
+    my_field: 'NotDefined'
+''')
+
+    with pytest.raises(SystemExit) as e:
+        main(['compile', 'compile_models'])
+
+    assert 'NotDefined' in str(e.value)
+
+    main(['compile', 'compile_models', '--skip-errors'])
+
+    out, err = capfd.readouterr()
+    assert err.startswith('Skipping compile_models.Bad: NameError:')
+    assert 'register_compiled(' in out
+
+
+def test_register_compiled_with_version_mismatch(mock_log):
+    from dataclass_wizard.codegen import register_compiled
+
+    assert register_compiled('0.0.1', {'key': lambda: ()}) == 0
+    assert 'pre-compiled for dataclass-wizard 0.0.1' in mock_log.text
@@ -0,0 +1,94 @@
+import io
+import json
+from decimal import Decimal
+
+import pytest
+
+from dataclass_wizard.utils._json_stream import iter_json_array
+
+
+DATA = [{'id': i, 'name': 'é' * i, 'values': [1.5, None, True]}
+        for i in range(50)] + [123456789, 'str', [], {}]
+
+
+@pytest.mark.parametrize('indent', [None, 2])
+@pytest.mark.parametrize('chunk_size', [1, 3, 64, 4096])
+def test_iter_json_array_from_streams(indent, chunk_size):
+    s = json.dumps(DATA, indent=indent, ensure_ascii=False)
+
+    # numbers or multibyte characters can be split across chunks
+    assert list(iter_json_array(io.StringIO(s), chunk_size)) == DATA
+    assert list(iter_json_array(io.BytesIO(s.encode()), chunk_size)) == DATA
+
+
+def test_iter_json_array_from_documents():
+    s = json.dumps(DATA)
+
+    assert list(iter_json_array(s)) == DATA
+    assert list(iter_json_array(s.encode('utf-16'))) == DATA
+    assert list(iter_json_array(' [ ] ')) == []
+
+
+def test_iter_json_array_is_lazy():
+    stream = io.StringIO('[1, 2, ' + ' ' * 1000 + '3]')
+
+    it = iter_json_array(stream, 4)
+    assert next(it) == 1
+    assert stream.tell() < 20
+
+
+def test_iter_json_array_with_decoder_kwargs():
+    assert list(iter_json_array('[1.1, 2]', parse_float=Decimal)) == [
+        Decimal('1.1'), 2]
+
+
+@pytest.mark.parametrize('s', ['{}', '', '[1, 2', '[1 2]', '[1,]', '[{"a":]'])
+def test_iter_json_array_with_invalid_input(s):
+    with pytest.raises(json.JSONDecodeError):
+        list(iter_json_array(io.StringIO(s), 2))
+
+
+@pytest.mark.parametrize('s', ['[1] 2', '[1],', '[] []', '[1]\n{}'])
+def test_iter_json_array_with_extra_data(s):
+    with pytest.raises(json.JSONDecodeError, match='Extra data'):
+        list(iter_json_array(io.StringIO(s), 2))
+
+
+def test_iter_json_array_with_trailing_whitespace():
+    assert list(iter_json_array(io.StringIO('[1] \n ' + ' ' * 100), 2)) == [1]
+    assert list(iter_json_array('[ ]\n')) == []
+
+
+class _CountingStream(io.StringIO):
+    """A text stream which records the number of characters read."""
+
+    read_chars = 0
+
+    def read(self, size=-1):
+        chunk = super().read(size)
+        self.read_chars += len(chunk)
+        return chunk
+
+
+def test_iter_json_array_with_max_element_size():
+    # a malformed element is followed by (a lot of) more data
+    stream = _CountingStream('[1, {"a": 1 "b": 2}, ' + '"x", ' * 100_000 + '2]')
+
+    it = iter_json_array(stream, 64, max_element_size=1024)
+    assert next(it) == 1
+
+    with pytest.raises(json.JSONDecodeError, match='max_element_size'):
+        next(it)
+
+    # the stream isn't read (much) past the limit
+    assert stream.read_chars < 1024 + 2 * 64
+
+    large = ['x' * 5000]
+    s = json.dumps(large)
+
+    with pytest.raises(json.JSONDecodeError, match='max_element_size'):
+        list(iter_json_array(io.StringIO(s), 64, max_element_size=1024))
+
+    assert list(iter_json_array(
+        io.StringIO(s), 64, max_element_size=None)) == large
+    assert list(iter_json_array(io.StringIO(s), 64)) == large